@@ -6,10 +6,13 @@ import base64
 from collections.abc import Callable
 from collections.abc import Generator
 from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum
 from getpass import getpass
 import json
 import logging
+import threading
 import traceback
 from typing import Any
 from typing import TYPE_CHECKING
@@ -55,6 +58,7 @@ from ..types.result import as_result
 from ..types.server_url import ServerURL
 from ..types.syft_object import SYFT_OBJECT_VERSION_1
 from ..types.uid import UID
+from ..util.util import get_env
 from ..util.util import prompt_warning_message
 from ..util.util import thread_ident
 from ..util.util import verify_tls
@@ -121,6 +125,48 @@ API_PATH = "/api/v2"
 DEFAULT_SYFT_UI_PORT = 80
 DEFAULT_SYFT_UI_ADDRESS = f"http://localhost:{DEFAULT_SYFT_UI_PORT}"
 INTERNAL_PROXY_TO_RATHOLE = "http://proxy:80/rtunnel/"
+# Number of keep-alive connections an HTTPConnection keeps open per host
+HTTP_POOL_MAXSIZE = int(get_env("SYFT_HTTP_POOL_MAXSIZE", 10))
+
+# timeout of the requests made by HTTPConnections in the current thread
+_request_timeout = threading.local()
+
+
+@contextmanager
+def request_timeout(timeout: float | None) -> Iterator[None]:
+    """Time out the requests of HTTPConnections made in this thread after `timeout` seconds.
+
+    Connections are shared between threads, e.g. the cached peer clients of a server,
+    so the timeout is set for the thread instead of the connection.
+    """
+    previous = get_request_timeout()
+    _request_timeout.value = timeout
+    try:
+        yield
+    finally:
+        _request_timeout.value = previous
+
+
+def get_request_timeout() -> float | None:
+    return getattr(_request_timeout, "value", None)
+
+
+class _SizedBody:
+    """An iterable request body of a known length.
+
+    requests sends iterables it can take the length of with a Content-Length header,
+    other iterables with chunked transfer encoding.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], length: int) -> None:
+        self.chunks = chunks
+        self.length = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+    def __len__(self) -> int:
+        return self.length
 
 
 class Routes(Enum):
@@ -191,7 +237,11 @@ class HTTPConnection(ServerConnection):
         if self.session_cache is None:
             session = requests.Session()
             retry = Retry(total=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
+            adapter = HTTPAdapter(
+                max_retries=retry,
+                pool_connections=HTTP_POOL_MAXSIZE,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+            )
             session.mount("http://", adapter)
             session.mount("https://", adapter)
             self.session_cache = session
@@ -217,6 +267,7 @@ class HTTPConnection(ServerConnection):
             headers=self.headers,
             verify=verify_tls(),
             proxies={},
+            timeout=get_request_timeout(),
             params=params,
             stream=stream,
         )
@@ -246,6 +297,7 @@ class HTTPConnection(ServerConnection):
             headers=self.headers,
             verify=verify_tls(),
             proxies={},
+            timeout=get_request_timeout(),
             stream=stream,
         )
         if response.status_code != 200:
@@ -262,9 +314,21 @@ class HTTPConnection(ServerConnection):
         return response.content
 
     def _make_put(
-        self, path: str, data: bytes | Generator, stream: bool = False
+        self,
+        path: str,
+        data: bytes | Generator,
+        stream: bool = False,
+        content_length: int | None = None,
     ) -> Response:
+        """PUT `data` to `path`.
+
+        A generator `data` is sent with chunked transfer encoding, unless its
+        `content_length` is given.
+        """
         url = self.url
+        body: bytes | Generator | _SizedBody = data
+        if content_length and not isinstance(data, bytes):
+            body = _SizedBody(data, content_length)
 
         if self.rtunnel_token:
             url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
@@ -276,7 +340,8 @@ class HTTPConnection(ServerConnection):
             str(url),
             verify=verify_tls(),
             proxies={},
-            data=data,
+            timeout=get_request_timeout(),
+            data=body,
             headers=self.headers,
             stream=stream,
         )
@@ -308,6 +373,7 @@ class HTTPConnection(ServerConnection):
             str(url),
             headers=self.headers,
             verify=verify_tls(),
+            timeout=get_request_timeout(),
             json=json,
             proxies={},
             data=data,
@@ -460,10 +526,12 @@ class HTTPConnection(ServerConnection):
         else:
             api_url = self.api_url
 
-        response = requests.post(  # nosec
-            url=api_url,
+        # reuse the pooled keep-alive connections of the session
+        response = self.session.post(  # nosec
+            url=str(api_url),
             data=msg_bytes,
             headers=self.headers,
+            timeout=get_request_timeout(),
         )
 
         if response.status_code != 200:
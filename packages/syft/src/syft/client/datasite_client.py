@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 # stdlib
+from datetime import datetime
 import json
 import logging
 from pathlib import Path
@@ -95,6 +96,9 @@ def add_default_uploader(
 
 @serializable(canonical_name="DatasiteClient", version=1)
 class DatasiteClient(SyftClient):
+    _sync_state: SyncState | None = None
+    _sync_cursor: datetime | None = None
+
     def __repr__(self) -> str:
         return f"<DatasiteClient: {self.name}>"
 
@@ -188,12 +192,32 @@ class DatasiteClient(SyftClient):
             self._api.refresh_api_callback()
 
     def get_sync_state(self) -> SyncState:
-        state: SyncState = self.api.services.sync._get_state()
-        for uid, obj in state.objects.items():
+        # Only the objects changed since the previous call are fetched,
+        # and merged into the state cached on the client
+        previous_state = self._sync_state
+        since = self._sync_cursor if previous_state is not None else None
+        action_ids = (
+            [
+                uid
+                for uid, obj in previous_state.objects.items()
+                if isinstance(obj, ActionObject)
+            ]
+            if previous_state is not None
+            else None
+        )
+        changes, deleted_ids, cursor = self.api.services.sync._get_state_changes(
+            since=since, action_ids=action_ids
+        )
+        for uid, obj in changes.objects.items():
             if isinstance(obj, ActionObject):
                 obj = obj.refresh_object(resolve_nested=False)
-                state.objects[uid] = obj
-        return state
+                changes.objects[uid] = obj
+
+        if previous_state is not None:
+            changes = previous_state.apply_changes(changes, deleted_ids)
+        self._sync_state = changes
+        self._sync_cursor = cursor
+        return changes.filter_dependencies()
 
     def apply_state(self, resolved_state: ResolvedSyncState) -> SyftSuccess:
         if len(resolved_state.delete_objs):
@@ -1,21 +1,25 @@
 # stdlib
 from collections import defaultdict
+from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import MutableMapping
 from collections.abc import MutableSequence
 from functools import cache
+from functools import lru_cache
 import hashlib
 import json
 from operator import itemgetter
 import os
 from pathlib import Path
 import re
+import threading
 from types import UnionType
 import typing
 from typing import Any
 import warnings
 
 # third party
+from cachetools import LRUCache
 from packaging.version import parse
 
 # syft absolute
@@ -29,9 +33,13 @@ from ..service.response import SyftSuccess
 from ..types.dicttuple import DictTuple
 from ..types.errors import SyftException
 from ..types.syft_object import SyftBaseObject
+from ..types.syft_object import SyftMigrationRegistry
 from ..types.syft_object_registry import SyftObjectRegistry
 
 PROTOCOL_STATE_FILENAME = "protocol_version.json"
+# number of protocol states and migration chains kept for older clients
+PROTOCOL_STATE_CACHE_SIZE = 32
+MIGRATION_CHAIN_CACHE_SIZE = 1024
 PROTOCOL_TYPE = str | int
 
 IGNORE_TYPES = [
@@ -110,6 +118,9 @@ class DataProtocol:
         self.state = self.build_state()
         self.diff, self.current = self.diff_state(self.state)
         self.protocol_support = self.calculate_supported_protocols()
+        # states built from the previous history are stale
+        self._state_cache: LRUCache = LRUCache(maxsize=PROTOCOL_STATE_CACHE_SIZE)
+        self._state_cache_lock = threading.Lock()
 
     @staticmethod
     def _calculate_object_hash(klass: type[SyftBaseObject]) -> str:
@@ -213,6 +224,17 @@ class DataProtocol:
                 return state_dict
         return state_dict
 
+    def get_state(self, protocol: PROTOCOL_TYPE) -> dict:
+        """Cached `build_state` up to `protocol`, the returned state must not be modified."""
+        key = str(protocol)
+        with self._state_cache_lock:
+            state = self._state_cache.get(key)
+        if state is None:
+            state = self.build_state(stop_key=key)
+            with self._state_cache_lock:
+                self._state_cache[key] = state
+        return state
+
     @staticmethod
     def obj_json(version: str | int, _hash: str, action: str = "add") -> dict:
         return {
@@ -549,6 +571,38 @@ def check_or_stage_protocol() -> SyftSuccess:
     return data_protocol.check_or_stage_protocol()
 
 
+@lru_cache(maxsize=MIGRATION_CHAIN_CACHE_SIZE)
+def get_migration_chain(
+    canonical_name: str, version_from: int, version_to: int
+) -> Callable[[SyftBaseObject], SyftBaseObject]:
+    """Compose the migrations of `canonical_name` from `version_from` to `version_to`.
+
+    The migration of each step is looked up once, instead of for every migrated object.
+    """
+    if version_from > version_to:  # downgrade
+        versions = range(version_from - 1, version_to - 1, -1)
+    else:  # upgrade
+        versions = range(version_from + 1, version_to + 1)
+
+    steps = []
+    current_version = version_from
+    for version in versions:
+        klass = SyftObjectRegistry.get_serde_class(canonical_name, current_version)
+        steps.append(
+            SyftMigrationRegistry.get_migration_for_version(
+                type_from=klass, version_to=version
+            )
+        )
+        current_version = version
+
+    def migrate(obj: SyftBaseObject) -> SyftBaseObject:
+        for step in steps:
+            obj = step(obj, None)
+        return obj
+
+    return migrate
+
+
 def debox_arg_and_migrate(arg: Any, protocol_state: dict) -> Any:
     """Debox the argument based on whether it is iterable or single entity."""
     constructor = None
@@ -580,12 +634,11 @@ def debox_arg_and_migrate(arg: Any, protocol_state: dict) -> Any:
         if isinstance(_object, SyftBaseObject):
             current_version = int(_object.__version__)
             migrate_to_version = int(max(protocol_state[_object.__canonical_name__]))
-            if current_version > migrate_to_version:  # downgrade
-                versions = range(current_version - 1, migrate_to_version - 1, -1)
-            else:  # upgrade
-                versions = range(current_version + 1, migrate_to_version + 1)
-            for version in versions:
-                _object = _object.migrate_to(version)
+            if current_version != migrate_to_version:
+                migrate = get_migration_chain(
+                    _object.__canonical_name__, current_version, migrate_to_version
+                )
+                _object = migrate(_object)
         arg[key] = _object
 
     wrapped_arg = arg[0] if single_entity else arg
@@ -619,7 +672,7 @@ def migrate_args_and_kwargs(
     if to_protocol == data_protocol.latest_version:
         return args, kwargs
 
-    protocol_state = data_protocol.build_state(stop_key=str(to_protocol))
+    protocol_state = data_protocol.get_state(to_protocol)
 
     migrated_kwargs, migrated_args = {}, []
 
@@ -1,4 +1,8 @@
 # stdlib
+from collections.abc import Callable
+import json
+import struct
+from typing import Any
 from typing import cast
 
 # third party
@@ -11,8 +15,135 @@ from ..util.experimental_flags import flags
 from .deserialize import _deserialize
 from .serialize import _serialize
 
+# prefixes numpy arrays serialized behind a header, it can not be the segment
+# count that starts a capnp message
+ARROW_TENSOR_MAGIC = b"\xffSYARROW"
+_HEADER_LENGTH = struct.Struct("<I")
+# keeps the payload 8 byte aligned, as Arrow expects
+_HEADER_ALIGNMENT = 8
+
+
+def _serialize_with_header(
+    header: dict[str, Any],
+    payload_size: int,
+    write_payload: Callable[[pa.NativeFile], Any],
+) -> bytes:
+    """Write `header` and the payload into a single buffer.
+
+    The payload is compressed with the configured codec, the codec and the
+    uncompressed `payload_size` are added to the header.
+    """
+    compression = flags.APACHE_ARROW_COMPRESSION
+    codec = None
+    if compression is not ApacheArrowCompression.NONE:
+        codec = compression.value
+        payload_sink = pa.BufferOutputStream()
+        write_payload(payload_sink)
+        compressed = pa.compress(payload_sink.getvalue(), codec=codec)
+        del payload_sink
+
+        def write_payload(sink: pa.NativeFile) -> Any:
+            return sink.write(compressed)
+
+    header_bytes = json.dumps({**header, "codec": codec, "size": payload_size}).encode()
+    prefix_size = len(ARROW_TENSOR_MAGIC) + _HEADER_LENGTH.size
+    header_bytes += b" " * (-(prefix_size + len(header_bytes)) % _HEADER_ALIGNMENT)
+
+    sink = pa.BufferOutputStream()
+    sink.write(ARROW_TENSOR_MAGIC)
+    sink.write(_HEADER_LENGTH.pack(len(header_bytes)))
+    sink.write(header_bytes)
+    write_payload(sink)
+    return sink.getvalue().to_pybytes()
+
+
+def _deserialize_with_header(
+    buf: bytes | bytearray,
+) -> tuple[dict[str, Any], pa.Buffer, bool]:
+    """Inverse of `_serialize_with_header`.
+
+    Returns the header, the uncompressed payload, and whether the payload can be
+    used as the memory of a writeable array without copying it.
+    """
+    header_start = len(ARROW_TENSOR_MAGIC) + _HEADER_LENGTH.size
+    (header_length,) = _HEADER_LENGTH.unpack_from(buf, len(ARROW_TENSOR_MAGIC))
+    header = json.loads(bytes(buf[header_start : header_start + header_length]))  # noqa
+
+    data = pa.py_buffer(buf)
+    # slices of a buffer are never marked as mutable
+    is_mutable = data.is_mutable
+    payload = data.slice(header_start + header_length)
+    if header["codec"] is not None:
+        payload = pa.decompress(
+            payload, decompressed_size=header["size"], codec=header["codec"]
+        )
+        is_mutable = payload.is_mutable
+    return header, payload, is_mutable
+
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
+    """Serialize a numpy array as an Arrow IPC tensor behind a small header.
+
+    The tensor is written into the same buffer as the header instead of being
+    wrapped in capnp messages, so its data is copied once to produce the bytes.
+    Only used with `flags.NUMPY_ARROW_IPC_SERDE`, older versions can not read it.
+    """
+    tensor = pa.Tensor.from_numpy(obj=obj)
+    return _serialize_with_header(
+        {"dtype": obj.dtype.name},
+        pa.ipc.get_tensor_size(tensor),
+        lambda sink: pa.ipc.write_tensor(tensor, sink),
+    )
+
+
+def arrow_deserialize(buf: bytes | bytearray) -> np.ndarray:
+    """Inverse of `arrow_serialize` and `string_array_serialize`.
+
+    Uncompressed arrays in a mutable buffer, e.g. blobs combined from several
+    capnp chunks, are returned as a view of `buf` without copying.
+    """
+    header, payload, is_mutable = _deserialize_with_header(buf)
+    if header.get("kind") == "unicode":
+        return string_array_deserialize(header, payload, is_mutable)
+
+    np_array = pa.ipc.read_tensor(payload).to_numpy()
+    if is_mutable:
+        np_array.setflags(write=True)
+    else:
+        np_array = np_array.copy()
+    return np_array.astype(np.dtype(header["dtype"]), copy=False)
+
+
+def string_array_serialize(obj: np.ndarray) -> bytes:
+    """Serialize a numpy string array as its fixed-width UCS4 buffer.
+
+    The buffer is written as is, without encoding each element. The padding of
+    shorter strings compresses away with the configured codec. Only used with
+    `flags.NUMPY_ARROW_IPC_SERDE`, older versions can not read it.
+    """
+    contiguous = np.ascontiguousarray(obj)
+    return _serialize_with_header(
+        {"kind": "unicode", "dtype": obj.dtype.str, "shape": list(obj.shape)},
+        contiguous.nbytes,
+        lambda sink: sink.write(pa.py_buffer(contiguous.view(np.uint8))),
+    )
+
+
+def string_array_deserialize(
+    header: dict[str, Any], payload: pa.Buffer, is_mutable: bool
+) -> np.ndarray:
+    np_array = np.frombuffer(payload, dtype=np.uint8)
+    if not is_mutable:
+        np_array = np_array.copy()
+    return np_array.view(np.dtype(header["dtype"])).reshape(header["shape"])
+
+
+def legacy_arrow_serialize(obj: np.ndarray) -> bytes:
+    """Serialize a numpy array as a (tensor, size, dtype) tuple.
+
+    The format read by all protocol versions, see `flags.NUMPY_ARROW_IPC_SERDE`.
+    """
+
     # inner function to make sure variables go out of scope after this
     def inner(obj: np.ndarray) -> tuple:
         original_dtype = obj.dtype
@@ -33,9 +164,10 @@ def arrow_serialize(obj: np.ndarray) -> bytes:
     return cast(bytes, _serialize(m, to_bytes=True))
 
 
-def arrow_deserialize(
+def legacy_arrow_deserialize(
     numpy_bytes: bytes, decompressed_size: int, dtype: str
 ) -> np.ndarray:
+    """Inverse of `legacy_arrow_serialize`."""
     original_dtype = np.dtype(dtype)
     if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
         reader = pa.BufferReader(numpy_bytes)
@@ -68,41 +200,42 @@ def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     index_length = int(string_index[-1])
     index_array = string_index[-(index_length + 1) : -1]  # noqa
     string_array: np.ndarray = string_index[: -(index_length + 1)]
-    output_bytes: bytes = string_array.astype(np.uint8).tobytes()
-    output_list = []
-    last_offset = 0
-    for offset in index_array:
-        chars = output_bytes[last_offset:offset]
-        final_string = chars.decode("utf-8")
-        last_offset = offset
-        output_list.append(final_string)
-    return np.array(output_list).reshape(shape)
+    # the end offsets are the large_string offsets without the leading zero
+    offsets = np.concatenate([[0], index_array]).astype(np.int64)
+    strings = pa.LargeStringArray.from_buffers(
+        len(index_array),
+        pa.py_buffer(offsets),
+        pa.py_buffer(string_array.astype(np.uint8)),
+    )
+    return strings.to_numpy(zero_copy_only=False).astype(str).reshape(shape)
 
 
 def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
     """Encodes string Numpyarray  to utf-8 encoded numpy array.
 
+    Used unless `flags.NUMPY_ARROW_IPC_SERDE` is set, then it is superseded by
+    `string_array_serialize`, which writes the fixed-width buffer as is.
+
     Args:
         string_list (np.ndarray): NumpyArray to be encoded
 
     Returns:
         bytes: serialized utf-8 encoded int Numpy array
     """
-    array_shape = np.array(string_list).shape
-    string_list = np.array(string_list).flatten()
-    bytes_list = []
-    indexes = []
-    offset = 0
-
-    for item in string_list:
-        name_bytes = item.encode("utf-8")
-        offset += len(name_bytes)
-        indexes.append(offset)
-        bytes_list.append(name_bytes)
-
-    np_bytes = np.frombuffer(b"".join(bytes_list), dtype=np.uint8)
-    np_bytes = np_bytes.astype(np.uint64)
-    np_indexes = np.array(indexes, dtype=np.uint64)
+    array = np.asarray(string_list)
+    array_shape = array.shape
+    # arrow truncates numpy strings at embedded NULs, python strings are kept whole
+    strings = pa.array(array.reshape(-1).astype(object), type=pa.large_string())
+    _, offsets_buffer, data_buffer = strings.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[: len(strings) + 1]
+    data = (
+        np.frombuffer(data_buffer, dtype=np.uint8)[: offsets[-1]]
+        if data_buffer is not None
+        else np.empty(0, dtype=np.uint8)
+    )
+
+    np_bytes = data.astype(np.uint64)
+    np_indexes = offsets[1:].astype(np.uint64)
     index_length = np.array([len(np_indexes)], dtype=np.uint64)
     shape = np.array(array_shape, dtype=np.uint64)
     shape_length = np.array([len(shape)], dtype=np.uint64)
@@ -114,16 +247,19 @@ def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
 
 
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
+    is_string = obj.dtype.type == np.str_
+    if flags.NUMPY_ARROW_IPC_SERDE:
+        return string_array_serialize(obj) if is_string else arrow_serialize(obj)
     else:
-        return arraytonumpyutf8(obj)
+        return arraytonumpyutf8(obj) if is_string else legacy_arrow_serialize(obj)
 
 
-def numpy_deserialize(buf: bytes) -> np.ndarray:
+def numpy_deserialize(buf: bytes | bytearray) -> np.ndarray:
+    if buf[: len(ARROW_TENSOR_MAGIC)] == ARROW_TENSOR_MAGIC:
+        return arrow_deserialize(buf)
     deser = _deserialize(buf, from_bytes=True)
     if isinstance(deser, tuple):
-        return arrow_deserialize(*deser)
+        return legacy_arrow_deserialize(*deser)
     elif isinstance(deser, np.ndarray):
         return numpyutf8toarray(deser)
     else:
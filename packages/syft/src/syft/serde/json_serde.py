@@ -3,6 +3,7 @@ import base64
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 import json
 import typing
 from typing import Any
@@ -58,6 +59,19 @@ class JSONSerde(Generic[T]):
 JSON_SERDE_REGISTRY: dict[type[T], JSONSerde[T]] = {}
 
 
+@dataclass
+class JSONSerializationPlan:
+    """Field serializers of a pydantic model, compiled from its annotations."""
+
+    fields: list[tuple[str, Callable[[Any], Json]]]
+    # searchable and unique attributes that are not fields, like @property
+    extra_attrs: list[tuple[str, Callable[[Any], Json]]]
+
+
+JSON_SERIALIZATION_PLANS: dict[tuple[type, str, int], JSONSerializationPlan] = {}
+JSON_DESERIALIZATION_PLANS: dict[type, list[tuple[str, Callable[[Json], Any]]]] = {}
+
+
 def register_json_serde(
     type_: type[T],
     serialize: Callable[[T], Json] | None = None,
@@ -77,6 +91,9 @@ def register_json_serde(
         serialize_fn=serialize,
         deserialize_fn=deserialize,
     )
+    # compiled plans might have resolved this type to a different serde
+    JSON_SERIALIZATION_PLANS.clear()
+    JSON_DESERIALIZATION_PLANS.clear()
 
 
 # Standard JSON primitives
@@ -158,24 +175,142 @@ def _annotation_issubclass(annotation: Any, cls: type) -> bool:
         return False
 
 
+def _serialize_enum(value: Enum) -> Json:
+    return value.name
+
+
+def _deserialize_enum(enum_type: type[Enum], value: Json) -> Enum:
+    return enum_type[value]  # type: ignore
+
+
+def _compile_serializer(annotation: Any) -> Callable[[Any], Json]:
+    """Resolve the serialization method of `serialize_json` for an annotation once,
+    and return it as a function of the value only. Results are not validated.
+    """
+    if annotation is None:
+        # annotation is resolved from the value type, this cannot be compiled
+        return partial(serialize_json, validate=False)
+
+    annotation = _unwrap_type_annotation(annotation)
+
+    serialize_fn: Callable[[Any], Json]
+    if annotation in JSON_SERDE_REGISTRY:
+        serialize_fn = JSON_SERDE_REGISTRY[annotation].serialize_fn
+    elif _annotation_issubclass(annotation, pydantic.BaseModel):
+        serialize_fn = _serialize_pydantic_to_json
+    elif _annotation_issubclass(annotation, Enum):
+        serialize_fn = _serialize_enum
+    elif _is_serializable_iterable(annotation):
+        serialize_fn = partial(_serialize_iterable_to_json, annotation=annotation)
+    elif _is_serializable_mapping(annotation):
+        serialize_fn = partial(_serialize_mapping_to_json, annotation=annotation)
+    else:
+        serialize_fn = _serialize_to_json_bytes
+
+    def serialize(value: Any) -> Json:
+        if value is None:
+            return None
+        return serialize_fn(value)
+
+    return serialize
+
+
+def _compile_deserializer(annotation: Any) -> Callable[[Json], Any]:
+    """Resolve the deserialization method of `deserialize_json` for an annotation once,
+    and return it as a function of the value only.
+    """
+    unwrapped = _unwrap_type_annotation(annotation)
+
+    deserialize_fn: Callable[[Json], Any]
+    if unwrapped in JSON_SERDE_REGISTRY:
+        deserialize_fn = JSON_SERDE_REGISTRY[unwrapped].deserialize_fn
+    elif _annotation_issubclass(unwrapped, pydantic.BaseModel):
+        deserialize_fn = _deserialize_pydantic_from_json  # type: ignore
+    elif _annotation_issubclass(unwrapped, Enum):
+        deserialize_fn = partial(_deserialize_enum, unwrapped)
+    else:
+        # iterables, mappings and bytes depend on the value type
+        return partial(deserialize_json, annotation=annotation)
+
+    def deserialize(value: Json) -> Any:
+        if (
+            isinstance(value, dict)
+            and JSON_CANONICAL_NAME_FIELD in value
+            and JSON_VERSION_FIELD in value
+        ):
+            return _deserialize_pydantic_from_json(value)
+        if value is None:
+            return None
+        return deserialize_fn(value)
+
+    return deserialize
+
+
+def _get_serialization_plan(
+    klass: type[pydantic.BaseModel], canonical_name: str, version: int
+) -> JSONSerializationPlan:
+    plan = JSON_SERIALIZATION_PLANS.get((klass, canonical_name, version))
+    if plan is not None:
+        return plan
+
+    serde_attributes = SyftObjectRegistry.get_serde_properties(canonical_name, version)
+    exclude_attrs = set(serde_attributes[4]) | DEFAULT_EXCLUDE_ATTRS
+
+    fields = [
+        (key, _compile_serializer(field.annotation))
+        for key, field in klass.model_fields.items()
+        if key not in exclude_attrs
+    ]
+
+    # Add searchable attrs and unique attrs that are not fields, like @property
+    reserved_names = {key for key, _ in fields}
+    reserved_names |= {JSON_CANONICAL_NAME_FIELD, JSON_VERSION_FIELD}
+    attrs_to_add = set(getattr(klass, "__attr_searchable__", [])) | set(
+        getattr(klass, "__attr_unique__", [])
+    )
+    extra_attrs = [
+        (attr, _compile_serializer(get_property_return_type(klass, attr)))
+        for attr in attrs_to_add
+        if attr not in reserved_names
+    ]
+
+    plan = JSONSerializationPlan(fields=fields, extra_attrs=extra_attrs)
+    JSON_SERIALIZATION_PLANS[(klass, canonical_name, version)] = plan
+    return plan
+
+
+def _get_deserialization_plan(
+    klass: type[pydantic.BaseModel],
+) -> list[tuple[str, Callable[[Json], Any]]]:
+    plan = JSON_DESERIALIZATION_PLANS.get(klass)
+    if plan is None:
+        plan = [
+            (key, _compile_deserializer(field.annotation))
+            for key, field in klass.model_fields.items()
+        ]
+        JSON_DESERIALIZATION_PLANS[klass] = plan
+    return plan
+
+
 def _serialize_pydantic_to_json(obj: pydantic.BaseModel) -> dict[str, Json]:
     canonical_name, version = SyftObjectRegistry.get_canonical_name_version(obj)
-    serde_attributes = SyftObjectRegistry.get_serde_properties(canonical_name, version)
-    exclude_attrs = serde_attributes[4]
+    plan = _get_serialization_plan(type(obj), canonical_name, version)
 
     result: dict[str, Json] = {
         JSON_CANONICAL_NAME_FIELD: canonical_name,
         JSON_VERSION_FIELD: version,
     }
 
-    all_exclude_attrs = set(exclude_attrs) | DEFAULT_EXCLUDE_ATTRS
+    for key, serialize in plan.fields:
+        result[key] = serialize(getattr(obj, key))
 
-    for key, type_ in obj.model_fields.items():
-        if key in all_exclude_attrs:
+    # attributes that cannot be accessed are skipped
+    for attr, serialize in plan.extra_attrs:
+        try:
+            value = getattr(obj, attr)
+        except Exception:
             continue
-        result[key] = serialize_json(getattr(obj, key), type_.annotation)
-
-    result = _add_searchable_and_unique_attrs(obj, result, raise_errors=False)
+        result[attr] = serialize(value)
 
     return result
 
@@ -184,7 +319,7 @@ def get_property_return_type(obj: Any, attr_name: str) -> Any:
     """
     Get the return type annotation of a @property.
     """
-    cls = type(obj)
+    cls = obj if isinstance(obj, type) else type(obj)
     attr = getattr(cls, attr_name, None)
 
     if isinstance(attr, property):
@@ -193,46 +328,6 @@ def get_property_return_type(obj: Any, attr_name: str) -> Any:
     return None
 
 
-def _add_searchable_and_unique_attrs(
-    obj: pydantic.BaseModel, obj_dict: dict[str, Json], raise_errors: bool = True
-) -> dict[str, Json]:
-    """
-    Add searchable attrs and unique attrs to the serialized object dict, if they are not already present.
-    Needed for adding non-field attributes (like @property)
-
-    Args:
-        obj (pydantic.BaseModel): Object to serialize.
-        obj_dict (dict[str, Json]): Serialized object dict. Should contain the object's fields.
-        raise_errors (bool, optional): Raise errors if an attribute cannot be accessed.
-            If False, the attribute will be skipped. Defaults to True.
-
-    Raises:
-        Exception: Any exception raised when accessing an attribute.
-
-    Returns:
-        dict[str, Json]: Serialized object dict including searchable attributes.
-    """
-    searchable_attrs: list[str] = getattr(obj, "__attr_searchable__", [])
-    unique_attrs: list[str] = getattr(obj, "__attr_unique__", [])
-
-    attrs_to_add = set(searchable_attrs) | set(unique_attrs)
-    for attr in attrs_to_add:
-        if attr not in obj_dict:
-            try:
-                value = getattr(obj, attr)
-            except Exception as e:
-                if raise_errors:
-                    raise e
-                else:
-                    continue
-            property_annotation = get_property_return_type(obj, attr)
-            obj_dict[attr] = serialize_json(
-                value, validate=False, annotation=property_annotation
-            )
-
-    return obj_dict
-
-
 def _deserialize_pydantic_from_json(
     obj_dict: dict[str, Json],
 ) -> pydantic.BaseModel:
@@ -242,10 +337,10 @@ def _deserialize_pydantic_from_json(
         obj_type = SyftObjectRegistry.get_serde_class(canonical_name, version)
 
         result = {}
-        for key, type_ in obj_type.model_fields.items():
+        for key, deserialize in _get_deserialization_plan(obj_type):
             if key not in obj_dict:
                 continue
-            result[key] = deserialize_json(obj_dict[key], type_.annotation)
+            result[key] = deserialize(obj_dict[key])
 
         return obj_type.model_validate(result)
     except Exception as e:
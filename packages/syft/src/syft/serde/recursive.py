@@ -25,6 +25,7 @@ SYFT_CLASSES_MISSING_CANONICAL_NAME = []
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 
 SPOOLED_FILE_MAX_SIZE_SERDE = 50 * (1024**2)  # 50MB
+CAPNP_MAX_CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
 DEFAULT_EXCLUDE_ATTRS: set[str] = {"syft_pre_hooks__", "syft_post_hooks__"}
 
 
@@ -163,7 +164,7 @@ def recursive_serde_register(
     _serialize = serialize if nonrecursive else rs_object2proto
     _deserialize = deserialize if nonrecursive else rs_proto2object
     is_pydantic = issubclass(cls, BaseModel)
-    hash_exclude_attrs = getattr(cls, "__hash_exclude_attrs__", [])
+    hash_exclude_attrs = frozenset(getattr(cls, "__hash_exclude_attrs__", ()))
 
     if inherit_attrs and not is_pydantic:
         # get attrs from base class
@@ -235,38 +236,48 @@ def chunk_bytes(
 ) -> None:
     data = ser_func(field_obj)
     size_of_data = len(data)
-    if compatible_with_large_file_writes_capnp(size_of_data):
+    list_size = size_of_data // CAPNP_MAX_CHUNK_SIZE + 1
+    data_lst = builder.init(field_name, list_size)
+
+    if list_size == 1:
+        # fits in a single chunk, no need to split
+        data_lst[0] = data
+    elif compatible_with_large_file_writes_capnp(size_of_data):
         with tempfile.TemporaryFile() as tmp_file:
-            # Write data to a file to save RAM
+            # Write data to a file, so it can be released before the
+            # chunks are copied into the message
             tmp_file.write(data)
             tmp_file.seek(0)
             del data
 
-            CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
-            list_size = size_of_data // CHUNK_SIZE + 1
-            data_lst = builder.init(field_name, list_size)
             for idx in range(list_size):
-                bytes_to_read = min(CHUNK_SIZE, size_of_data)
-                data_lst[idx] = tmp_file.read(bytes_to_read)
-                size_of_data -= CHUNK_SIZE
+                data_lst[idx] = tmp_file.read(CAPNP_MAX_CHUNK_SIZE)
     else:
-        CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
-        list_size = len(data) // CHUNK_SIZE + 1
-        data_lst = builder.init(field_name, list_size)
-        END_INDEX = CHUNK_SIZE
         for idx in range(list_size):
-            START_INDEX = idx * CHUNK_SIZE
-            END_INDEX = min(START_INDEX + CHUNK_SIZE, len(data))
-            data_lst[idx] = data[START_INDEX:END_INDEX]
+            start = idx * CAPNP_MAX_CHUNK_SIZE
+            data_lst[idx] = data[start : start + CAPNP_MAX_CHUNK_SIZE]
+
 
+def combine_bytes(capnp_list: list[bytes]) -> bytes | bytearray:
+    """Inverse of `chunk_bytes`.
+
+    A single chunk is returned as is. Multiple chunks are copied one by one into a
+    preallocated buffer, so every byte is copied once and only one chunk is held in
+    memory next to the result.
+    """
+    n_chunks = len(capnp_list)
+    if n_chunks == 0:
+        return b""
+    if n_chunks == 1:
+        return capnp_list[0]
 
-def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    buffer = bytearray(sum(len(chunk) for chunk in capnp_list))
+    with memoryview(buffer) as view:
+        start = 0
+        for chunk in capnp_list:
+            view[start : start + len(chunk)] = chunk
+            start += len(chunk)
+    return buffer
 
 
 def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
@@ -315,8 +326,9 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
     if attribute_list is None:
         attribute_list = self.__dict__.keys()
 
+    # classes registered directly with SyftObjectRegistry.register_cls may pass a list
     hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
+        frozenset(hash_exclude_attrs).union(DYNAMIC_SYFT_ATTRIBUTES)
         if for_hashing
         else set()
     )
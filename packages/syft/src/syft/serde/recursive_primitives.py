@@ -237,7 +237,8 @@ recursive_serde_register(
 recursive_serde_register(
     bytes,
     serialize=lambda x: x,
-    deserialize=lambda x: x,
+    # large blobs are combined into a bytearray
+    deserialize=bytes,
     canonical_name="bytes",
     version=1,
 )
@@ -1,9 +1,16 @@
 # stdlib
+import asyncio
 import base64
 import binascii
 from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterator
+from functools import partial
 import logging
 from typing import Annotated
+from typing import Any
+from typing import TypeVar
 
 # third party
 from fastapi import APIRouter
@@ -38,6 +45,65 @@ from .worker import Worker
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# number of request body chunks buffered while streaming an upload to a peer,
+# reading from the client pauses while the peer is slower
+STREAM_UPLOAD_QUEUE_SIZE = 16
+
+
+async def forward_request_body(
+    body: AsyncIterator[bytes],
+    send: Callable[[Iterator[bytes]], T],
+    queue_size: int = STREAM_UPLOAD_QUEUE_SIZE,
+) -> T:
+    """Call the blocking `send` in a worker thread with an iterator over `body`.
+
+    The body is never held in memory, at most `queue_size` chunks are buffered.
+    If reading `body` fails, the iterator raises so `send` does not complete with
+    a truncated body.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+        maxsize=queue_size
+    )
+
+    def iter_chunks() -> Iterator[bytes]:
+        while True:
+            item = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    sending = loop.run_in_executor(None, send, iter_chunks())
+
+    async def put(item: bytes | None) -> bool:
+        put_task = asyncio.ensure_future(queue.put(item))
+        waiting: set[asyncio.Future[Any]] = {put_task, sending}
+        await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+        if put_task.done():
+            return True
+        # `send` finished without reading the whole body
+        put_task.cancel()
+        return False
+
+    try:
+        async for chunk in body:
+            if chunk and not await put(chunk):
+                return await sending
+        await put(None)
+    except BaseException as e:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(e)
+        # the sender fails with `e`, which is raised here
+        sending.add_done_callback(lambda f: f.exception())
+        raise
+
+    return await sending
+
 
 def make_routes(worker: Worker) -> APIRouter:
     router = APIRouter()
@@ -85,8 +151,6 @@ def make_routes(worker: Worker) -> APIRouter:
         except binascii.Error:
             raise HTTPException(404, "Invalid `url_path`.")
 
-        data = await request.body()
-
         peer_uid_parsed = UID.from_string(peer_uid)
 
         try:
@@ -94,7 +158,22 @@ def make_routes(worker: Worker) -> APIRouter:
             url = peer_connection.to_blob_route(url_path_parsed)
 
             print("Url on stream", url.path)
-            response = peer_connection._make_put(url.path, data=data, stream=True)
+            content_length = int(request.headers.get("content-length", 0))
+            if content_length > 0:
+                # forwarded with the same Content-Length, not chunked
+                response = await forward_request_body(
+                    read_request_body_in_chunks(request),
+                    partial(
+                        peer_connection._make_put,
+                        url.path,
+                        stream=True,
+                        content_length=content_length,
+                    ),
+                )
+            else:
+                # chunked uploads are buffered, the peer may not accept chunked bodies
+                data = await request.body()
+                response = peer_connection._make_put(url.path, data=data, stream=True)
         except requests.RequestException:
             raise HTTPException(404, "Failed to upload data to datasite")
 
@@ -136,9 +215,7 @@ def make_routes(worker: Worker) -> APIRouter:
         user_verify_key: SyftVerifyKey, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         return Response(
-            serialize(
-                worker.get_api(user_verify_key, communication_protocol), to_bytes=True
-            ),
+            worker.get_serialized_api(user_verify_key, communication_protocol),
             media_type="application/octet-stream",
         )
 
@@ -37,6 +37,7 @@ from ..client.client import SyftClient
 from ..deployment_type import DeploymentType
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..serde.serialize import _serialize as serialize
 from ..service.action.action_object import Action
 from ..service.action.action_object import ActionObject
 from ..service.code.user_code_stash import UserCodeStash
@@ -55,6 +56,7 @@ from ..service.output.output_service import OutputStash
 from ..service.queue.base_queue import AbstractMessageHandler
 from ..service.queue.base_queue import QueueConsumer
 from ..service.queue.base_queue import QueueProducer
+from ..service.queue.base_queue import notify_local_producers
 from ..service.queue.queue import APICallMessageHandler
 from ..service.queue.queue import ConsumerType
 from ..service.queue.queue import QueueManager
@@ -246,8 +248,6 @@ class Server(AbstractServer):
         self.server_type = ServerType(server_type)
         self.server_side_type = ServerSideType(server_side_type)
         self.client_cache: dict = {}
-        self.peer_client_cache: dict = {}
-        self._settings = None
 
         if isinstance(server_type, str):
             server_type = ServerType(server_type)
@@ -899,25 +899,27 @@ class Server(AbstractServer):
 
     # NOTE: Some workflows currently expect the settings to be available,
     # even though they might not be defined yet. Because of this, we need to check
-    # if the settings table is already defined. This function is basically a copy
-    # of the settings property but ignoring stash error in case settings doesn't exist yet.
+    # if the settings table is already defined. This function is the settings property
+    # but ignoring stash error in case settings doesn't exist yet.
     # it should be removed once the settings are refactored and the inconsistencies between
     # settings and services are resolved.
+    # Settings are cached in self.db.settings_cache, the SettingsStash invalidates it.
     def get_settings(self) -> ServerSettings | None:
-        if self._settings:
-            return self._settings  # type: ignore
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
+        return self.db.settings_cache.get_or_compute(
+            self.id, partial(self._get_settings, self.signing_key.verify_key)
+        )
 
+    def _get_settings(self, credentials: SyftVerifyKey) -> ServerSettings | None:
         settings_stash = self.services.settings.stash
 
         try:
-            settings = settings_stash.get_all(self.signing_key.verify_key).unwrap()
+            settings = settings_stash.get_all(credentials).unwrap()
 
             if len(settings) > 0:
                 setting = settings[0]
                 self.update_self(setting)
-                self._settings = setting
                 return setting
             else:
                 return None
@@ -930,18 +932,11 @@ class Server(AbstractServer):
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
 
-        settings_stash = self.services.settings.stash
-        error_msg = f"Cannot get server settings for '{self.name}'"
-
-        all_settings = settings_stash.get_all(self.signing_key.verify_key).unwrap(
-            public_message=error_msg
-        )
-
-        if len(all_settings) == 0:
-            raise SyftException(public_message=error_msg)
-
-        settings = all_settings[0]
-        self.update_self(settings)
+        settings = self.get_settings()
+        if settings is None:
+            raise SyftException(
+                public_message=f"Cannot get server settings for '{self.name}'"
+            )
         return settings
 
     @property
@@ -1034,25 +1029,23 @@ class Server(AbstractServer):
                 )
             )
 
-        client = None
         peer = self.services.network.stash.get_by_uid(
             self.verify_key, server_uid
         ).unwrap()
 
-        # Since we have several routes to a peer
-        # we need to cache the client for a given server_uid along with the route
-        peer_cache_key = hash(server_uid) + hash(peer.pick_highest_priority_route())
-        if peer_cache_key in self.peer_client_cache:
-            client = self.peer_client_cache[peer_cache_key]
-        else:
+        def create_client() -> SyftClient:
             context = AuthedServiceContext(
                 server=self, credentials=api_call.credentials
             )
-
-            client = peer.client_with_context(context=context).unwrap(
+            return peer.client_with_context(context=context).unwrap(
                 public_message=f"Failed to create remote client for peer: {peer.id}"
             )
-            self.peer_client_cache[peer_cache_key] = client
+
+        # Since we have several routes to a peer
+        # we need to cache the client for a given server_uid along with the route
+        client = self.db.peer_client_cache.get_or_compute(
+            peer.client_cache_key(), create_client
+        )
 
         if client:
             message: SyftAPICall = api_call.message
@@ -1142,7 +1135,6 @@ class Server(AbstractServer):
         if is_blocking or self.is_subprocess:
             api_call = api_call.message
 
-            role = self.get_role_for_credentials(credentials=credentials)
             settings = self.get_settings()
             # TODO: This instance check should be removed once we can ensure that
             # self.settings will always return a ServerSettings object.
@@ -1394,10 +1386,13 @@ class Server(AbstractServer):
 
         # 🟡 TODO 36: Needs distributed lock
         self.job_stash.set(credentials, job).unwrap()
-        self.queue_stash.set_placeholder(credentials, queue_item).unwrap()
-
+        queue_item = self.queue_stash.set_placeholder(credentials, queue_item).unwrap()
         self.services.log.add(context, log_id, queue_item.job_id)
 
+        # hand the item to the producer right away instead of waiting for its sweep,
+        # the job and its log have to exist before a consumer can pick it up
+        notify_local_producers(self.id, queue_item)
+
         return job
 
     def _sort_jobs(self, jobs: list[Job]) -> list[Job]:
@@ -1556,16 +1551,47 @@ class Server(AbstractServer):
         ).unwrap()
 
     @instrument
+    # The API of each user is cached in self.db.api_cache, by role and protocol. The
+    # UserCodeStash and TwinAPIEndpointStash invalidate it.
     def get_api(
         self,
         for_user: SyftVerifyKey | None = None,
         communication_protocol: PROTOCOL_TYPE | None = None,
     ) -> SyftAPI:
-        return SyftAPI.for_user(
-            server=self,
-            user_verify_key=for_user,
-            communication_protocol=communication_protocol,
-        )
+        api = self._get_cached_api(for_user, communication_protocol, to_bytes=False)
+        # the client sets its connection and keys on the api
+        return api.model_copy()
+
+    def get_serialized_api(
+        self,
+        for_user: SyftVerifyKey | None = None,
+        communication_protocol: PROTOCOL_TYPE | None = None,
+    ) -> bytes:
+        return self._get_cached_api(for_user, communication_protocol, to_bytes=True)
+
+    def _get_cached_api(
+        self,
+        for_user: SyftVerifyKey | None,
+        communication_protocol: PROTOCOL_TYPE | None,
+        to_bytes: bool,
+    ) -> Any:
+        def build() -> SyftAPI | bytes:
+            if to_bytes:
+                return serialize(
+                    self._get_cached_api(
+                        for_user, communication_protocol, to_bytes=False
+                    ),
+                    to_bytes=True,
+                )
+            return SyftAPI.for_user(
+                server=self,
+                user_verify_key=for_user,
+                communication_protocol=communication_protocol,
+            )
+
+        role = self.get_role_for_credentials(for_user)
+        key = (for_user, role, str(communication_protocol), to_bytes)
+        return self.db.api_cache.get_or_compute(key, build)
 
     def get_method_with_context(
         self, function: Callable, context: ServerServiceContext
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 # stdlib
 from collections.abc import Callable
+from typing import ClassVar
 
 # third party
 from typing_extensions import Self
@@ -31,6 +32,8 @@ from ..types.uid import UID
 class WorkerSettings(SyftObject):
     __canonical_name__ = "WorkerSettings"
     __version__ = SYFT_OBJECT_VERSION_2
+    # hashed for every queued message
+    __cache_sha256__: ClassVar[bool] = True
 
     id: UID
     name: str
@@ -9,7 +9,6 @@ import inspect
 from io import BytesIO
 import logging
 from pathlib import Path
-import sys
 import threading
 import time
 import types
@@ -31,7 +30,7 @@ from ...client.client import SyftClient
 from ...serde.serializable import serializable
 from ...serde.serialize import _serialize as serialize
 from ...server.credentials import SyftVerifyKey
-from ...service.blob_storage.util import can_upload_to_blob_storage
+from ...service.blob_storage.util import serialize_for_blob_storage
 from ...service.response import SyftSuccess
 from ...service.response import SyftWarning
 from ...store.linked_obj import LinkedObject
@@ -316,6 +315,7 @@ passthrough_attrs = [
     "copy",  # pydantic
     "__sha256__",  # syft
     "__hash_exclude_attrs__",  # syft
+    "__cache_sha256__",  # syft
     "__private_sync_attr_mocks__",  # syft
     "__exclude_sync_diff_attrs__",  # syft
     "__repr_attrs__",  # syft
@@ -347,6 +347,7 @@ dont_wrap_output_attrs = [
     "syft_action_data_server_id",
     "__sha256__",
     "__hash_exclude_attrs__",
+    "__cache_sha256__",
     "__exclude_sync_diff_attrs__",  # syft
     "__repr_attrs__",  # syft
     "get_sync_dependencies",  # syft
@@ -374,6 +375,7 @@ dont_make_side_effects = [
     "syft_action_data_server_id",
     "__sha256__",
     "__hash_exclude_attrs__",
+    "__cache_sha256__",
     "__exclude_sync_diff_attrs__",  # syft
     "__repr_attrs__",
     "get_sync_dependencies",
@@ -655,6 +657,7 @@ BASE_PASSTHROUGH_ATTRS: list[str] = [
     "server_uid",
     "__sha256__",
     "__hash_exclude_attrs__",
+    "__cache_sha256__",
     "__hash__",
     "create_shareable_sync_copy",
     "_has_private_sync_attrs",
@@ -809,10 +812,13 @@ class ActionObject(SyncableSyftObject):
                     syft_server_location=self.syft_server_location,
                     syft_client_verify_key=self.syft_client_verify_key,
                 )
-                if (
-                    get_metadata is not None
-                    and not can_upload_to_blob_storage(data, get_metadata()).unwrap()
-                ):
+                # serialized once, both to decide where to save data and to upload it
+                serialized = (
+                    serialize_for_blob_storage(data, get_metadata()).unwrap()
+                    if get_metadata is not None
+                    else serialize(data, to_bytes=True)
+                )
+                if serialized is None:
                     self.syft_action_saved_to_blob_store = False
                     return SyftWarning(
                         message=(
@@ -820,8 +826,7 @@ class ActionObject(SyncableSyftObject):
                             f" the blob store but to memory cache since it is small."
                         )
                     )
-                serialized = serialize(data, to_bytes=True)
-                size = sys.getsizeof(serialized)
+                size = len(serialized)
                 storage_entry = CreateBlobStorageEntry.from_obj(data, file_size=size)
 
                 if not TraceResultRegistry.current_thread_is_tracing():
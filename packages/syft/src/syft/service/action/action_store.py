@@ -132,3 +132,6 @@ class ActionObjectStash(ObjectStash[ActionObject]):
 
     def set(self, *args, **kwargs):  # type: ignore
         raise Exception("Use `ActionObjectStash.set_or_update` instead.")
+
+    def set_many(self, *args, **kwargs):  # type: ignore
+        raise Exception("Use `ActionObjectStash.set_or_update` instead.")
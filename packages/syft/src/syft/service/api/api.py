@@ -1,6 +1,7 @@
 # stdlib
 import ast
 from collections.abc import Callable
+from functools import lru_cache
 import inspect
 from inspect import Signature
 import keyword
@@ -20,6 +21,7 @@ from pydantic import model_validator
 from ...abstract_server import AbstractServer
 from ...client.client import SyftClient
 from ...serde.serializable import serializable
+from ...serde.serialize import _serialize as serialize
 from ...serde.signature import signature_remove_context
 from ...types.errors import SyftException
 from ...types.result import as_result
@@ -45,6 +47,13 @@ from .utils import print as log_print
 
 NOT_ACCESSIBLE_STRING = "N / A"
 
+# number of compiled endpoint functions kept by each process
+ENDPOINT_CODE_CACHE_SIZE = 256
+
+# names of the functions of a TwinAPIEndpoint
+MOCK_FUNCTION = "mock_function"
+PRIVATE_FUNCTION = "private_function"
+
 
 class HelperFunctionSet:
     def __init__(self, helper_functions: dict[str, Callable]) -> None:
@@ -82,6 +91,23 @@ def get_signature(func: Callable) -> Signature:
     return sig
 
 
+@lru_cache(maxsize=ENDPOINT_CODE_CACHE_SIZE)
+def compile_endpoint_code(func_name: str, api_code: str) -> tuple[str, Any, Any]:
+    """Compile the code of an endpoint function, without its decorator.
+
+    Returns the source of the function, its compiled definition, and the
+    compiled call to it. Cached per process, keyed by the name and the code.
+    """
+    inner_function = ast.parse(api_code).body[0]
+    inner_function.decorator_list = []
+    src = ast.unparse(inner_function)
+    byte_code = compile(src, func_name, "exec")
+    call_code = compile(
+        f"{func_name}(*args, **kwargs,context=internal_context)", func_name, "eval"
+    )
+    return src, byte_code, call_code
+
+
 def register_fn_in_linecache(fname: str, src: str) -> None:
     """adds a function to linecache, such that inspect.getsource works for functions nested in this function.
     This only works if the same function is compiled under the same filename"""
@@ -277,10 +303,10 @@ class Endpoint(SyftObject):
     def call_locally(
         self, context: AuthedServiceContext, *args: Any, **kwargs: Any
     ) -> Any:
-        inner_function = ast.parse(self.api_code).body[0]
-        inner_function.decorator_list = []
         # compile the function
-        raw_byte_code = compile(ast.unparse(inner_function), "<string>", "exec")
+        _, raw_byte_code, call_code = compile_endpoint_code(
+            self.func_name, self.api_code
+        )
 
         # load it
         exec(raw_byte_code)  # nosec
@@ -288,8 +314,7 @@ class Endpoint(SyftObject):
         internal_context = self.build_internal_context(context=context)
 
         # execute it
-        evil_string = f"{self.func_name}(*args, **kwargs,context=internal_context)"
-        result = eval(evil_string, None, locals())  # nosec
+        result = eval(call_code, None, locals())  # nosec
 
         # Update code context state
         self.update_state(internal_context.state)
@@ -572,20 +597,28 @@ class TwinAPIEndpoint(SyncableSyftObject):
         raise SyftException(public_message="You're not allowed to run this code.")
 
     def get_user_client_from_server(self, context: AuthedServiceContext) -> SyftClient:
-        # get a user client
-        guest_client = context.server.get_guest_client()
-        user_client = guest_client
-        private_key = context.server.services.user.signing_key_for_verify_key(
-            context.credentials
+        # get a user client, reused across calls of the same user
+        def build_user_client() -> SyftClient:
+            user_client = context.server.get_guest_client()
+            private_key = context.server.services.user.signing_key_for_verify_key(
+                context.credentials
+            )
+            user_client.credentials = private_key.signing_key
+            return user_client
+
+        return context.server.services.api.client_cache.get_or_compute(
+            context.credentials, build_user_client
         )
-        signing_key = private_key.signing_key
-        user_client.credentials = signing_key
-        return user_client
 
     def get_admin_client_from_server(self, context: AuthedServiceContext) -> SyftClient:
-        admin_client = context.server.get_guest_client()
-        admin_client.credentials = context.server.signing_key
-        return admin_client
+        def build_admin_client() -> SyftClient:
+            admin_client = context.server.get_guest_client()
+            admin_client.credentials = context.server.signing_key
+            return admin_client
+
+        return context.server.services.api.client_cache.get_or_compute(
+            context.server.verify_key, build_admin_client
+        )
 
     @as_result(SyftException)
     def exec_code(
@@ -608,11 +641,9 @@ class TwinAPIEndpoint(SyncableSyftObject):
             else:
                 print = original_print  # type: ignore
 
-            inner_function = ast.parse(code.api_code).body[0]
-            inner_function.decorator_list = []
-            # compile the function
-            src = ast.unparse(inner_function)
-            raw_byte_code = compile(src, code.func_name, "exec")
+            src, raw_byte_code, call_code = compile_endpoint_code(
+                code.func_name, code.api_code
+            )
             register_fn_in_linecache(code.func_name, src)
             user_client = self.get_user_client_from_server(context)
             admin_client = self.get_admin_client_from_server(context)
@@ -620,18 +651,18 @@ class TwinAPIEndpoint(SyncableSyftObject):
             internal_context = code.build_internal_context(
                 context=context, admin_client=admin_client, user_client=user_client
             )
-            evil_string = f"{code.func_name}(*args, **kwargs,context=internal_context)"
+            # nested values of the state are shared with the internal context
+            original_state = serialize(code.state or {}, to_bytes=True)
 
             _globals = {"print": print}
             # load it
             exec(raw_byte_code, _globals, locals())  # nosec
 
             # execute it
-            evil_string = f"{code.func_name}(*args, **kwargs,context=internal_context)"
             result = None
             try:
                 # users can raise SyftException in their code
-                result = eval(evil_string, _globals, locals())  # nosec
+                result = eval(call_code, _globals, locals())  # nosec
             except SyftException as e:
                 # capture it as the result variable
                 result = e
@@ -641,13 +672,20 @@ class TwinAPIEndpoint(SyncableSyftObject):
 
             if isinstance(code, PublicAPIEndpoint):
                 self.mock_function = code
+                function = MOCK_FUNCTION
             else:
                 self.private_function = code  # type: ignore
-
-            api_service = context.server.get_service("apiservice")
-            api_service.stash.upsert(
-                context.server.services.user.root_verify_key, self
-            ).unwrap()
+                function = PRIVATE_FUNCTION
+
+            # only the state of the executed function is written, if it changed
+            if serialize(code.state or {}, to_bytes=True) != original_state:
+                api_service = context.server.get_service("apiservice")
+                api_service.stash.set_state(
+                    context.server.services.user.root_verify_key,
+                    self.id,
+                    function,
+                    code.state,
+                ).unwrap()
 
             print = original_print  # type: ignore
             # if we caught a SyftException above we will raise and auto wrap to Result
@@ -1,5 +1,4 @@
 # stdlib
-import time
 from typing import Any
 from typing import cast
 
@@ -7,6 +6,7 @@ from typing import cast
 from pydantic import ValidationError
 
 # relative
+from ...client.client import SyftClient
 from ...serde.serializable import serializable
 from ...service.action.action_endpoint import CustomEndpointActionObject
 from ...service.action.action_object import ActionObject
@@ -16,6 +16,7 @@ from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
 from ...types.result import as_result
 from ...types.uid import UID
+from ...util.cache import StatsCache
 from ..context import AuthedServiceContext
 from ..response import SyftSuccess
 from ..service import AbstractService
@@ -34,6 +35,11 @@ from .api import TwinAPIEndpointView
 from .api import UpdateTwinAPIEndpoint
 from .api_stash import TwinAPIEndpointStash
 
+# in-process clients handed to endpoint code, per user
+ENDPOINT_CLIENT_CACHE_SIZE = 128
+# bounds how long a client keeps the API of a user whose role changed
+ENDPOINT_CLIENT_CACHE_TTL_SEC = 60
+
 
 @serializable(canonical_name="APIService", version=1)
 class APIService(AbstractService):
@@ -41,6 +47,10 @@ class APIService(AbstractService):
 
     def __init__(self, store: DBManager) -> None:
         self.stash = TwinAPIEndpointStash(store=store)
+        # the API of cached clients includes the endpoints, it is dropped when they change
+        self.client_cache: StatsCache[SyftClient] = StatsCache(
+            maxsize=ENDPOINT_CLIENT_CACHE_SIZE, ttl=ENDPOINT_CLIENT_CACHE_TTL_SEC
+        )
 
     @service_method(
         path="api.add", name="add", roles=ADMIN_ROLE_LEVEL, unwrap_on_success=False
@@ -73,6 +83,7 @@ class APIService(AbstractService):
                 )
 
         result = self.stash.upsert(context.credentials, obj=new_endpoint).unwrap()
+        self.client_cache.invalidate()
         action_obj = ActionObject.from_obj(
             id=new_endpoint.action_object_id,
             syft_action_data=CustomEndpointActionObject(endpoint_id=result.id),
@@ -158,6 +169,7 @@ class APIService(AbstractService):
 
         # save changes
         self.stash.upsert(context.credentials, obj=endpoint).unwrap()
+        self.client_cache.invalidate()
         return SyftSuccess(message="Endpoint successfully updated.")
 
     @service_method(
@@ -170,6 +182,7 @@ class APIService(AbstractService):
         """Deletes an specific API endpoint."""
         endpoint = self.stash.get_by_path(context.credentials, endpoint_path).unwrap()
         self.stash.delete_by_uid(context.credentials, endpoint.id).unwrap()
+        self.client_cache.invalidate()
         return SyftSuccess(message="Endpoint successfully deleted.")
 
     @service_method(
@@ -343,30 +356,29 @@ class APIService(AbstractService):
         )
 
         # relative
+        from ..job.job_stash import Job
         from ..job.job_stash import JobStatus
 
         # So result is a Job object
         job_id = job.id
-        # Question: For a small moment, when job status is updated, it doesn't return the job during the .get() as if
-        # it's not in the stash. Then afterwards if appears again. Is this a bug?
 
-        start = time.time()
+        def is_done(job: Job) -> bool:
+            return job.status not in (JobStatus.PROCESSING, JobStatus.CREATED)
 
-        # TODO: what can we do here?????
-        while (
-            job is None
-            or job.status == JobStatus.PROCESSING
-            or job.status == JobStatus.CREATED
-        ):
-            job = context.server.services.job.get(context, job_id)
-            time.sleep(0.1)
-            if (time.time() - custom_endpoint.endpoint_timeout) > start:
-                raise SyftException(
-                    public_message=(
-                        f"Function timed out in {custom_endpoint.endpoint_timeout} seconds. "
-                        + f"Get the Job with id: {job_id} to check results."
-                    )
+        # wakes up as soon as the job is written by the consumer
+        job = context.server.services.job.stash.wait(
+            context.credentials,
+            job_id,
+            is_done=is_done,
+            timeout=custom_endpoint.endpoint_timeout,
+        ).unwrap()
+        if not is_done(job):
+            raise SyftException(
+                public_message=(
+                    f"Function timed out in {custom_endpoint.endpoint_timeout} seconds. "
+                    + f"Get the Job with id: {job_id} to check results."
                 )
+            )
 
         if job.status == JobStatus.COMPLETED:
             return job.result
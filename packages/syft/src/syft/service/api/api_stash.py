@@ -1,17 +1,75 @@
+# stdlib
+from typing import Any
+
+# third party
+from pydantic import ValidationError
+import sqlalchemy as sa
+from sqlalchemy import Column
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
 # relative
+from ...serde.deserialize import _deserialize as deserialize
 from ...serde.serializable import serializable
+from ...serde.serialize import _serialize as serialize
 from ...server.credentials import SyftVerifyKey
+from ...store.db.db import DBManager
+from ...store.db.schema import UIDTypeDecorator
+from ...store.db.schema import utcnow
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
+from ...store.document_store_errors import UniqueConstraintException
 from ...types.result import as_result
+from ...types.uid import UID
+from ..action.action_permissions import ActionPermission
+from .api import Endpoint
+from .api import MOCK_FUNCTION
+from .api import PRIVATE_FUNCTION
 from .api import TwinAPIEndpoint
 
 MISSING_PATH_STRING = "Endpoint path: {path} does not exist."
 
 
+def create_endpoint_state_table(table_name: str, metadata: MetaData) -> Table:
+    """Create the table holding the state of the functions of the endpoints in `table_name`."""
+    name = f"{table_name}_state"
+    if name not in metadata.tables:
+        Table(
+            name,
+            metadata,
+            Column("endpoint_id", UIDTypeDecorator, primary_key=True),
+            # MOCK_FUNCTION or PRIVATE_FUNCTION
+            Column("function", sa.String(32), primary_key=True),
+            Column("state", sa.LargeBinary, nullable=False),
+        )
+    return metadata.tables[name]
+
+
 @serializable(canonical_name="TwinAPIEndpointSQLStash", version=1)
 class TwinAPIEndpointStash(ObjectStash[TwinAPIEndpoint]):
+    """Stash for TwinAPIEndpoints, with separate storage for the state of their functions.
+
+    Executing an endpoint only writes the state of the executed function. The state is
+    folded into the endpoints returned by `get_one`/`get_all`, and compacted into the
+    endpoint row when the whole endpoint is written with `update` or `upsert_many`.
+
+    Writes of the endpoints (but not of their state) clear the APIs cached by
+    Server.get_api.
+    """
+
+    def __init__(self, store: DBManager) -> None:
+        super().__init__(store)
+        self.state_table = create_endpoint_state_table(
+            self.table.name, self.table.metadata
+        )
+
+    def _after_write(self, uids: list[UID]) -> None:
+        self.db.api_cache.invalidate()
+
     @as_result(StashException, NotFoundException)
     def get_by_path(self, credentials: SyftVerifyKey, path: str) -> TwinAPIEndpoint:
         # TODO standardize by returning None if endpoint doesnt exist.
@@ -33,3 +91,155 @@ class TwinAPIEndpointStash(ObjectStash[TwinAPIEndpoint]):
             return True
         except NotFoundException:
             return False
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def set_state(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        function: str,
+        state: dict[Any, Any],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> None:
+        """Write the state of the `function` (mock or private) of an endpoint."""
+        if function not in (MOCK_FUNCTION, PRIVATE_FUNCTION):
+            raise StashException(f"Invalid endpoint function: {function}")
+
+        # mark the endpoint as updated, this also checks it exists and is writable
+        stmt = (
+            self.table.update()
+            .where(self._get_field_filter("id", uid))
+            .values(_updated_at=utcnow())
+        )
+        stmt = self._apply_permission_filter(
+            stmt,
+            credentials=credentials,
+            permission=ActionPermission.WRITE,
+            has_permission=has_permission,
+            session=session,
+        )
+        if session.execute(stmt).rowcount == 0:
+            raise NotFoundException(
+                f"{self.object_type.__name__}: {uid} not found or no permission to update."
+            )
+
+        session.execute(
+            self.state_table.delete()
+            .where(self.state_table.c.endpoint_id == uid)
+            .where(self.state_table.c.function == function)
+        )
+        session.execute(
+            self.state_table.insert().values(
+                endpoint_id=uid,
+                function=function,
+                state=serialize(state, to_bytes=True),
+            )
+        )
+
+    def _fold_state(
+        self, endpoints: list[TwinAPIEndpoint], session: Session
+    ) -> list[TwinAPIEndpoint]:
+        if not endpoints:
+            return endpoints
+
+        stmt = select(self.state_table).where(
+            self.state_table.c.endpoint_id.in_([endpoint.id for endpoint in endpoints])
+        )
+        states = {
+            (row.endpoint_id, row.function): row.state
+            for row in session.execute(stmt).all()
+        }
+        if not states:
+            return endpoints
+
+        for endpoint in endpoints:
+            for function in (MOCK_FUNCTION, PRIVATE_FUNCTION):
+                state = states.get((endpoint.id, function))
+                code: Endpoint | None = getattr(endpoint, function)
+                if state is not None and code is not None:
+                    code.state = deserialize(state, from_bytes=True)
+        return endpoints
+
+    def _delete_state(self, uids: list[UID], session: Session) -> None:
+        session.execute(
+            self.state_table.delete().where(self.state_table.c.endpoint_id.in_(uids))
+        )
+
+    @as_result(StashException)
+    @with_session
+    def get_one(
+        self, *args: Any, session: Session = None, **kwargs: Any
+    ) -> TwinAPIEndpoint:
+        endpoint = super().get_one(*args, session=session, **kwargs).unwrap()
+        return self._fold_state([endpoint], session=session)[0]
+
+    @as_result(StashException)
+    @with_session
+    def get_all(
+        self, *args: Any, session: Session = None, **kwargs: Any
+    ) -> list[TwinAPIEndpoint]:
+        endpoints = super().get_all(*args, session=session, **kwargs).unwrap()
+        return self._fold_state(endpoints, session=session)
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        AttributeError,
+        ValidationError,
+        UniqueConstraintException,
+    )
+    @with_session
+    def update(
+        self,
+        credentials: SyftVerifyKey,
+        obj: TwinAPIEndpoint,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> TwinAPIEndpoint:
+        """Write the whole endpoint, including the state of its functions."""
+        super().update(
+            credentials, obj, has_permission=has_permission, session=session
+        ).unwrap()
+        self._delete_state([obj.id], session=session)
+        return self.get_by_uid(credentials, obj.id, session=session).unwrap()
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        UniqueConstraintException,
+    )
+    @with_session
+    def upsert_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[TwinAPIEndpoint],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[TwinAPIEndpoint]:
+        """Write whole endpoints, including the state of their functions."""
+        endpoints = (
+            super()
+            .upsert_many(
+                credentials, objs, has_permission=has_permission, session=session
+            )
+            .unwrap()
+        )
+        self._delete_state([obj.id for obj in objs], session=session)
+        return endpoints
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def delete_by_uid(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> UID:
+        super().delete_by_uid(
+            credentials, uid, has_permission=has_permission, session=session
+        ).unwrap()
+        self._delete_state([uid], session=session)
+        return uid
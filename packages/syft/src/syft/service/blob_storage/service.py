@@ -192,6 +192,26 @@ class BlobStorageService(AbstractService):
             res.file_size = obj.file_size
             return res
 
+    @service_method(
+        path="blob_storage.read_range",
+        name="read_range",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def read_range(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> bytes:
+        """Read `length` bytes from `offset` of a blob, or up to its end if `length` is None."""
+        obj = self.stash.get_by_uid(context.credentials, uid=uid).unwrap()
+
+        with context.server.blob_storage_client.connect() as conn:
+            return conn.read_range(
+                obj.location, offset=offset, length=length, bucket_name=obj.bucket_name
+            )
+
     @as_result(SyftException)
     def _allocate(
         self,
@@ -1,13 +1,23 @@
 # stdlib
 from typing import Any
 
+# third party
+import numpy as np
+import pandas as pd
+
 # relative
+from ...serde.serialize import _serialize as serialize
 from ...types.errors import SyftException
 from ...types.result import as_result
-from ...util.util import get_mb_serialized_size
 from ..metadata.server_metadata import ServerMetadata
 from ..metadata.server_metadata import ServerMetadataJSON
 
+# headers and schema metadata added by serialization on top of the raw buffers
+SERIALIZATION_OVERHEAD_MB = 0.1
+
+# numpy kinds serialized as a (possibly compressed) copy of the array buffer
+_BUFFER_DTYPE_KINDS = "biufcmM"
+
 
 def min_size_for_blob_storage_upload(
     metadata: ServerMetadata | ServerMetadataJSON,
@@ -15,13 +25,57 @@ def min_size_for_blob_storage_upload(
     return metadata.min_size_blob_storage_mb
 
 
+def estimate_mb_size(data: Any) -> float | None:
+    """Cheaply estimate an upper bound of the serialized size of `data` in MB.
+
+    numpy arrays are serialized as Arrow tensors and DataFrames as parquet, both
+    at most the size of their buffers. Returns None for any other type, and for
+    data whose serialized size can not be bounded from its buffers.
+    """
+    if isinstance(data, np.ndarray):
+        if data.dtype.kind not in _BUFFER_DTYPE_KINDS:
+            return None
+        nbytes = data.nbytes
+    elif isinstance(data, pd.DataFrame):
+        # python objects take more memory than their parquet encoding
+        nbytes = int(data.memory_usage(index=True, deep=True).sum())
+    else:
+        return None
+    return nbytes / (1024 * 1024) + SERIALIZATION_OVERHEAD_MB
+
+
 @as_result(SyftException)
-def can_upload_to_blob_storage(
+def serialize_for_blob_storage(
     data: Any, metadata: ServerMetadata | ServerMetadataJSON
-) -> bool:
+) -> bytes | None:
+    """Serialize `data` if it is big enough to be saved to the blob storage.
+
+    Returns the serialized bytes to upload, or None when `data` should be kept in
+    memory. Data whose estimated size is below the threshold is not serialized.
+    """
+    min_size = min_size_for_blob_storage_upload(metadata)
+    estimate = estimate_mb_size(data)
+    if estimate is not None and estimate < min_size:
+        return None
+
     try:
-        return get_mb_serialized_size(data) >= min_size_for_blob_storage_upload(
-            metadata
+        serialized = serialize(data, to_bytes=True)
+    except Exception as exc:
+        data_type = type(data)
+        raise SyftException.from_exception(
+            exc,
+            public_message=(
+                f"Failed to serialize data of type '{data_type.__module__}.{data_type.__name__}'."
+                f" Data type not supported. Detailed error: {exc}"
+            ),
         )
-    except TypeError as exc:
-        raise SyftException.from_exception(exc, public_message=str(exc))
+    if len(serialized) / (1024 * 1024) < min_size:
+        return None
+    return serialized
+
+
+@as_result(SyftException)
+def can_upload_to_blob_storage(
+    data: Any, metadata: ServerMetadata | ServerMetadataJSON
+) -> bool:
+    return serialize_for_blob_storage(data, metadata).unwrap() is not None
@@ -7,6 +7,7 @@ from collections.abc import Callable
 from copy import deepcopy
 import datetime
 from enum import Enum
+from functools import lru_cache
 import hashlib
 import inspect
 from io import StringIO
@@ -72,6 +73,7 @@ from ..action.action_object import ActionObject
 from ..context import AuthedServiceContext
 from ..dataset.dataset import Asset
 from ..job.job_stash import Job
+from ..log.log import LogBuffer
 from ..output.output_service import ExecutionOutput
 from ..policy.policy import Constant
 from ..policy.policy import CustomInputPolicy
@@ -117,6 +119,25 @@ def compile_byte_code(parsed_code: str) -> PyCodeObject | None:
     return None
 
 
+# number of compiled user functions kept by each process
+USER_CODE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=USER_CODE_CACHE_SIZE)
+def compile_user_code(code_hash: str, parsed_code: str) -> PyCodeObject | None:
+    """Compile the parsed code of a UserCode, cached by its code hash.
+
+    The parsed code is part of the key, so a cached entry is only reused for the
+    exact same source.
+    """
+    return compile_byte_code(parsed_code)
+
+
+@lru_cache(maxsize=USER_CODE_CACHE_SIZE)
+def compile_user_code_call(unique_func_name: str) -> PyCodeObject:
+    return compile(f"{unique_func_name}(**kwargs)", "<string>", "eval")
+
+
 @serializable(canonical_name="UserCodeStatus", version=1)
 class UserCodeStatus(Enum):
     PENDING = "pending"
@@ -830,7 +851,7 @@ class UserCode(SyncableSyftObject):
 
     @property
     def byte_code(self) -> PyCodeObject | None:
-        return compile_byte_code(self.parsed_code)
+        return compile_user_code(self.code_hash, self.parsed_code)
 
     @property
     def assets(self) -> DictTuple[str, Asset]:
@@ -1861,6 +1882,7 @@ def execute_byte_code(
 ) -> Any:
     stdout_ = sys.stdout
     stderr_ = sys.stderr
+    log_buffer = None
 
     try:
         # stdlib
@@ -1903,6 +1925,8 @@ def execute_byte_code(
         if context.job is not None:
             job_id = context.job_id
             log_id = context.job.log_id
+            if context.server is not None:
+                log_buffer = LogBuffer(context=context, uid=log_id)
 
             def print(*args: Any, sep: str = " ", end: str = "\n") -> str | None:
                 def to_str(arg: Any) -> str:
@@ -1918,10 +1942,8 @@ def execute_byte_code(
 
                 new_args = [to_str(arg) for arg in args]
                 new_str = sep.join(new_args) + end
-                if context.server is not None:
-                    context.server.services.log.append(
-                        context=context, uid=log_id, new_str=new_str
-                    )
+                if log_buffer is not None:
+                    log_buffer.write(new_str)
                 time = datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S")
                 return __builtin__.print(
                     f"{time} FUNCTION LOG ({job_id}):",
@@ -1959,14 +1981,18 @@ def execute_byte_code(
                 ).unwrap()
 
         _globals["print"] = print
-        exec(code_item.parsed_code, _globals, _locals)  # nosec
-
-        evil_string = f"{code_item.unique_func_name}(**kwargs)"
+        byte_code = code_item.byte_code
+        if byte_code is None:
+            # raises the SyntaxError
+            byte_code = code_item.parsed_code
+        exec(byte_code, _globals, _locals)  # nosec
 
         result_message = ""
 
         try:
-            result = eval(evil_string, _globals, _locals)  # nosec
+            result = eval(  # nosec
+                compile_user_code_call(code_item.unique_func_name), _globals, _locals
+            )
             errored = False
         except Exception as e:
             errored = True
@@ -1986,6 +2012,8 @@ def execute_byte_code(
                 and context.job.log_id is not None
             ):
                 log_id = context.job.log_id
+                if log_buffer is not None:
+                    log_buffer.flush()
                 context.server.services.log.append(
                     context=context, uid=log_id, new_err=error_msg
                 )
@@ -2026,6 +2054,8 @@ def execute_byte_code(
     finally:
         sys.stdout = stdout_
         sys.stderr = stderr_
+        if log_buffer is not None:
+            log_buffer.flush()
 
 
 def traceback_from_error(e: Exception, code: UserCode) -> str:
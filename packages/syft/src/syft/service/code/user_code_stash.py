@@ -5,11 +5,16 @@ from ...store.db.stash import ObjectStash
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.result import as_result
+from ...types.uid import UID
 from .user_code import UserCode
 
 
 @serializable(canonical_name="UserCodeSQLStash", version=1)
 class UserCodeStash(ObjectStash[UserCode]):
+    def _after_write(self, uids: list[UID]) -> None:
+        # the user code of a user, also when it is shared with them, is part of their API
+        self.db.api_cache.invalidate()
+
     @as_result(StashException, NotFoundException)
     def get_by_code_hash(self, credentials: SyftVerifyKey, code_hash: str) -> UserCode:
         return self.get_one(
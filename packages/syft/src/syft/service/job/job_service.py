@@ -23,6 +23,7 @@ from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_OWNER_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
+from .job_stash import JOB_WAIT_MAX_SEC
 from .job_stash import Job
 from .job_stash import JobStash
 from .job_stash import JobStatus
@@ -53,6 +54,22 @@ class JobService(AbstractService):
     def get(self, context: AuthedServiceContext, uid: UID) -> Job:
         return self.stash.get_by_uid(context.credentials, uid=uid).unwrap()
 
+    @service_method(
+        path="job.wait",
+        name="wait",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def wait(
+        self, context: AuthedServiceContext, uid: UID, timeout: float = JOB_WAIT_MAX_SEC
+    ) -> Job:
+        """Get the job once it is resolved, or after at most `timeout` seconds."""
+        return self.stash.wait(
+            context.credentials,
+            uid,
+            is_done=lambda job: job.resolved,
+            timeout=min(timeout, JOB_WAIT_MAX_SEC),
+        ).unwrap()
+
     @service_method(path="job.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def get_all(self, context: AuthedServiceContext) -> list[Job]:
         return self.stash.get_all(context.credentials).unwrap()
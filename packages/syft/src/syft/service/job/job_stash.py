@@ -1,11 +1,15 @@
 # stdlib
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 from enum import Enum
 import random
 from string import Template
-from time import sleep
+import threading
+import time
 from typing import Any
 
 # third party
@@ -44,6 +48,13 @@ from ..response import SyftSuccess
 from ..user.user import UserView
 from .html_template import job_repr_template
 
+# longest time a single job.wait call blocks, clients wait longer by calling it again.
+# A waiting call holds a server thread, so this is kept short
+JOB_WAIT_MAX_SEC = 5
+# how often a waiting job is re-read without a notification, e.g. when the job is
+# written by a consumer running in another process
+JOB_WAIT_POLL_INTERVAL_SEC = 1.0
+
 
 @serializable(canonical_name="JobStatus", version=1)
 class JobStatus(str, Enum):
@@ -291,7 +302,9 @@ class Job(SyncableSyftObject):
 
     def fetch(self) -> None:
         api = self.get_api()
-        job = api.job.get(self.id)
+        self._update_from(api.job.get(self.id))
+
+    def _update_from(self, job: "Job") -> None:
         self.resolved = job.resolved
         if job.resolved:
             self.result = job.result
@@ -575,9 +588,8 @@ class Job(SyncableSyftObject):
             )
 
         print_warning = True
-        counter = 0
+        deadline = None if timeout is None else time.monotonic() + timeout
         while True:
-            self.fetch()
             if self.resolved:
                 if isinstance(self.result, SyftError | Err) or self.status in [  # type: ignore[unreachable]
                     JobStatus.ERRORED,
@@ -599,12 +611,13 @@ class Job(SyncableSyftObject):
                     )
                     print_warning = False
 
-            sleep(1)
-
-            if timeout is not None:
-                counter += 1
-                if counter > timeout:
+            wait_timeout: float = JOB_WAIT_MAX_SEC
+            if deadline is not None:
+                wait_timeout = min(wait_timeout, deadline - time.monotonic())
+                if wait_timeout <= 0:
                     raise SyftException(public_message="Reached Timeout!")
+            # returns as soon as the job is resolved on the server
+            self._update_from(api.services.job.wait(self.id, timeout=wait_timeout))
 
         # if self.resolve returns self.result as error, then we
         # raise SyftException and not wait for the result
@@ -733,8 +746,70 @@ class JobInfo(SyftObject):
         return info
 
 
+class JobNotifier:
+    """Wakes up the threads waiting for a job when the job is written.
+
+    Only writes made in this process are seen, waiters re-read the job
+    periodically to pick up the others.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict[UID, set[threading.Event]] = {}
+
+    @contextmanager
+    def watch(self, uid: UID) -> Iterator[threading.Event]:
+        event = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(uid, set()).add(event)
+        try:
+            yield event
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(uid, set())
+                waiters.discard(event)
+                if not waiters:
+                    self._waiters.pop(uid, None)
+
+    def notify(self, uid: UID) -> None:
+        with self._lock:
+            for event in self._waiters.get(uid, ()):
+                event.set()
+
+
+# shared by all servers in the process, queue consumers run their own server
+job_notifier = JobNotifier()
+
+
 @serializable(canonical_name="JobStashSQL", version=1)
 class JobStash(ObjectStash[Job]):
+    def _after_write(self, uids: list[UID]) -> None:
+        # wake up the threads waiting for the jobs, see `wait`
+        for uid in uids:
+            job_notifier.notify(uid)
+
+    @as_result(StashException, NotFoundException)
+    def wait(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        is_done: Callable[[Job], bool],
+        timeout: float,
+    ) -> Job:
+        """Wait until `is_done` is True for the job, or `timeout` seconds pass.
+
+        Returns the last read job, the caller checks whether it is done.
+        """
+        deadline = time.monotonic() + timeout
+        with job_notifier.watch(uid) as written:
+            while True:
+                written.clear()
+                job = self.get_by_uid(credentials, uid).unwrap()
+                remaining = deadline - time.monotonic()
+                if is_done(job) or remaining <= 0:
+                    return job
+                written.wait(min(remaining, JOB_WAIT_POLL_INTERVAL_SEC))
+
     @as_result(StashException)
     def set_result(
         self,
@@ -1,4 +1,5 @@
 # stdlib
+import threading
 from typing import Any
 from typing import ClassVar
 
@@ -9,6 +10,11 @@ from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syncable_object import SyncableSyftObject
 from ...types.uid import UID
 
+# buffered output is appended to the log once it reaches this many characters,
+# or at the latest this many seconds after it was written
+LOG_FLUSH_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL_SEC = 1.0
+
 
 @serializable()
 class SyftLog(SyncableSyftObject):
@@ -25,6 +31,8 @@ class SyftLog(SyncableSyftObject):
     stdout: str = ""
     stderr: str = ""
     job_id: UID
+    # seq of the last appended chunk folded into stdout/stderr, set by the LogStash
+    _last_chunk_seq: int | None = None
 
     def append(self, new_str: str) -> None:
         self.stdout += new_str
@@ -40,3 +48,57 @@ class SyftLog(SyncableSyftObject):
         self, context: AuthedServiceContext, **kwargs: dict
     ) -> list[UID]:  # type: ignore
         return [self.job_id]
+
+
+class LogBuffer:
+    """Buffers output written to a SyftLog and appends it in chunks.
+
+    The buffer is appended when it reaches `flush_size` characters, `flush_interval`
+    seconds after the first buffered write, and on `flush`.
+    """
+
+    def __init__(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        flush_size: int = LOG_FLUSH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SEC,
+    ) -> None:
+        self.context = context
+        self.uid = uid
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._stdout: list[str] = []
+        self._stderr: list[str] = []
+        self._size = 0
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+
+    def write(self, new_str: str = "", new_err: str = "") -> None:
+        with self._lock:
+            if new_str:
+                self._stdout.append(new_str)
+            if new_err:
+                self._stderr.append(new_err)
+            self._size += len(new_str) + len(new_err)
+
+            if self._size >= self.flush_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._size == 0:
+                return
+
+            new_str, new_err = "".join(self._stdout), "".join(self._stderr)
+            self._stdout, self._stderr, self._size = [], [], 0
+            self.context.server.services.log.append(
+                context=self.context, uid=self.uid, new_str=new_str, new_err=new_err
+            )
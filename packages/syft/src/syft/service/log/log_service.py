@@ -41,14 +41,9 @@ class LogService(AbstractService):
         new_str: str = "",
         new_err: str = "",
     ) -> SyftSuccess:
-        new_log = self.stash.get_by_uid(context.credentials, uid).unwrap()
-        if new_str:
-            new_log.append(new_str)
-
-        if new_err:
-            new_log.append_error(new_err)
-
-        self.stash.update(context.credentials, new_log).unwrap()
+        self.stash.append(
+            context.credentials, uid, stdout=new_str, stderr=new_err
+        ).unwrap()
         return SyftSuccess(message="Log Append successful!")
 
     @service_method(path="log.get", name="get", roles=DATA_SCIENTIST_ROLE_LEVEL)
@@ -62,6 +57,20 @@ class LogService(AbstractService):
         result = self.get(context, uid)
         return result.stdout
 
+    @service_method(path="log.read", name="read", roles=DATA_SCIENTIST_ROLE_LEVEL)
+    def read(
+        self, context: AuthedServiceContext, uid: UID, after_seq: int | None = None
+    ) -> tuple[str, int]:
+        """Read the stdout appended to a log after `after_seq`, for tailing.
+
+        Returns the new output and the seq to pass to the next call. With
+        `after_seq=None` the whole stdout is returned.
+        """
+        stdout, _, next_seq = self.stash.tail(
+            context.credentials, uid, after_seq=after_seq
+        ).unwrap()
+        return stdout, next_seq
+
     @service_method(path="log.get_stderr", name="get_stderr", roles=ADMIN_ROLE_LEVEL)
     def get_stderr(self, context: AuthedServiceContext, uid: UID) -> str:
         result = self.get(context, uid)
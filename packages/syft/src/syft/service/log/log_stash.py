@@ -1,9 +1,264 @@
+# stdlib
+from collections import defaultdict
+from typing import Any
+
+# third party
+from pydantic import ValidationError
+import sqlalchemy as sa
+from sqlalchemy import Column
+from sqlalchemy import Index
+from sqlalchemy import MetaData
+from sqlalchemy import Row
+from sqlalchemy import Table
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
+from ...server.credentials import SyftVerifyKey
+from ...store.db.db import DBManager
+from ...store.db.schema import UIDTypeDecorator
+from ...store.db.schema import utcnow
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
+from ...store.document_store_errors import NotFoundException
+from ...store.document_store_errors import StashException
+from ...store.document_store_errors import UniqueConstraintException
+from ...types.result import as_result
+from ...types.uid import UID
+from ..action.action_permissions import ActionObjectREAD
+from ..action.action_permissions import ActionPermission
 from .log import SyftLog
 
 
+def create_log_chunks_table(table_name: str, metadata: MetaData) -> Table:
+    """Create the table holding the output appended to the logs of `table_name`.
+
+    Every append inserts a row, `seq` orders the chunks of a log.
+    """
+    name = f"{table_name}_chunks"
+    if name not in metadata.tables:
+        Table(
+            name,
+            metadata,
+            # SQLite only autoincrements INTEGER PRIMARY KEY columns
+            Column(
+                "seq",
+                sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            Column("log_id", UIDTypeDecorator, nullable=False),
+            Column("stdout", sa.Text, nullable=False, default=""),
+            Column("stderr", sa.Text, nullable=False, default=""),
+            Index(f"ix_{name}_log_id_seq", "log_id", "seq"),
+            sqlite_autoincrement=True,
+        )
+    return metadata.tables[name]
+
+
 @serializable(canonical_name="LogStash", version=1)
 class LogStash(ObjectStash[SyftLog]):
-    pass
+    """Stash for SyftLogs, with append-only storage for their output.
+
+    Appending inserts a chunk instead of rewriting the log. Chunks are folded into
+    the logs returned by `get_one`/`get_all`, and compacted into the log row
+    when the whole log is written with `update`.
+    """
+
+    def __init__(self, store: DBManager) -> None:
+        super().__init__(store)
+        self.chunks_table = create_log_chunks_table(
+            self.table.name, self.table.metadata
+        )
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def append(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        stdout: str = "",
+        stderr: str = "",
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> int:
+        """Append output to a log, returns the seq of the new chunk."""
+        # mark the log as updated, this also checks it exists and is writable. The
+        # update locks the log row until commit, so the seqs of the chunks of a log
+        # are allocated in commit order and `tail` can not skip one.
+        stmt = (
+            self.table.update()
+            .where(self._get_field_filter("id", uid))
+            .values(_updated_at=utcnow())
+        )
+        stmt = self._apply_permission_filter(
+            stmt,
+            credentials=credentials,
+            permission=ActionPermission.WRITE,
+            has_permission=has_permission,
+            session=session,
+        )
+        if session.execute(stmt).rowcount == 0:
+            raise NotFoundException(
+                f"{self.object_type.__name__}: {uid} not found or no permission to update."
+            )
+
+        result = session.execute(
+            self.chunks_table.insert().values(log_id=uid, stdout=stdout, stderr=stderr)
+        )
+        return result.inserted_primary_key[0]
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def get_chunks(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        after_seq: int = 0,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[Row]:
+        """Get the (seq, stdout, stderr) chunks appended to a log after `after_seq`, in order."""
+        if not has_permission and not self.has_permission(
+            ActionObjectREAD(uid=uid, credentials=credentials), session=session
+        ):
+            raise NotFoundException(
+                f"{self.object_type.__name__}: {uid} not found or no permission to read."
+            )
+
+        stmt = (
+            select(
+                self.chunks_table.c.seq,
+                self.chunks_table.c.stdout,
+                self.chunks_table.c.stderr,
+            )
+            .where(self.chunks_table.c.log_id == uid)
+            .where(self.chunks_table.c.seq > after_seq)
+            .order_by(self.chunks_table.c.seq)
+        )
+        return list(session.execute(stmt).all())
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def tail(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        after_seq: int | None = None,
+        session: Session = None,
+    ) -> tuple[str, str, int]:
+        """Read the output appended to a log after `after_seq`.
+
+        Returns the new stdout and stderr, and the seq to pass to the next call.
+        With `after_seq=None` the whole log is returned.
+        """
+        if after_seq is None:
+            # the log row and its chunks are read in separate statements, block
+            # appends and compaction in between
+            session.execute(
+                select(self.table.c.id)
+                .where(self._get_field_filter("id", uid))
+                .with_for_update(read=True)
+            )
+            log = self.get_by_uid(credentials, uid, session=session).unwrap()
+            # 0 if all chunks were compacted into the log, later chunks are all new
+            return log.stdout, log.stderr, log._last_chunk_seq or 0
+
+        chunks = self.get_chunks(
+            credentials, uid, after_seq=after_seq, session=session
+        ).unwrap()
+        if not chunks:
+            return "", "", after_seq
+        return (
+            "".join(chunk.stdout for chunk in chunks),
+            "".join(chunk.stderr for chunk in chunks),
+            chunks[-1].seq,
+        )
+
+    def _fold_chunks(self, logs: list[SyftLog], session: Session) -> list[SyftLog]:
+        if not logs:
+            return logs
+
+        stmt = (
+            select(self.chunks_table)
+            .where(self.chunks_table.c.log_id.in_([log.id for log in logs]))
+            .order_by(self.chunks_table.c.seq)
+        )
+        chunks_by_log: dict[UID, list[Row]] = defaultdict(list)
+        for chunk in session.execute(stmt).all():
+            chunks_by_log[chunk.log_id].append(chunk)
+
+        for log in logs:
+            chunks = chunks_by_log.get(log.id)
+            if not chunks:
+                log._last_chunk_seq = 0
+                continue
+            log.stdout += "".join(chunk.stdout for chunk in chunks)
+            log.stderr += "".join(chunk.stderr for chunk in chunks)
+            log._last_chunk_seq = chunks[-1].seq
+        return logs
+
+    def _delete_chunks(
+        self, uid: UID, session: Session, up_to_seq: int | None = None
+    ) -> None:
+        stmt = self.chunks_table.delete().where(self.chunks_table.c.log_id == uid)
+        if up_to_seq is not None:
+            stmt = stmt.where(self.chunks_table.c.seq <= up_to_seq)
+        session.execute(stmt)
+
+    @as_result(StashException)
+    @with_session
+    def get_one(self, *args: Any, session: Session = None, **kwargs: Any) -> SyftLog:
+        log = super().get_one(*args, session=session, **kwargs).unwrap()
+        return self._fold_chunks([log], session=session)[0]
+
+    @as_result(StashException)
+    @with_session
+    def get_all(
+        self, *args: Any, session: Session = None, **kwargs: Any
+    ) -> list[SyftLog]:
+        logs = super().get_all(*args, session=session, **kwargs).unwrap()
+        return self._fold_chunks(logs, session=session)
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        AttributeError,
+        ValidationError,
+        UniqueConstraintException,
+    )
+    @with_session
+    def update(
+        self,
+        credentials: SyftVerifyKey,
+        obj: SyftLog,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> SyftLog:
+        """Write the whole log, compacting the chunks it was read with into the log row.
+
+        Chunks appended after `obj` was read are kept. Logs that were not read from
+        this stash (e.g. synced from another server) replace all chunks.
+        """
+        last_chunk_seq = obj._last_chunk_seq
+        super().update(
+            credentials, obj, has_permission=has_permission, session=session
+        ).unwrap()
+        self._delete_chunks(obj.id, session=session, up_to_seq=last_chunk_seq)
+        return self.get_by_uid(credentials, obj.id, session=session).unwrap()
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def delete_by_uid(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> UID:
+        super().delete_by_uid(
+            credentials, uid, has_permission=has_permission, session=session
+        ).unwrap()
+        self._delete_chunks(uid, session=session)
+        return uid
@@ -272,30 +272,27 @@ class MigrationService(AbstractService):
 
         for key, objects in migrated_objects.items():
             created_objects[key] = []
+            objects_per_stash: dict[ObjectStash, list[SyftObject]] = defaultdict(list)
             for migrated_object in objects:
                 stash = self._search_stash_for_klass(
                     context, type(migrated_object)
                 ).unwrap()
+                objects_per_stash[stash].append(migrated_object)
 
-                result = stash.set(
+            for stash, stash_objects in objects_per_stash.items():
+                created = stash.set_many(
                     context.credentials,
-                    obj=migrated_object,
+                    objs=stash_objects,
+                    ignore_duplicates=ignore_existing,
                     skip_check_type=skip_check_type,
-                )
-                # Exception from the new Error Handling pattern, no need to change
-                if result.is_err():
-                    # TODO: subclass a DuplicationKeyError
-                    if ignore_existing and (
-                        "Duplication Key Error" in result.err()._private_message  # type: ignore
-                        or "Duplication Key Error" in result.err().public_message  # type: ignore
-                    ):
+                ).unwrap()
+                created_uids = {obj.id for obj in created}
+                for migrated_object in stash_objects:
+                    if migrated_object.id not in created_uids:
                         print(
                             f"{type(migrated_object)} #{migrated_object.id} already exists"
                         )
-                        continue
-                    else:
-                        result.unwrap()  # this will raise the exception inside the wrapper
-                created_objects[key].append(result.unwrap())
+                created_objects[key].extend(created)
         return created_objects
 
     @as_result(SyftException)
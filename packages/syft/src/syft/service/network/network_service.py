@@ -6,6 +6,11 @@ import secrets
 from typing import Any
 from typing import cast
 
+# third party
+from pydantic import ValidationError
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
 # relative
 from ...abstract_server import ServerType
 from ...client.client import HTTPConnection
@@ -17,6 +22,7 @@ from ...server.worker_settings import WorkerSettings
 from ...service.settings.settings import ServerSettings
 from ...store.db.db import DBManager
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
@@ -32,6 +38,7 @@ from ...util.util import generate_token
 from ...util.util import get_env
 from ...util.util import prompt_warning_message
 from ...util.util import str_to_bool
+from ..action.action_permissions import ActionPermission
 from ..context import AuthedServiceContext
 from ..metadata.server_metadata import ServerMetadata
 from ..request.request import Request
@@ -116,6 +123,69 @@ class NetworkStash(ObjectStash[ServerPeer]):
         )
         return self.update(credentials, peer_update).unwrap()
 
+    @as_result(StashException)
+    @with_session
+    def update_peers(
+        self,
+        credentials: SyftVerifyKey,
+        peer_updates: list[ServerPeerUpdate],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[ServerPeer]:
+        """Write the updates of several peers with a single UPDATE.
+
+        Updates of peers that no longer exist, and invalid updates, are skipped without
+        failing the other updates. `ServerPeerUpdate` can not change the unique fields,
+        so they are not checked.
+        """
+        peers_by_uid = {
+            peer.id: peer
+            for peer in self.get_all(
+                credentials,
+                filters={"id__in": [peer_update.id for peer_update in peer_updates]},
+                has_permission=has_permission,
+                session=session,
+            ).unwrap()
+        }
+
+        peers = []
+        for peer_update in peer_updates:
+            if peer_update.id not in peers_by_uid:
+                logger.info(f"Peer {peer_update.id} was deleted, skipping its update")
+                continue
+            try:
+                peer = self.apply_partial_update(
+                    original_obj=peers_by_uid[peer_update.id], update_obj=peer_update
+                ).unwrap()
+            except (AttributeError, ValidationError) as e:
+                logger.error(f"Invalid update of peer {peer_update.id}", exc_info=e)
+                continue
+            peers.append(peer)
+
+        if not peers:
+            return []
+
+        stmt = (
+            self.table.update()
+            .where(self.table.c.id == sa.bindparam("peer_id"))
+            .values(fields=sa.bindparam("peer_fields"))
+        )
+        stmt = self._apply_permission_filter(
+            stmt,
+            credentials=credentials,
+            permission=ActionPermission.WRITE,
+            has_permission=has_permission,
+            session=session,
+        )
+        session.execute(
+            stmt,
+            [
+                {"peer_id": peer.id, "peer_fields": self._serialize_fields(peer)}
+                for peer in peers
+            ],
+        )
+        return peers
+
     @as_result(StashException, NotFoundException)
     def get_by_verify_key(
         self, credentials: SyftVerifyKey, verify_key: SyftVerifyKey
@@ -4,6 +4,7 @@ from __future__ import annotations
 # stdlib
 import secrets
 from typing import Any
+from typing import ClassVar
 from typing import TYPE_CHECKING
 
 # third party
@@ -81,6 +82,7 @@ class ServerRoute:
 class HTTPServerRoute(SyftObject, ServerRoute):
     __canonical_name__ = "HTTPServerRoute"
     __version__ = SYFT_OBJECT_VERSION_1
+    __cache_sha256__: ClassVar[bool] = True
 
     id: UID | None = None  # type: ignore
     host_or_ip: str
@@ -162,6 +164,7 @@ class PythonServerRoute(SyftObject, ServerRoute):
 class VeilidServerRoute(SyftObject, ServerRoute):
     __canonical_name__ = "VeilidServerRoute"
     __version__ = SYFT_OBJECT_VERSION_1
+    __cache_sha256__: ClassVar[bool] = True
 
     vld_key: str
     proxy_target_uid: UID | None = None
@@ -198,3 +201,22 @@ def connection_to_route(connection: ServerConnection) -> ServerRoute:
         return connection.to(PythonServerRoute)
     else:
         raise ValueError(f"Connection {connection} is not supported.")
+
+
+def route_cache_key(route: ServerRoute) -> tuple[Any, ...]:
+    """The fields that identify the server a route connects to, without hashing them."""
+    if isinstance(route, HTTPServerRoute):
+        return (
+            type(route).__name__,
+            route.host_or_ip,
+            route.port,
+            route.protocol,
+            route.proxy_target_uid,
+            route.rtunnel_token,
+        )
+    elif isinstance(route, PythonServerRoute):
+        return (type(route).__name__, route.worker_settings.id, route.proxy_target_uid)
+    elif isinstance(route, VeilidServerRoute):
+        return (type(route).__name__, route.vld_key, route.proxy_target_uid)
+    else:
+        raise ValueError(f"Route {route} is not supported.")
@@ -2,6 +2,7 @@
 from collections.abc import Callable
 from enum import Enum
 import logging
+from typing import Any
 
 # relative
 from ...abstract_server import ServerType
@@ -26,6 +27,7 @@ from .routes import ServerRoute
 from .routes import ServerRouteType
 from .routes import VeilidServerRoute
 from .routes import connection_to_route
+from .routes import route_cache_key
 from .routes import route_to_connection
 
 logger = logging.getLogger(__name__)
@@ -102,6 +104,13 @@ class ServerPeer(SyftObject):
         route.priority = current_max_priority + 1
         return route
 
+    def client_cache_key(self) -> tuple[UID | None, tuple[Any, ...]]:
+        """Key of the client of this peer in `DBManager.peer_client_cache`.
+
+        Changing the highest priority route of the peer changes the key.
+        """
+        return (self.id, route_cache_key(self.pick_highest_priority_route()))
+
     def pick_highest_priority_route(self, oldest: bool = True) -> ServerRoute:
         """
         Picks the route with the highest priority from the list of server routes.
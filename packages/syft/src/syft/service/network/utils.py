@@ -1,12 +1,18 @@
 # stdlib
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import logging
 import threading
 import time
 
 # relative
+from ...client.client import SyftClient
+from ...client.client import request_timeout
 from ...serde.serializable import serializable
 from ...types.datetime import DateTime
 from ...types.errors import SyftException
+from ...types.uid import UID
 from ..context import AuthedServiceContext
 from ..response import SyftError
 from .network_service import ServerPeerAssociationStatus
@@ -17,14 +23,73 @@ from .server_peer import ServerPeerUpdate
 logger = logging.getLogger(__name__)
 
 
-@serializable(without=["thread"], canonical_name="PeerHealthCheckTask", version=1)
+@serializable(
+    without=["thread", "executor", "pending", "check_started"],
+    canonical_name="PeerHealthCheckTask",
+    version=1,
+)
 class PeerHealthCheckTask:
     repeat_time = 10  # in seconds
+    # Peers are checked concurrently, and the requests of a check time out after
+    # `peer_timeout`. A peer whose check has been running for longer than
+    # `peer_timeout` is marked as timed out, and is not checked again until its
+    # pending check returns.
+    max_workers = 32
+    peer_timeout = 5  # in seconds
 
     def __init__(self) -> None:
         self.thread: threading.Thread | None = None
         self.started_time = None
         self._stop = False
+        self.executor: ThreadPoolExecutor | None = None
+        self.pending: dict[UID, Future[ServerPeerUpdate]] = {}
+        # when the pending check of each peer started running in the executor
+        self.check_started: dict[UID, float] = {}
+
+    def check_peer(
+        self, context: AuthedServiceContext, peer: ServerPeer
+    ) -> ServerPeerUpdate:
+        """Ping a single peer, reusing the cached client of the peer."""
+        self.check_started[peer.id] = time.monotonic()
+        with request_timeout(self.peer_timeout):
+            return self._check_peer(context, peer)
+
+    def _check_peer(
+        self, context: AuthedServiceContext, peer: ServerPeer
+    ) -> ServerPeerUpdate:
+        peer_update = ServerPeerUpdate(id=peer.id)
+        peer_update.pinged_timestamp = DateTime.now()
+
+        def create_client() -> SyftClient:
+            return peer.client_with_context(context=context).unwrap()
+
+        try:
+            peer_client = context.server.db.peer_client_cache.get_or_compute(
+                peer.client_cache_key(), create_client
+            )
+        except Exception as e:
+            logger.error(f"Failed to create client for peer: {peer}", exc_info=e)
+            peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
+            return peer_update
+
+        peer_status = peer_client.api.services.network.check_peer_association(
+            peer_id=context.server.id
+        )
+        peer_update.ping_status = (
+            ServerPeerConnectionStatus.ACTIVE
+            if peer_status == ServerPeerAssociationStatus.PEER_ASSOCIATED
+            else ServerPeerConnectionStatus.INACTIVE
+        )
+        if isinstance(peer_status, SyftError):
+            peer_update.ping_status_message = (
+                f"Error `{peer_status.message}` when pinging peer '{peer.name}'"
+            )
+        else:
+            peer_update.ping_status_message = (
+                f"Peer '{peer.name}''s ping status: "
+                f"{peer_update.ping_status.value.lower()}"
+            )
+        return peer_update
 
     def peer_route_heathcheck(self, context: AuthedServiceContext) -> None:
         """
@@ -49,51 +114,62 @@ class PeerHealthCheckTask:
             logger.error(f"Failed to fetch peers from stash: {msg}")
             raise SyftException(message="Failed to fetch peers from stash")
 
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="peer-health-check"
+            )
+        for peer in all_peers:
+            if peer.id not in self.pending:
+                self.pending[peer.id] = self.executor.submit(
+                    self.check_peer, context, peer
+                )
+
+        deadline = time.monotonic() + self.peer_timeout
+        peer_updates = []
         for peer in all_peers:
-            peer_update = ServerPeerUpdate(id=peer.id)
-            peer_update.pinged_timestamp = DateTime.now()
+            future = self.pending[peer.id]
             try:
-                peer_client = peer.client_with_context(context=context)
-                if peer_client.is_err():
-                    logger.error(
-                        f"Failed to create client for peer: {peer}: {peer_client.err()}"
-                    )
-                    peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
-                    peer_client = None  # type: ignore [assignment]
+                peer_update = future.result(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+                del self.pending[peer.id]
+                self.check_started.pop(peer.id, None)
+            except FutureTimeoutError:
+                started = self.check_started.get(peer.id)
+                if started is None or time.monotonic() - started < self.peer_timeout:
+                    # queued behind the checks of other peers, or started late
+                    continue
+                peer_update = ServerPeerUpdate(id=peer.id)
+                peer_update.pinged_timestamp = DateTime.now()
+                peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
+                peer_update.ping_status_message = (
+                    f"Peer '{peer.name}' did not respond "
+                    f"within {self.peer_timeout} seconds"
+                )
             except Exception as e:
-                logger.error(f"Failed to create client for peer: {peer}", exc_info=e)
-
+                del self.pending[peer.id]
+                self.check_started.pop(peer.id, None)
+                logger.error(f"Failed to ping peer: {peer}", exc_info=e)
+                peer_update = ServerPeerUpdate(id=peer.id)
+                peer_update.pinged_timestamp = DateTime.now()
                 peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
-                peer_client = None
 
-            if peer_client is not None:
-                peer_client = peer_client.ok()  # type: ignore [assignment]
-                peer_status = peer_client.api.services.network.check_peer_association(  # type: ignore [union-attr]
-                    peer_id=context.server.id
-                )
-                peer_update.ping_status = (
-                    ServerPeerConnectionStatus.ACTIVE
-                    if peer_status == ServerPeerAssociationStatus.PEER_ASSOCIATED
-                    else ServerPeerConnectionStatus.INACTIVE
-                )
-                if isinstance(peer_status, SyftError):
-                    peer_update.ping_status_message = (
-                        f"Error `{peer_status.message}` when pinging peer '{peer.name}'"
-                    )
-                else:
-                    peer_update.ping_status_message = (
-                        f"Peer '{peer.name}''s ping status: "
-                        f"{peer_update.ping_status.value.lower()}"
-                    )
-
-            result = network_stash.update(
-                credentials=context.server.verify_key,
-                obj=peer_update,
-                has_permission=True,
-            )
+            if (
+                peer_update.ping_status != ServerPeerConnectionStatus.ACTIVE
+                and peer.server_routes
+            ):
+                # messages to the peer get a new client once it is reachable again
+                context.server.db.peer_client_cache.invalidate(peer.client_cache_key())
+            peer_updates.append(peer_update)
+
+        result = network_stash.update_peers(
+            credentials=context.server.verify_key,
+            peer_updates=peer_updates,
+            has_permission=True,
+        )
 
-            if result.is_err():
-                logger.error(f"Failed to update peer in stash: {result.err()}")
+        if result.is_err():
+            logger.error(f"Failed to update peers in stash: {result.err()}")
 
         return None
 
@@ -125,4 +201,10 @@ class PeerHealthCheckTask:
             self.thread.join()
             self.thread = None
             self.started_time = None
+        if self.executor is not None:
+            # pending checks of unresponsive peers are not waited for
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            self.pending = {}
+            self.check_started = {}
         logger.info("Peer health check task stopped.")
@@ -76,6 +76,15 @@ class NotificationStash(ObjectStash[Notification]):
             },
         ).unwrap()
 
+    @as_result(StashException)
+    def get_all_for_linked_obj_uids(
+        self, credentials: SyftVerifyKey, obj_uids: list[UID]
+    ) -> list[Notification]:
+        return self.get_all(
+            credentials,
+            filters={"linked_obj.object_uid__in": obj_uids},
+        ).unwrap()
+
     @as_result(StashException, NotFoundException)
     def update_notification_status(
         self, credentials: SyftVerifyKey, uid: UID, status: NotificationStatus
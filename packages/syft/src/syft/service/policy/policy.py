@@ -1147,7 +1147,7 @@ def register_policy_class(klass: type, unique_name: str) -> None:
     attributes = list(klass.model_fields.keys())
     exclude_attrs: list = []
     serde_overrides: dict = {}
-    hash_exclude_attrs: list = []
+    hash_exclude_attrs: frozenset = frozenset()
     cls = klass
     attribute_types: list = []
     version = 1
@@ -1,4 +1,6 @@
 # stdlib
+from collections import defaultdict
+import threading
 from typing import Any
 from typing import ClassVar
 from typing import TYPE_CHECKING
@@ -67,6 +69,42 @@ class QueueProducer:
     def close(self) -> None:
         raise NotImplementedError
 
+    def notify(self, queue_item: Any) -> None:
+        """Hand a newly created QueueItem to the producer."""
+        pass
+
+
+# Producers running in this process, by the uid of the server they serve. Every
+# Server in the process (including in-process queue consumers, which share the
+# server uid) hands new QueueItems to them directly.
+_local_producers: defaultdict[UID, list[QueueProducer]] = defaultdict(list)
+_local_producers_lock = threading.Lock()
+
+
+def register_local_producer(server_uid: UID, producer: QueueProducer) -> None:
+    with _local_producers_lock:
+        _local_producers[server_uid].append(producer)
+
+
+def unregister_local_producer(server_uid: UID, producer: QueueProducer) -> None:
+    with _local_producers_lock:
+        producers = _local_producers.get(server_uid, [])
+        if producer in producers:
+            producers.remove(producer)
+        if not producers:
+            _local_producers.pop(server_uid, None)
+
+
+def notify_local_producers(server_uid: UID, queue_item: Any) -> None:
+    """Notify the producers of `server_uid` running in this process of a new item.
+
+    Producers in other processes pick the item up in their periodic sweep.
+    """
+    with _local_producers_lock:
+        producers = list(_local_producers.get(server_uid, []))
+    for producer in producers:
+        producer.notify(queue_item)
+
 
 @serializable(canonical_name="QueueClient", version=1)
 class QueueClient:
@@ -2,6 +2,7 @@
 from enum import Enum
 import logging
 from multiprocessing import Process
+import os
 import threading
 from threading import Thread
 import time
@@ -24,6 +25,7 @@ from ...types.errors import SyftException
 from ...types.uid import UID
 from ..job.job_stash import Job
 from ..job.job_stash import JobStatus
+from ..job.job_stash import job_notifier
 from ..notification.email_templates import FailedJobTemplate
 from ..notification.notification_service import CreateNotification
 from ..notifier.notifier_enums import NOTIFIERS
@@ -163,38 +165,74 @@ class QueueManager(BaseQueueManager):
         return self._client.consumers
 
 
-def handle_message_multiprocessing(
-    worker_settings: WorkerSettings,
-    queue_item: QueueItem,
-    credentials: SyftVerifyKey,
-) -> None:
-    # this is a temp hack to prevent some multithreading issues
-    time.sleep(0.5)
+# Server instances built by queue consumers, keyed by (pid, WorkerSettings hash).
+# Building a Server sets up the db engine, stashes and every service, so a consumer
+# builds it once and reuses it for every message it handles.
+_consumer_servers: dict[tuple[int, str], Any] = {}
+_consumer_servers_lock = threading.Lock()
+
+
+def get_consumer_server(worker_settings: WorkerSettings) -> Any:
+    """Return the warm Server for `worker_settings`, building it on first use.
+
+    At most one Server is kept per process: a change in the worker settings
+    stops and replaces the cached instance, and a forked child never reuses the Server
+    (and db connections) of its parent.
+    """
     queue_config = worker_settings.queue_config
     if queue_config is None:
         raise ValueError(f"{worker_settings} has no queue configurations!")
     queue_config.client_config.create_producer = False
     queue_config.client_config.n_consumers = 0
 
-    # relative
-    from ...server.server import Server
-
-    worker = Server(
-        id=worker_settings.id,
-        name=worker_settings.name,
-        signing_key=worker_settings.signing_key,
-        db_config=worker_settings.db_config,
-        blob_storage_config=worker_settings.blob_store_config,
-        server_side_type=worker_settings.server_side_type,
-        queue_config=queue_config,
-        is_subprocess=True,
-        migrate=False,
-        deployment_type=worker_settings.deployment_type,
-    )
+    key = (os.getpid(), worker_settings.hash())
+    with _consumer_servers_lock:
+        worker = _consumer_servers.get(key)
+        if worker is not None:
+            return worker
 
-    # otherwise it reads it from env, resulting in the wrong credentials
-    worker.id = worker_settings.id
-    worker.signing_key = worker_settings.signing_key
+        # stop the replaced Server before building the new one, they share the id
+        # the Server is registered under
+        for (pid, _), evicted in _consumer_servers.items():
+            # a forked child must not close the connections of its parent
+            if pid == os.getpid():
+                evicted.stop()
+                evicted.db.engine.dispose()
+        _consumer_servers.clear()
+
+        # this is a temp hack to prevent some multithreading issues
+        time.sleep(0.5)
+
+        # relative
+        from ...server.server import Server
+
+        worker = Server(
+            id=worker_settings.id,
+            name=worker_settings.name,
+            signing_key=worker_settings.signing_key,
+            db_config=worker_settings.db_config,
+            blob_storage_config=worker_settings.blob_store_config,
+            server_side_type=worker_settings.server_side_type,
+            queue_config=queue_config,
+            is_subprocess=True,
+            migrate=False,
+            deployment_type=worker_settings.deployment_type,
+        )
+
+        # otherwise it reads it from env, resulting in the wrong credentials
+        worker.id = worker_settings.id
+        worker.signing_key = worker_settings.signing_key
+
+        _consumer_servers[key] = worker
+        return worker
+
+
+def handle_message_multiprocessing(
+    worker_settings: WorkerSettings,
+    queue_item: QueueItem,
+    credentials: SyftVerifyKey,
+) -> None:
+    worker = get_consumer_server(worker_settings)
 
     # Set monitor thread for this job.
     monitor_thread = MonitorThread(queue_item, worker, credentials)
@@ -286,9 +324,6 @@ class APICallMessageHandler(AbstractMessageHandler):
 
     @staticmethod
     def handle_message(message: bytes, syft_worker_id: UID) -> None:
-        # relative
-        from ...server.server import Server
-
         queue_item = deserialize(message, from_bytes=True)
         queue_item = cast(QueueItem, queue_item)
         worker_settings = queue_item.worker_settings
@@ -296,24 +331,7 @@ class APICallMessageHandler(AbstractMessageHandler):
             raise ValueError("Worker settings are missing in the queue item.")
 
         queue_config = worker_settings.queue_config
-        queue_config.client_config.create_producer = False
-        queue_config.client_config.n_consumers = 0
-
-        worker = Server(
-            id=worker_settings.id,
-            name=worker_settings.name,
-            signing_key=worker_settings.signing_key,
-            db_config=worker_settings.db_config,
-            server_side_type=worker_settings.server_side_type,
-            deployment_type=worker_settings.deployment_type,
-            queue_config=queue_config,
-            is_subprocess=True,
-            migrate=False,
-        )
-
-        # otherwise it reads it from env, resulting in the wrong credentials
-        worker.id = worker_settings.id
-        worker.signing_key = worker_settings.signing_key
+        worker = get_consumer_server(worker_settings)
 
         credentials = queue_item.syft_client_verify_key
         try:
@@ -361,5 +379,7 @@ class APICallMessageHandler(AbstractMessageHandler):
             job_item.job_pid = process.pid
             worker.job_stash.set_result(credentials, job_item).unwrap()
             process.join()
+            # the job was written by the child process, wake up the waiters here
+            job_notifier.notify(job_item.id)
         elif queue_config.consumer_type == ConsumerType.Synchronous:
             handle_message_multiprocessing(worker_settings, queue_item, credentials)
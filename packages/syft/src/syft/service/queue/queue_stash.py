@@ -3,12 +3,16 @@ from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...server.worker_settings import WorkerSettings
 from ...server.worker_settings import WorkerSettingsV1
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...store.linked_obj import LinkedObject
@@ -186,6 +190,31 @@ class QueueStash(ObjectStash[QueueItem]):
             self.delete_by_uid(credentials=credentials, uid=uid)
         return queue_item
 
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def claim(
+        self, credentials: SyftVerifyKey, uid: UID, session: Session = None
+    ) -> QueueItem | None:
+        """Move a CREATED item to PROCESSING, so it is dispatched only once.
+
+        The status is checked and set in one UPDATE. Returns the claimed item as
+        stored, or None if it is not CREATED anymore.
+        """
+        item = self.get_by_uid(credentials, uid, session=session).unwrap()
+        if item.status != Status.CREATED:
+            return None
+
+        item.status = Status.PROCESSING
+        stmt = (
+            self.table.update()
+            .where(self._get_field_filter("id", uid))
+            .where(self._get_field_filter("status", Status.CREATED))
+            .values(fields=self._serialize_fields(item))
+        )
+        if session.execute(stmt).rowcount == 0:
+            return None
+        return item
+
     @as_result(StashException)
     def get_by_status(
         self, credentials: SyftVerifyKey, status: Status
@@ -30,6 +30,12 @@ WORKER_TIMEOUT_SEC = 60
 # Duration (in seconds) after which producer without a heartbeat will be marked as expired
 PRODUCER_TIMEOUT_SEC = 60
 
+# Duration (in seconds) between two recovery sweeps of the queue stash by the producer
+QUEUE_SWEEP_INTERVAL_SEC = 5
+
+# Duration (in seconds) after which a queue item that could not be dispatched yet is retried
+QUEUE_RETRY_INTERVAL_SEC = 1
+
 # Lock for working on ZMQ socket
 ZMQ_SOCKET_LOCK = threading.Lock()
 
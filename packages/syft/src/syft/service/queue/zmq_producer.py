@@ -1,11 +1,11 @@
 # stdlib
 from binascii import hexlify
-import itertools
 import logging
 import sys
 import threading
 from threading import Event
-from time import sleep
+import time
+import traceback
 from typing import Any
 
 # third party
@@ -25,10 +25,15 @@ from ..service import AbstractService
 from ..worker.worker_pool import ConsumerState
 from ..worker.worker_stash import WorkerStash
 from .base_queue import QueueProducer
+from .base_queue import register_local_producer
+from .base_queue import unregister_local_producer
 from .queue_stash import ActionQueueItem
+from .queue_stash import QueueItem
 from .queue_stash import QueueStash
 from .queue_stash import Status
 from .zmq_common import HEARTBEAT_INTERVAL_SEC
+from .zmq_common import QUEUE_RETRY_INTERVAL_SEC
+from .zmq_common import QUEUE_SWEEP_INTERVAL_SEC
 from .zmq_common import Service
 from .zmq_common import THREAD_TIMEOUT_SEC
 from .zmq_common import Timeout
@@ -60,6 +65,9 @@ class ZMQProducer(QueueProducer):
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = Event()
+        self._items_available = Event()
+        self._new_items: list[QueueItem] = []
+        self._new_items_lock = threading.Lock()
         self.post_init()
 
     @property
@@ -85,6 +93,9 @@ class ZMQProducer(QueueProducer):
 
     def close(self) -> None:
         self._stop.set()
+        self._items_available.set()
+        if (server := getattr(self.auth_context, "server", None)) is not None:
+            unregister_local_producer(server.id, self)
         try:
             if self.thread:
                 self.thread.join(THREAD_TIMEOUT_SEC)
@@ -150,79 +161,111 @@ class ZMQProducer(QueueProducer):
                     return True
         return value
 
+    def notify(self, queue_item: QueueItem) -> None:
+        """Hand a newly created QueueItem to the producer thread."""
+        with self._new_items_lock:
+            self._new_items.append(queue_item)
+        self._items_available.set()
+
+    def get_items_to_queue(self) -> list[QueueItem]:
+        items = self.queue_stash.get_by_status(
+            self.queue_stash.root_verify_key,
+            status=Status.CREATED,
+        ).unwrap()
+        return [] if items is None else items
+
+    @as_result(SyftException)
+    def queue_item(self, item: QueueItem) -> bool:
+        """Append `item` to the requests of its worker pool.
+
+        Returns False if the item cannot be dispatched yet, True once it is dispatched,
+        also when that happened earlier from another copy of the item.
+        """
+        # TODO: if resolving fails, set queueitem to errored, and jobitem as well
+        if isinstance(item, ActionQueueItem):
+            action = item.kwargs["action"]
+            if (
+                self.contains_unresolved_action_objects(action.args).unwrap()
+                or self.contains_unresolved_action_objects(action.kwargs).unwrap()
+            ):
+                return False
+
+        worker_pool = item.worker_pool.resolve_with_context(self.auth_context).unwrap()
+        service_name = worker_pool.name
+        service: Service | None = self.services.get(service_name)
+
+        # Skip adding message if corresponding service/pool
+        # is not registered.
+        if service is None:
+            return False
+
+        # TODO: Logic to evaluate the CAN RUN Condition
+        # the same item can be handed over by `notify` and by a sweep, or retried
+        # from a stale copy, only the claim that moves it out of CREATED dispatches it
+        claimed = self.queue_stash.claim(item.syft_client_verify_key, item.id).unwrap(
+            public_message=f"failed to update queue item {item}"
+        )
+        if claimed is None:
+            return True
+
+        # append request message to the corresponding service
+        # This list is processed in dispatch method.
+        service.requests.append(serialize(claimed, to_bytes=True))
+        return True
+
     def read_items(self) -> None:
+        """Queue new items as soon as they are created.
+
+        Items are handed over by `notify`. The queue stash is only swept every
+        QUEUE_SWEEP_INTERVAL_SEC to recover items created by other processes or
+        missed notifications, and items that could not be dispatched yet are
+        retried every QUEUE_RETRY_INTERVAL_SEC.
+        """
+        # TODO: evaluate the retry condition of items in the PROCESSING state.
+        # If job running and timeout or job status is KILL
+        # or heartbeat fails
+        # or container id doesn't exists, kill process or container
+        # else decrease retry count and mark status as CREATED.
+        deferred: dict[UID, QueueItem] = {}
+        next_sweep = 0.0
         while True:
+            timeout: float = QUEUE_RETRY_INTERVAL_SEC
+            if not deferred:
+                timeout = max(next_sweep - time.monotonic(), 0)
+            self._items_available.wait(timeout)
+            self._items_available.clear()
             if self._stop.is_set():
                 break
-            try:
-                sleep(1)
-
-                # Items to be queued
-                items_to_queue = self.queue_stash.get_by_status(
-                    self.queue_stash.root_verify_key,
-                    status=Status.CREATED,
-                ).unwrap()
 
-                items_to_queue = [] if items_to_queue is None else items_to_queue
+            with self._new_items_lock:
+                new_items, self._new_items = self._new_items, []
 
-                # Queue Items that are in the processing state
-                items_processing = self.queue_stash.get_by_status(
-                    self.queue_stash.root_verify_key,
-                    status=Status.PROCESSING,
-                ).unwrap()
-
-                items_processing = [] if items_processing is None else items_processing
-
-                for item in itertools.chain(items_to_queue, items_processing):
-                    # TODO: if resolving fails, set queueitem to errored, and jobitem as well
-                    if item.status == Status.CREATED:
-                        if isinstance(item, ActionQueueItem):
-                            action = item.kwargs["action"]
-                            if (
-                                self.contains_unresolved_action_objects(
-                                    action.args
-                                ).unwrap()
-                                or self.contains_unresolved_action_objects(
-                                    action.kwargs
-                                ).unwrap()
-                            ):
-                                continue
-
-                        msg_bytes = serialize(item, to_bytes=True)
-                        worker_pool = item.worker_pool.resolve_with_context(
-                            self.auth_context
-                        ).unwrap()
-                        service_name = worker_pool.name
-                        service: Service | None = self.services.get(service_name)
-
-                        # Skip adding message if corresponding service/pool
-                        # is not registered.
-                        if service is None:
-                            continue
-
-                        # append request message to the corresponding service
-                        # This list is processed in dispatch method.
-
-                        # TODO: Logic to evaluate the CAN RUN Condition
-                        item.status = Status.PROCESSING
-                        self.queue_stash.update(
-                            item.syft_client_verify_key, item
-                        ).unwrap(public_message=f"failed to update queue item {item}")
-                        service.requests.append(msg_bytes)
-                    elif item.status == Status.PROCESSING:
-                        # Evaluate Retry condition here
-                        # If job running and timeout or job status is KILL
-                        # or heartbeat fails
-                        # or container id doesn't exists, kill process or container
-                        # else decrease retry count and mark status as CREATED.
-                        pass
+            items: dict[UID, QueueItem] = {}
+            try:
+                if time.monotonic() >= next_sweep:
+                    # the stash has the latest state of the deferred items
+                    items = {item.id: item for item in self.get_items_to_queue()}
+                    next_sweep = time.monotonic() + QUEUE_SWEEP_INTERVAL_SEC
+                else:
+                    items = deferred
             except Exception as e:
-                # stdlib
-                import traceback
-
                 print(e, traceback.format_exc(), file=sys.stderr)
-                item.status = Status.ERRORED
-                self.queue_stash.update(item.syft_client_verify_key, item).unwrap()
+                items = deferred
+
+            for item in new_items:
+                items.setdefault(item.id, item)
+
+            deferred = {}
+            for item in items.values():
+                if item.status != Status.CREATED:
+                    continue
+                try:
+                    if not self.queue_item(item).unwrap():
+                        deferred[item.id] = item
+                except Exception as e:
+                    print(e, traceback.format_exc(), file=sys.stderr)
+                    item.status = Status.ERRORED
+                    self.queue_stash.update(item.syft_client_verify_key, item).unwrap()
 
     def run(self) -> None:
         self.thread = threading.Thread(target=self._run)
@@ -231,6 +274,9 @@ class ZMQProducer(QueueProducer):
         self.producer_thread = threading.Thread(target=self.read_items)
         self.producer_thread.start()
 
+        if (server := getattr(self.auth_context, "server", None)) is not None:
+            register_local_producer(server.id, self)
+
     def send(self, worker: bytes, message: bytes | list[bytes]) -> None:
         worker_obj = self.require_worker(worker)
         self.send_to_worker(worker_obj, ZMQCommand.W_REQUEST, message)
@@ -1,5 +1,6 @@
 # stdlib
 import logging
+from typing import Any
 
 # relative
 from ...serde.serializable import serializable
@@ -14,6 +15,7 @@ from ..notification.email_templates import EmailTemplate
 from ..notification.email_templates import RequestEmailTemplate
 from ..notification.email_templates import RequestUpdateEmailTemplate
 from ..notification.notification_service import CreateNotification
+from ..notification.notifications import Notification
 from ..notifier.notifier_enums import NOTIFIERS
 from ..notifier.notifier_service import RateLimitException
 from ..response import SyftSuccess
@@ -21,6 +23,7 @@ from ..service import AbstractService
 from ..service import SERVICE_TO_TYPES
 from ..service import TYPE_TO_SERVICE
 from ..service import service_method
+from ..user.user import UserView
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
@@ -56,6 +59,7 @@ class RequestService(AbstractService):
             context.credentials,
             request,
         ).unwrap()
+        self._store_status(context, request)
 
         root_verify_key = context.server.services.user.root_verify_key
 
@@ -81,65 +85,114 @@ class RequestService(AbstractService):
         path="request.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL
     )
     def get_all(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
-
+        return self.stash.get_all_sorted(context.credentials).unwrap()
+
+    def _store_status(
+        self, context: AuthedServiceContext, request: Request
+    ) -> RequestStatus | None:
+        """Store the status of `request` in the index of the stash, and return it.
+
+        The status of requests for low side code depends on the status and the outputs
+        of the code, instead of on the request itself. It is not stored, and None is returned.
+        """
+        try:
+            if request.get_is_l0_deployment(context):
+                return None
+        except SyftException:
+            return None
+        status = request.get_status(context)
+        self.stash.set_status(request.id, status).unwrap()
+        return status
+
+    def _get_all_with_status(
+        self, context: AuthedServiceContext, status: RequestStatus
+    ) -> list[Request]:
+        requests = []
+        for request, request_status in self.stash.get_all_with_status(
+            context.credentials, status=status
+        ).unwrap():
+            if request_status is None:
+                request_status = self._store_status(
+                    context, request
+                ) or request.get_status(context)
+            if request_status == status:
+                requests.append(request)
         return requests
 
-    # DIRTY METHOD: DELETE AFTER DATABASE UPGRADE
     @service_method(
         path="request.get_all_approved",
         name="get_all_approved",
         roles=DATA_SCIENTIST_ROLE_LEVEL,
     )
     def get_all_approved(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests = [
-            request
-            for request in requests
-            if request.get_status(context) == RequestStatus.APPROVED
-        ]
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
+        return self._get_all_with_status(context, RequestStatus.APPROVED)
 
-        return requests
-
-    # DIRTY METHOD: DELETE AFTER DATABASE UPGRADE
     @service_method(
         path="request.get_all_rejected",
         name="get_all_rejected",
         roles=DATA_SCIENTIST_ROLE_LEVEL,
     )
     def get_all_rejected(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests = [
-            request
-            for request in requests
-            if request.get_status(context) == RequestStatus.REJECTED
-        ]
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
+        return self._get_all_with_status(context, RequestStatus.REJECTED)
 
-        return requests
-
-    # DIRTY METHOD: DELETE AFTER DATABASE UPGRADE
     @service_method(
         path="request.get_all_pending",
         name="get_all_pending",
         roles=DATA_SCIENTIST_ROLE_LEVEL,
     )
     def get_all_pending(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests = [
-            request
+        return self._get_all_with_status(context, RequestStatus.PENDING)
+
+    def _get_infos(
+        self, context: AuthedServiceContext, requests: list[Request]
+    ) -> list[RequestInfo]:
+        """Get the information of `requests`, skipping requests without a notification."""
+        if not requests:
+            return []
+
+        user_service = context.server.services.user
+        # we are bypassing permissions here, like UserService.get_by_verify_key
+        users = user_service.stash.get_all_by_verify_keys(
+            user_service.root_verify_key,
+            list({request.requesting_user_verify_key for request in requests}),
+        ).unwrap()
+        user_views = {user.verify_key: user.to(UserView) for user in users}
+
+        notification_stash = context.server.services.notification.stash
+        notifications: dict[UID, Notification] = {}
+        for notification in notification_stash.get_all_for_linked_obj_uids(
+            context.credentials, [request.id for request in requests]
+        ).unwrap():
+            # like NotificationService.filter_by_obj, keep the first notification
+            notifications.setdefault(notification.linked_obj.object_uid, notification)  # type: ignore
+
+        return [
+            RequestInfo(
+                user=user_views[request.requesting_user_verify_key],
+                request=request,
+                message=notifications[request.id],
+            )
             for request in requests
-            if request.get_status(context) == RequestStatus.PENDING
+            if request.requesting_user_verify_key in user_views
+            and request.id in notifications
         ]
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
 
-        return requests
+    def _get_info_page(
+        self,
+        context: AuthedServiceContext,
+        page_index: int | None,
+        page_size: int | None,
+        after: UID | None,
+        filters: dict[str, Any] | None = None,
+    ) -> list[RequestInfo]:
+        requests = self.stash.get_all_sorted(
+            context.credentials,
+            filters=filters,
+            limit=page_size or None,
+            offset=(page_index or 0) * (page_size or 0),
+            after=after,
+        ).unwrap()
+        return self._get_infos(context, requests)
 
     @service_method(path="request.get_all_info", name="get_all_info")
     def get_all_info(
@@ -147,29 +200,18 @@ class RequestService(AbstractService):
         context: AuthedServiceContext,
         page_index: int | None = 0,
         page_size: int | None = 0,
+        after: UID | None = None,
     ) -> list[list[RequestInfo]] | list[RequestInfo]:
-        """Get the information of all requests"""
-        result = self.stash.get_all(context.credentials).unwrap()
-        requests: list[RequestInfo] = []
-        for req in result:
-            user = context.server.services.user.get_by_verify_key(
-                req.requesting_user_verify_key
-            ).unwrap()
-            message = context.server.services.notification.filter_by_obj(
-                context=context, obj_uid=req.id
-            ).unwrap()
-            requests.append(RequestInfo(user=user, request=req, notification=message))
-        if not page_size:
-            return requests
-
-        # If chunk size is defined, then split list into evenly sized chunks
-        chunked_requests: list[list[RequestInfo]] = [
-            requests[i : i + page_size] for i in range(0, len(requests), page_size)
-        ]
-        if page_index:
-            return chunked_requests[page_index]
-        else:
-            return chunked_requests
+        """Get the information of all requests, newest first.
+
+        A page is selected with `page_index`, or with `after`, the id of the last
+        request of the previous page. Without either, all pages are returned.
+        """
+        if page_size and not page_index and after is None:
+            return _split_pages(
+                self._get_info_page(context, None, None, None), page_size
+            )
+        return self._get_info_page(context, page_index, page_size, after)
 
     @service_method(path="request.add_changes", name="add_changes")
     def add_changes(
@@ -188,25 +230,22 @@ class RequestService(AbstractService):
         request_filter: RequestInfoFilter,
         page_index: int | None = 0,
         page_size: int | None = 0,
+        after: UID | None = None,
     ) -> list[RequestInfo]:
         """Filter Request"""
-        result = self.get_all_info(context)
-
-        requests = list(
-            filter(lambda res: (request_filter.name in res.user.name), result)
-        )
-
-        # TODO: Move chunking to a function?
-        # If chunk size is defined, then split list into evenly sized chunks
-        if page_size:
-            requests = [
-                requests[i : i + page_size] for i in range(0, len(requests), page_size)
+        user_service = context.server.services.user
+        users = user_service.stash.get_all(user_service.root_verify_key).unwrap()
+        filters = {
+            "requesting_user_verify_key__in": [
+                user.verify_key for user in users if request_filter.name in user.name
             ]
-            if page_index is not None:
-                # Return the proper slice using chunk_index
-                requests = requests[page_index]
+        }
 
-        return requests
+        if page_size and page_index is None and after is None:
+            return _split_pages(
+                self._get_info_page(context, None, None, None, filters), page_size
+            )  # type: ignore
+        return self._get_info_page(context, page_index, page_size, after, filters)
 
     @service_method(path="request.apply", name="apply", unwrap_on_success=False)
     def apply(
@@ -281,7 +320,9 @@ class RequestService(AbstractService):
         return SyftSuccess(message=f"Request {uid} successfully denied!")
 
     def save(self, context: AuthedServiceContext, request: Request) -> Request:
-        return self.stash.update(context.credentials, request).unwrap()
+        request = self.stash.update(context.credentials, request).unwrap()
+        self._store_status(context, request)
+        return request
 
     @service_method(
         path="request.delete_by_uid", name="delete_by_uid", unwrap_on_success=False
@@ -313,5 +354,9 @@ class RequestService(AbstractService):
         return self.stash.get_by_usercode_id(context.credentials, usercode_id).unwrap()
 
 
+def _split_pages(infos: list[RequestInfo], page_size: int) -> list[list[RequestInfo]]:
+    return [infos[i : i + page_size] for i in range(0, len(infos), page_size)]
+
+
 TYPE_TO_SERVICE[Request] = RequestService
 SERVICE_TO_TYPES[RequestService].update({Request})
@@ -1,15 +1,248 @@
+# stdlib
+from typing import Any
+
+# third party
+from pydantic import ValidationError
+import sqlalchemy as sa
+from sqlalchemy import Column
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
+from ...store.db.db import DBManager
+from ...store.db.schema import UIDTypeDecorator
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import parse_filters
+from ...store.db.stash import with_session
+from ...store.document_store_errors import NotFoundException
+from ...store.document_store_errors import StashException
+from ...store.document_store_errors import UniqueConstraintException
 from ...types.errors import SyftException
 from ...types.result import as_result
 from ...types.uid import UID
 from .request import Request
+from .request import RequestStatus
+
+
+def create_request_index_table(table_name: str, metadata: MetaData) -> Table:
+    """Create the table holding the request time and status of the requests in `table_name`."""
+    name = f"{table_name}_index"
+    if name not in metadata.tables:
+        Table(
+            name,
+            metadata,
+            Column("request_id", UIDTypeDecorator, primary_key=True),
+            Column("request_time", sa.Float, nullable=False, index=True),
+            # NULL if the status is not known, or depends on objects other than the request
+            Column("status", sa.String(32), index=True),
+        )
+    return metadata.tables[name]
 
 
 @serializable(canonical_name="RequestStashSQL", version=1)
 class RequestStash(ObjectStash[Request]):
+    """Stash for Requests, with an index of their request time and status.
+
+    The index is used to sort, filter and paginate requests in the database.
+    Every write of a request, also with `set_many` and `upsert_many`, clears
+    its status in the index, the status is stored again with `set_status`.
+    """
+
+    def __init__(self, store: DBManager) -> None:
+        super().__init__(store)
+        self.index_table = create_request_index_table(
+            self.table.name, self.table.metadata
+        )
+        # requests stored before the index existed are added on the first read
+        self._index_complete = False
+
+    def _write_index(self, requests: list[Request], session: Session) -> None:
+        if not requests:
+            return
+        session.execute(
+            self.index_table.delete().where(
+                self.index_table.c.request_id.in_([request.id for request in requests])
+            )
+        )
+        session.execute(
+            self.index_table.insert(),
+            [
+                {
+                    "request_id": request.id,
+                    "request_time": request.request_time.utc_timestamp,
+                    "status": None,
+                }
+                for request in requests
+            ],
+        )
+
+    def _complete_index(self, session: Session) -> None:
+        if self._index_complete:
+            return
+        missing = select(
+            self.table.c.id,
+            self.table.c.fields["request_time"].as_float(),
+        ).where(self.table.c.id.not_in(select(self.index_table.c.request_id)))
+        session.execute(
+            self.index_table.insert().from_select(
+                ["request_id", "request_time"], missing
+            )
+        )
+        self._index_complete = True
+
+    @as_result(SyftException, StashException)
+    @with_session
+    def set(self, *args: Any, session: Session = None, **kwargs: Any) -> Request:
+        request = super().set(*args, session=session, **kwargs).unwrap()
+        self._write_index([request], session=session)
+        return request
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        AttributeError,
+        ValidationError,
+        UniqueConstraintException,
+    )
+    @with_session
+    def update(self, *args: Any, session: Session = None, **kwargs: Any) -> Request:
+        request = super().update(*args, session=session, **kwargs).unwrap()
+        self._write_index([request], session=session)
+        return request
+
+    @as_result(SyftException, StashException)
+    @with_session
+    def set_many(
+        self, *args: Any, session: Session = None, **kwargs: Any
+    ) -> list[Request]:
+        requests = super().set_many(*args, session=session, **kwargs).unwrap()
+        self._write_index(requests, session=session)
+        return requests
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        UniqueConstraintException,
+    )
+    @with_session
+    def upsert_many(
+        self, *args: Any, session: Session = None, **kwargs: Any
+    ) -> list[Request]:
+        requests = super().upsert_many(*args, session=session, **kwargs).unwrap()
+        self._write_index(requests, session=session)
+        return requests
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def delete_by_uid(self, *args: Any, session: Session = None, **kwargs: Any) -> UID:
+        uid = super().delete_by_uid(*args, session=session, **kwargs).unwrap()
+        session.execute(
+            self.index_table.delete().where(self.index_table.c.request_id == uid)
+        )
+        return uid
+
+    @as_result(StashException)
+    @with_session
+    def set_status(
+        self, uid: UID, status: RequestStatus, session: Session = None
+    ) -> None:
+        """Store the status of a request, until the request is written again."""
+        session.execute(
+            self.index_table.update()
+            .where(self.index_table.c.request_id == uid)
+            .values(status=status.name)
+        )
+
+    @as_result(StashException)
+    @with_session
+    def get_all_with_status(
+        self,
+        credentials: SyftVerifyKey,
+        status: RequestStatus | None = None,
+        filters: dict[str, Any] | None = None,
+        has_permission: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+        after: UID | None = None,
+        session: Session = None,
+    ) -> list[tuple[Request, RequestStatus | None]]:
+        """
+        Get requests with their stored status, newest first.
+
+        Args:
+            credentials (SyftVerifyKey): credentials of the user
+            status (RequestStatus | None, optional): If provided, only requests with this
+                status or without a stored status are returned. Defaults to None.
+            filters (dict[str, Any] | None, optional): filters on the request fields,
+                like in `get_all`. Defaults to None.
+            has_permission (bool, optional): If True, overrides the permission check.
+                Defaults to False.
+            limit (int | None, optional): limit the number of results. Defaults to None.
+            offset (int, optional): offset the results. Defaults to 0.
+            after (UID | None, optional): If provided, only requests older than the request
+                with this id are returned. Defaults to None.
+
+        Returns:
+            list[tuple[Request, RequestStatus | None]]: requests and their stored status,
+                which is None if it is not known.
+        """
+        self._complete_index(session=session)
+        index = self.index_table
+        query = self.query()
+
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+
+        for field_name, operator, field_value in parse_filters(filters):
+            query = query.filter(field_name, operator, field_value)
+
+        stmt = query.stmt.join(index, index.c.request_id == self.table.c.id)
+        stmt = stmt.add_columns(index.c.status.label("_request_status"))
+        if status is not None:
+            stmt = stmt.where(
+                sa.or_(index.c.status == status.name, index.c.status.is_(None))
+            )
+        if after is not None:
+            after_time = (
+                select(index.c.request_time)
+                .where(index.c.request_id == after)
+                .scalar_subquery()
+            )
+            stmt = stmt.where(
+                sa.or_(
+                    index.c.request_time < after_time,
+                    sa.and_(
+                        index.c.request_time == after_time,
+                        index.c.request_id < after,
+                    ),
+                )
+            )
+        stmt = stmt.order_by(index.c.request_time.desc(), index.c.request_id.desc())
+        stmt = stmt.limit(limit).offset(offset)
+
+        return [
+            (
+                self.row_as_obj(row),
+                RequestStatus[row._request_status] if row._request_status else None,
+            )
+            for row in session.execute(stmt).all()
+        ]
+
+    @as_result(StashException)
+    def get_all_sorted(
+        self, credentials: SyftVerifyKey, **kwargs: Any
+    ) -> list[Request]:
+        """Get requests newest first, see `get_all_with_status`."""
+        return [
+            request
+            for request, _ in self.get_all_with_status(credentials, **kwargs).unwrap()
+        ]
+
     @as_result(SyftException)
     def get_all_for_verify_key(
         self,
@@ -1,6 +1,7 @@
 # relative
 from ...serde.serializable import serializable
 from ...store.db.stash import ObjectStash
+from ...types.uid import UID
 from ...util.telemetry import instrument
 from .settings import ServerSettings
 
@@ -8,4 +9,6 @@ from .settings import ServerSettings
 @instrument
 @serializable(canonical_name="SettingsStashSQL", version=1)
 class SettingsStash(ObjectStash[ServerSettings]):
-    pass
+    def _after_write(self, uids: list[UID]) -> None:
+        # clear the settings cached by Server.get_settings
+        self.db.settings_cache.invalidate()
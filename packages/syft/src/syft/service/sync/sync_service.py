@@ -1,5 +1,7 @@
 # stdlib
 from collections import defaultdict
+from datetime import datetime
+from datetime import timedelta
 import logging
 from typing import Any
 
@@ -7,6 +9,7 @@ from typing import Any
 from ...client.api import ServerIdentity
 from ...serde.serializable import serializable
 from ...store.db.db import DBManager
+from ...store.db.schema import utcnow
 from ...store.db.stash import ObjectStash
 from ...store.document_store_errors import NotFoundException
 from ...store.linked_obj import LinkedObject
@@ -37,6 +40,18 @@ from .sync_state import SyncState
 
 logger = logging.getLogger(__name__)
 
+# NOTE Jobs are handled separately
+SERVICES_TO_SYNC = [
+    "requestservice",
+    "usercodeservice",
+    "usercodestatusservice",
+    "apiservice",
+]
+
+# Changes cursors overlap with the previous window by this much, so objects written
+# by transactions that were still in flight when the cursor was taken are not missed
+SYNC_CURSOR_OVERLAP = timedelta(seconds=5)
+
 
 def get_store(context: AuthedServiceContext, item: SyncableSyftObject) -> ObjectStash:
     return get_store_by_type(context=context, obj_type=type(item))
@@ -297,13 +312,15 @@ class SyncService(AbstractService):
     def _get_all_items_for_jobs(
         self,
         context: AuthedServiceContext,
+        jobs: list[Job] | None = None,
     ) -> tuple[list[SyncableSyftObject], dict[UID, str]]:
         """
-        Returns all Jobs, along with their Logs, ExecutionOutputs and ActionObjects
+        Returns all Jobs (or `jobs`), along with their Logs, ExecutionOutputs and ActionObjects
         """
         items_for_jobs: list[SyncableSyftObject] = []
         errors = {}
-        jobs = context.server.services.job.get_all(context)
+        if jobs is None:
+            jobs = context.server.services.job.get_all(context)
 
         for job in jobs:
             try:
@@ -353,15 +370,7 @@ class SyncService(AbstractService):
     ) -> tuple[list[SyncableSyftObject], dict[UID, str]]:
         all_items: list[SyncableSyftObject] = []
 
-        # NOTE Jobs are handled separately
-        services_to_sync = [
-            "requestservice",
-            "usercodeservice",
-            "usercodestatusservice",
-            "apiservice",
-        ]
-
-        for service_name in services_to_sync:
+        for service_name in SERVICES_TO_SYNC:
             service = context.server.get_service(service_name)
             items = service.get_all(context)
             all_items.extend(items)
@@ -373,6 +382,83 @@ class SyncService(AbstractService):
 
         return (all_items, errors)
 
+    @as_result(SyftException)
+    def get_syncable_items_changed_since(
+        self,
+        context: AuthedServiceContext,
+        since: datetime,
+        action_ids: list[UID] | None = None,
+    ) -> tuple[list[SyncableSyftObject], dict[UID, str]]:
+        """
+        Returns the syncable items created or updated after `since`.
+
+        Jobs are returned with their whole batch, a Job is also returned when its Log or
+        ExecutionOutput changed. ActionObjects outside these batches are only returned
+        if they are in `action_ids`.
+        """
+        credentials = context.credentials
+        changed_items: list[SyncableSyftObject] = []
+        for service_name in SERVICES_TO_SYNC:
+            stash = context.server.get_service(service_name).stash
+            changed_items.extend(
+                stash.get_all(credentials, updated_since=since).unwrap()
+            )
+
+        services = context.server.services
+        jobs = services.job.stash.get_all(credentials, updated_since=since).unwrap()
+        job_ids = {job.id for job in jobs}
+        logs = services.log.stash.get_all(credentials, updated_since=since).unwrap()
+        outputs = services.output.stash.get_all(
+            credentials, updated_since=since
+        ).unwrap()
+        batch_job_ids = {log.job_id for log in logs} | {
+            output.job_id for output in outputs if output.job_id is not None
+        }
+        missing_job_ids = list(batch_job_ids - job_ids)
+        if missing_job_ids:
+            jobs += services.job.stash.get_all(
+                credentials, filters={"id__in": missing_job_ids}
+            ).unwrap()
+
+        items_for_jobs, errors = self._get_all_items_for_jobs(
+            context, jobs=jobs
+        ).unwrap()
+        changed_items.extend(items_for_jobs)
+
+        if action_ids:
+            returned_ids = {item.id.id for item in items_for_jobs}
+            changed_action_objects = services.action.stash.get_all(
+                credentials,
+                filters={
+                    "id__in": [uid for uid in action_ids if uid not in returned_ids]
+                },
+                updated_since=since,
+            ).unwrap()
+            for action_object in changed_action_objects:
+                # same as in the job batch, get it through the service
+                changed_items.append(services.action.get(context, action_object.id))
+
+        return (changed_items, errors)
+
+    @as_result(SyftException)
+    def get_syncable_ids_deleted_since(
+        self, context: AuthedServiceContext, since: datetime
+    ) -> list[UID]:
+        services = context.server.services
+        stashes = [
+            context.server.get_service(service_name).stash
+            for service_name in SERVICES_TO_SYNC
+        ] + [
+            services.job.stash,
+            services.log.stash,
+            services.output.stash,
+            services.action.stash,
+        ]
+        deleted_ids: list[UID] = []
+        for stash in stashes:
+            deleted_ids.extend(stash.get_deleted_since(since).unwrap())
+        return deleted_ids
+
     @as_result(SyftException)
     def build_current_state(
         self,
@@ -454,3 +540,42 @@ class SyncService(AbstractService):
     )
     def _get_state(self, context: AuthedServiceContext) -> SyncState:
         return self.build_current_state(context).unwrap()
+
+    @service_method(
+        path="sync._get_state_changes",
+        name="_get_state_changes",
+        roles=ADMIN_ROLE_LEVEL,
+    )
+    def _get_state_changes(
+        self,
+        context: AuthedServiceContext,
+        since: datetime | None = None,
+        action_ids: list[UID] | None = None,
+    ) -> tuple[SyncState, list[UID], datetime]:
+        """
+        Get the state of the objects changed after the `since` cursor.
+
+        Returns a SyncState with only the changed objects and their unfiltered
+        dependencies, the ids of the deleted objects, and the cursor for the next call.
+        Without `since` all objects are returned. `action_ids` are the ActionObjects the
+        caller already has, they are returned again when they changed.
+        Use `SyncState.apply_changes` to merge the result into the previous state.
+        """
+        cursor = utcnow() - SYNC_CURSOR_OVERLAP
+
+        if since is None:
+            objects, errors = self.get_all_syncable_items(context).unwrap()
+            deleted_ids = []
+        else:
+            objects, errors = self.get_syncable_items_changed_since(
+                context, since, action_ids
+            ).unwrap()
+            deleted_ids = self.get_syncable_ids_deleted_since(context, since).unwrap()
+
+        state = self.build_current_state(context, include_items=False).unwrap()
+        state.permissions, state.storage_permissions = self.get_permissions(
+            context, objects
+        )
+        state.errors = errors
+        state.add_objects(objects, context, filter_dependencies=False)
+        return state, deleted_ids, cursor
@@ -178,7 +178,10 @@ class SyncState(SyftObject):
         return diff.status
 
     def add_objects(
-        self, objects: list[SyncableSyftObject], context: AuthedServiceContext
+        self,
+        objects: list[SyncableSyftObject],
+        context: AuthedServiceContext,
+        filter_dependencies: bool = True,
     ) -> None:
         for obj in objects:
             if isinstance(obj.id, LineageID):
@@ -191,20 +194,66 @@ class SyncState(SyftObject):
         # TODO might get slow with large states,
         # need to build dependencies every time to not have UIDs
         # in dependencies that are not in objects
-        self._build_dependencies(context=context)
+        self._build_dependencies(
+            context=context, filter_dependencies=filter_dependencies
+        )
 
-    def _build_dependencies(self, context: AuthedServiceContext) -> None:
+    def _build_dependencies(
+        self, context: AuthedServiceContext, filter_dependencies: bool = True
+    ) -> None:
         self.dependencies = {}
 
         all_ids = self.all_ids
         for obj in self.objects.values():
             if hasattr(obj, "get_sync_dependencies"):
                 deps = obj.get_sync_dependencies(context=context)
-                deps = [d.id for d in deps if d.id in all_ids]  # type: ignore
+                deps = [
+                    d.id  # type: ignore
+                    for d in deps
+                    if not filter_dependencies or d.id in all_ids  # type: ignore
+                ]
                 # TODO: Why is this en check here? here?
                 if len(deps):
                     self.dependencies[obj.id.id] = deps
 
+    def apply_changes(
+        self, changes: "SyncState", deleted_ids: list[UID]
+    ) -> "SyncState":
+        """Return a new state with the objects changed and deleted since this state applied.
+
+        `changes` is a state with only the changed objects, as returned by
+        `sync._get_state_changes`. Both states keep unfiltered dependencies,
+        use `filter_dependencies` on the result before diffing it.
+        """
+        stale_ids = set(deleted_ids) | changes.all_ids
+
+        def merge(current: dict, changed: dict) -> dict:
+            merged = {k: v for k, v in current.items() if k not in stale_ids}
+            merged.update(changed)
+            return merged
+
+        return changes.model_copy(
+            update={
+                "objects": merge(self.objects, changes.objects),
+                "dependencies": merge(self.dependencies, changes.dependencies),
+                "permissions": merge(self.permissions, changes.permissions),
+                "storage_permissions": merge(
+                    self.storage_permissions, changes.storage_permissions
+                ),
+                "errors": merge(self.errors, changes.errors),
+            }
+        )
+
+    def filter_dependencies(self) -> "SyncState":
+        """Return a copy without dependencies on objects that are not in this state."""
+        all_ids = self.all_ids
+        dependencies = {}
+        for uid, deps in self.dependencies.items():
+            deps = [dep for dep in deps if dep in all_ids]
+            if len(deps):
+                dependencies[uid] = deps
+        return self.model_copy(update={"dependencies": dependencies})
+
     @property
     def rows(self) -> list[SyncStateRow]:
         result = []
@@ -6,12 +6,17 @@ from ...store.db.stash import ObjectStash
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.result import as_result
+from ...types.uid import UID
 from .user import User
 from .user_roles import ServiceRole
 
 
 @serializable(canonical_name="UserStashSQL", version=1)
 class UserStash(ObjectStash[User]):
+    def _after_write(self, uids: list[UID]) -> None:
+        # a new user may be cached as a guest, an updated user may have a new role or key
+        self.db.role_cache.invalidate()
+
     @as_result(StashException, NotFoundException)
     def admin_user(self) -> User:
         # TODO: This returns only one user, the first user with the role ADMIN
@@ -89,3 +94,12 @@ class UserStash(ObjectStash[User]):
         except NotFoundException as exc:
             private_msg = f"User with verify key {verify_key} not found"
             raise NotFoundException.from_exception(exc, private_message=private_msg)
+
+    @as_result(StashException)
+    def get_all_by_verify_keys(
+        self, credentials: SyftVerifyKey, verify_keys: list[SyftVerifyKey]
+    ) -> list[User]:
+        return self.get_all(
+            credentials=credentials,
+            filters={"verify_key__in": verify_keys},
+        ).unwrap()
@@ -38,6 +38,9 @@ Read/retrieve SyftObject from blob storage
 - get a BlobRetrieval from the id of the BlobStorageEntry of the SyftObject
   `blob_retrieval = api.services.blob_storage.read(blob_storage_entry_id)`
 - use `BlobRetrieval.read` to retrieve the SyftObject `syft_object = blob_retrieval.read()`
+- or read a byte range of the blob without retrieving all of it
+  `data = blob_retrieval.read(offset=offset, length=length)`, or server side with
+  `api.services.blob_storage.read_range(blob_storage_entry_id, offset=offset, length=length)`
 """
 
 # stdlib
@@ -98,10 +101,20 @@ class SyftObjectRetrieval(BlobRetrieval):
     syft_object: bytes
 
     def _read_data(
-        self, stream: bool = False, _deserialize: bool = True, **kwargs: Any
+        self,
+        stream: bool = False,
+        _deserialize: bool = True,
+        offset: int = 0,
+        length: int | None = None,
+        **kwargs: Any,
     ) -> Any:
         # development setup, we can access the same filesystem
-        if not _deserialize:
+        validate_byte_range(offset, length)
+        if is_byte_range(offset, length):
+            # part of a serialized object can not be deserialized
+            end = None if length is None else offset + length
+            res = self.syft_object[offset:end]
+        elif not _deserialize:
             res = self.syft_object
         else:
             res = deserialize(self.syft_object, from_bytes=True)
@@ -112,8 +125,29 @@ class SyftObjectRetrieval(BlobRetrieval):
         else:
             return res
 
-    def read(self, _deserialize: bool = True) -> SyftObject:
-        return self._read_data(_deserialize=_deserialize)
+    def read(
+        self, _deserialize: bool = True, offset: int = 0, length: int | None = None
+    ) -> SyftObject:
+        """Read the object, or `length` bytes from `offset` of its serialized form."""
+        return self._read_data(_deserialize=_deserialize, offset=offset, length=length)
+
+
+def validate_byte_range(offset: int = 0, length: int | None = None) -> None:
+    if offset < 0 or (length is not None and length < 0):
+        raise SyftException(
+            public_message=f"Invalid byte range: offset={offset}, length={length}"
+        )
+
+
+def is_byte_range(offset: int = 0, length: int | None = None) -> bool:
+    """Whether `offset` and `length` select part of a blob, instead of all of it."""
+    return offset > 0 or length is not None
+
+
+def range_header(offset: int = 0, length: int | None = None) -> dict[str, str]:
+    """HTTP Range header for `length` bytes from `offset`, or up to the end."""
+    end = "" if length is None else str(offset + length - 1)
+    return {"Range": f"bytes={offset}-{end}"}
 
 
 def syft_iter_content(
@@ -121,11 +155,16 @@ def syft_iter_content(
     chunk_size: int,
     max_retries: int = MAX_RETRIES,
     timeout: int = DEFAULT_TIMEOUT,
+    offset: int = 0,
+    length: int | None = None,
 ) -> Generator:
     """Custom iter content with smart retries (start from last byte read)"""
-    current_byte = 0
+    if length == 0:
+        return
+    current_byte = offset
     for attempt in range(max_retries):
-        headers = {"Range": f"bytes={current_byte}-"}
+        remaining = None if length is None else length - (current_byte - offset)
+        headers = range_header(current_byte, remaining)
         try:
             with requests.get(
                 str(blob_url), stream=True, headers=headers, timeout=(timeout, timeout)
@@ -155,7 +194,11 @@ class BlobRetrievalByURL(BlobRetrieval):
     url: ServerURL | str
     proxy_server_uid: UID | None = None
 
-    def read(self) -> SyftObject:
+    def read(self, offset: int = 0, length: int | None = None) -> SyftObject:
+        """Read the object, or `length` bytes from `offset` of the blob."""
+        validate_byte_range(offset, length)
+        if is_byte_range(offset, length):
+            return self._read_data(offset=offset, length=length)
         if self.type_ is BlobFileType:
             return BlobFile(
                 file_name=self.file_name,
@@ -172,11 +215,17 @@ class BlobRetrievalByURL(BlobRetrieval):
         stream: bool = False,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         *args: Any,
+        _deserialize: bool = True,
+        offset: int = 0,
+        length: int | None = None,
         **kwargs: Any,
     ) -> Any:
         # relative
         from ...client.api import APIRegistry
 
+        validate_byte_range(offset, length)
+        byte_range = is_byte_range(offset, length)
+        iter_range = byte_range and stream
         api = self.get_api_wrapped()
 
         if api.is_ok() and api.unwrap().connection and isinstance(self.url, ServerURL):
@@ -197,16 +246,22 @@ class BlobRetrievalByURL(BlobRetrieval):
             is_blob_file = self.type_ is not None and issubclass(
                 self.type_, BlobFileType
             )
-            if is_blob_file and stream:
-                return syft_iter_content(blob_url, chunk_size)
+            if (is_blob_file and stream) or iter_range:
+                return syft_iter_content(
+                    blob_url, chunk_size, offset=offset, length=length
+                )
+            if length == 0:
+                return b""
 
-            response = requests.get(str(blob_url), stream=stream)  # nosec
+            headers = range_header(offset, length) if byte_range else None
+            response = requests.get(str(blob_url), stream=stream, headers=headers)  # nosec
             resp_content = response.content
             response.raise_for_status()
 
+            # part of a serialized object can not be deserialized
             return (
                 resp_content
-                if is_blob_file
+                if is_blob_file or byte_range or not _deserialize
                 else deserialize(resp_content, from_bytes=True)
             )
         except requests.RequestException as e:
@@ -240,6 +295,11 @@ class BlobStorageConnection:
     def read(self, fp: SecureFilePathLocation, type_: type | None) -> BlobRetrieval:
         raise NotImplementedError
 
+    def read_range(
+        self, fp: SecureFilePathLocation, offset: int = 0, length: int | None = None
+    ) -> bytes:
+        raise NotImplementedError
+
     def allocate(self, obj: CreateBlobStorageEntry) -> SecureFilePathLocation:
         raise NotImplementedError
 
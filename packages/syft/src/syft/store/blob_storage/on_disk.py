@@ -1,5 +1,6 @@
 # stdlib
 from io import BytesIO
+import mmap
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +15,7 @@ from . import BlobStorageClientConfig
 from . import BlobStorageConfig
 from . import BlobStorageConnection
 from . import SyftObjectRetrieval
+from . import validate_byte_range
 from ...serde.serializable import serializable
 from ...service.response import SyftSuccess
 from ...types.blob_storage import BlobStorageEntry
@@ -66,6 +68,24 @@ class OnDiskBlobStorageConnection(BlobStorageConnection):
             type_=type_,
         )
 
+    def read_range(
+        self,
+        fp: SecureFilePathLocation,
+        offset: int = 0,
+        length: int | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        validate_byte_range(offset, length)
+        with open(self._base_directory / fp.path, "rb") as f:
+            # only the pages of the range are read from disk
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = len(mm) if length is None else offset + length
+                    return mm[offset:end]
+            except ValueError:
+                # empty files can not be mapped
+                return b""
+
     def allocate(self, obj: CreateBlobStorageEntry) -> SecureFilePathLocation:
         try:
             return SecureFilePathLocation(
@@ -1,9 +1,9 @@
 # stdlib
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import logging
 import math
-from queue import Queue
 import threading
 from typing import Any
 
@@ -14,9 +14,12 @@ from botocore.client import ClientError as BotoClientError
 from botocore.client import Config
 from botocore.exceptions import ConnectionError
 import requests
+from tenacity import Retrying
 from tenacity import retry
 from tenacity import retry_if_exception_type
+from tenacity import stop_after_attempt
 from tenacity import stop_after_delay
+from tenacity import wait_exponential
 from tenacity import wait_fixed
 from tqdm import tqdm
 from typing_extensions import Self
@@ -44,16 +47,50 @@ from ...types.uid import UID
 from ...util.constants import DEFAULT_TIMEOUT
 from ...util.telemetry import instrument_botocore
 
-MAX_QUEUE_SIZE = 100
 WRITE_EXPIRATION_TIME = 900  # seconds
-DEFAULT_FILE_PART_SIZE = 1024**3  # 1GB
+# files are split into parts that are uploaded concurrently, aim for TARGET_FILE_PARTS
+# parts within the part sizes S3 accepts (at least 5MB for all but the last part)
+TARGET_FILE_PARTS = 16
+MIN_FILE_PART_SIZE = 1024**2 * 16  # 16MB
+MAX_FILE_PART_SIZE = 1024**3  # 1GB
 DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 800  # 800KB
+DEFAULT_UPLOAD_CONCURRENCY = 4
+UPLOAD_PART_ATTEMPTS = 3
 
 logger = logging.getLogger(__name__)
 
 instrument_botocore()
 
 
+def get_part_size(file_size: int) -> int:
+    part_size = math.ceil(file_size / TARGET_FILE_PARTS)
+    return min(max(part_size, MIN_FILE_PART_SIZE), MAX_FILE_PART_SIZE)
+
+
+def iter_part(
+    data: BytesIO,
+    lock: threading.Lock,
+    offset: int,
+    size: int,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+) -> Generator[bytes, None, None]:
+    """Read `size` bytes from `offset` of a stream shared by concurrent readers, in chunks.
+
+    Non-seekable streams are read from their current position.
+    """
+    seekable = data.seekable()
+    n_read = 0
+    while n_read < size:
+        with lock:
+            if seekable:
+                data.seek(offset + n_read)
+            chunk = data.read(min(chunk_size, size - n_read))
+        if not chunk:
+            break
+        n_read += len(chunk)
+        yield chunk
+
+
 @serializable()
 class SeaweedFSBlobDeposit(BlobDeposit):
     __canonical_name__ = "SeaweedFSBlobDeposit"
@@ -64,105 +101,92 @@ class SeaweedFSBlobDeposit(BlobDeposit):
     proxy_server_uid: UID | None = None
 
     @as_result(SyftException)
-    def write(self, data: BytesIO) -> SyftSuccess:
+    def write(
+        self, data: BytesIO, concurrency: int = DEFAULT_UPLOAD_CONCURRENCY
+    ) -> SyftSuccess:
+        """Upload `data` to the presigned part urls, `concurrency` parts at a time.
+
+        Parts are read from `data` by offset, so they can be uploaded concurrently and
+        retried. Streams that are not seekable are uploaded one part after the other,
+        without retries.
+        """
         # relative
         api = self.get_api_wrapped()
+        connection = api.unwrap().connection if api.is_ok() else None
+
+        blob_urls = []
+        for url in self.urls:
+            if connection is None:
+                blob_urls.append(url)
+            elif self.proxy_server_uid is None:
+                blob_urls.append(
+                    connection.to_blob_route(url.url_path, host=url.host_or_ip)
+                )
+            else:
+                blob_urls.append(
+                    connection.stream_via(self.proxy_server_uid, url.url_path)
+                )
 
-        etags = []
-
-        try:
-            no_lines = 0
-            # this loops over the parts, we have multiple parts to allow for
-            # concurrent uploads of a single file. (We are currently not using that)
-            # a part may for instance be 5GB
-            # parts are then splitted into chunks which are MBs (order of magnitude)
-            part_size = math.ceil(self.size / len(self.urls))
-            chunk_size = DEFAULT_UPLOAD_CHUNK_SIZE
-
-            # this is the total nr of chunks in all parts
-            total_iterations = math.ceil(part_size / chunk_size) * len(self.urls)
-
-            with tqdm(
-                total=total_iterations,
-                desc=f"Uploading progress",  # noqa
-                colour="green",
-            ) as pbar:
-                for part_no, url in enumerate(
-                    self.urls,
-                    start=1,
+        seekable = data.seekable()
+        if not seekable:
+            concurrency = 1
+        lock = threading.Lock()
+        part_size = math.ceil(self.size / len(self.urls))
+        chunk_size = DEFAULT_UPLOAD_CHUNK_SIZE
+
+        with tqdm(
+            total=math.ceil(self.size / chunk_size),
+            desc=f"Uploading progress",  # noqa
+            colour="green",
+        ) as pbar:
+
+            def upload_part(part_no: int, blob_url: ServerURL) -> tuple[str, int]:
+                offset = (part_no - 1) * part_size
+                no_lines = 0
+
+                def chunks() -> Generator[bytes, None, None]:
+                    nonlocal no_lines
+                    no_lines = 0
+                    for chunk in iter_part(data, lock, offset, part_size, chunk_size):
+                        no_lines += chunk.count(b"\n")
+                        pbar.update(1)
+                        yield chunk
+
+                for attempt in Retrying(
+                    stop=stop_after_attempt(UPLOAD_PART_ATTEMPTS if seekable else 1),
+                    wait=wait_exponential(multiplier=0.5, max=10),
+                    retry=retry_if_exception_type(requests.RequestException),
+                    reraise=True,
                 ):
-                    if api.is_ok() and api.unwrap().connection is not None:
-                        api = api.unwrap()
-                        if self.proxy_server_uid is None:
-                            blob_url = api.connection.to_blob_route(  # type: ignore [union-attr]
-                                url.url_path, host=url.host_or_ip
-                            )
-                        else:
-                            blob_url = api.connection.stream_via(  # type: ignore [union-attr]
-                                self.proxy_server_uid, url.url_path
-                            )
-                    else:
-                        blob_url = url
-
-                    # read a chunk untill we have read part_size
-                    class PartGenerator:
-                        def __init__(self) -> None:
-                            self.no_lines = 0
-
-                        def async_generator(
-                            self, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE
-                        ) -> Generator:
-                            item_queue: Queue = Queue(maxsize=MAX_QUEUE_SIZE)
-                            threading.Thread(
-                                target=self.add_chunks_to_queue,
-                                kwargs={"queue": item_queue, "chunk_size": chunk_size},
-                                daemon=True,
-                            ).start()
-                            item = item_queue.get()
-                            while item != 0:
-                                yield item
-                                pbar.update(1)
-                                item = item_queue.get()
-
-                        def add_chunks_to_queue(
-                            self,
-                            queue: Queue,
-                            chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
-                        ) -> None:
-                            """Creates a data geneator for the part"""
-                            n = 0
-
-                            try:
-                                while n * chunk_size <= part_size:
-                                    chunk = data.read(chunk_size)
-                                    if not chunk:
-                                        break
-                                    self.no_lines += chunk.count(b"\n")
-                                    n += 1
-                                    queue.put(chunk)
-                            except BlockingIOError:
-                                pass
-                            # if end of file or part, stop
-                            queue.put(0)
-
-                    gen = PartGenerator()
-
-                    response = requests.put(
-                        url=str(blob_url),
-                        data=gen.async_generator(chunk_size),
-                        timeout=DEFAULT_TIMEOUT,
-                        stream=True,
+                    with attempt:
+                        response = requests.put(
+                            url=str(blob_url),
+                            data=chunks(),
+                            timeout=DEFAULT_TIMEOUT,
+                            stream=True,
+                        )
+                        response.raise_for_status()
+                return response.headers["ETag"], no_lines
+
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(concurrency, len(blob_urls)))
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            upload_part, range(1, len(blob_urls) + 1), blob_urls
+                        )
                     )
+            except requests.RequestException as e:
+                raise SyftException(
+                    public_message=f"Failed to upload file to SeaweedFS - {e}"
+                )
 
-                    response.raise_for_status()
-                    no_lines += gen.no_lines
-                    etag = response.headers["ETag"]
-                    etags.append({"ETag": etag, "PartNumber": part_no})
-
-        except requests.RequestException as e:
-            raise SyftException(
-                public_message=f"Failed to upload file to SeaweedFS - {e}"
-            )
+        etags = [
+            {"ETag": etag, "PartNumber": part_no}
+            for part_no, (etag, _) in enumerate(results, start=1)
+        ]
+        no_lines = sum(part_no_lines for _, part_no_lines in results)
 
         mark_write_complete_method = from_api_or_context(
             func_or_path="blob_storage.mark_write_complete",
@@ -262,6 +286,19 @@ class SeaweedFSConnection(BlobStorageConnection):
         # that decides whether to use a direct connection to azure/aws/gcp or via seaweed
         return fp.generate_url(self, type_, bucket_name)
 
+    def read_range(
+        self,
+        fp: SecureFilePathLocation,
+        offset: int = 0,
+        length: int | None = None,
+        bucket_name: str | None = None,
+    ) -> bytes:
+        # a ranged GET on the presigned url, which also covers remotely mounted files.
+        # The bytes are returned as stored, also if the range is the whole blob
+        return self.read(fp, None, bucket_name=bucket_name)._read_data(
+            offset=offset, length=length, _deserialize=False
+        )
+
     def allocate(self, obj: CreateBlobStorageEntry) -> SecureFilePathLocation:
         try:
             file_name = obj.file_name
@@ -277,7 +314,7 @@ class SeaweedFSConnection(BlobStorageConnection):
             )
 
     def write(self, obj: BlobStorageEntry) -> BlobDeposit:
-        total_parts = math.ceil(obj.file_size / DEFAULT_FILE_PART_SIZE)
+        total_parts = max(1, math.ceil(obj.file_size / get_part_size(obj.file_size)))
 
         urls = [
             ServerURL.from_url(
@@ -1,6 +1,7 @@
 # stdlib
 import logging
 from pathlib import Path
+from typing import Any
 from typing import Generic
 from typing import TypeVar
 from urllib.parse import urlparse
@@ -14,13 +15,30 @@ from sqlalchemy.orm import sessionmaker
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...types.uid import UID
+from ...util.cache import StatsCache
 from ...util.telemetry import instrument_sqlalchemny
 from .schema import PostgresBase
 from .schema import SQLiteBase
+from .schema import migrate_json_permissions
+from .schema import migrate_updated_at
 
 logger = logging.getLogger(__name__)
 instrument_sqlalchemny()
 
+# roles and settings are read on every API call and rarely written, they are cached
+# in-process. Writes in this process invalidate the caches, writes in other processes
+# (e.g. queue consumers) are picked up when the entries expire.
+ROLE_CACHE_MAXSIZE = 1024
+ROLE_CACHE_TTL_SEC = 10
+SETTINGS_CACHE_TTL_SEC = 10
+# the SyftAPI of each user, the user code and custom endpoint stashes invalidate it
+API_CACHE_MAXSIZE = 256
+API_CACHE_TTL_SEC = 10
+# clients of the peers messages are forwarded to, the peer health check evicts the
+# clients of unhealthy peers
+PEER_CLIENT_CACHE_MAXSIZE = 128
+PEER_CLIENT_CACHE_TTL_SEC = 600
+
 
 @serializable(canonical_name="DBConfig", version=1)
 class DBConfig(BaseModel):
@@ -70,16 +88,41 @@ class DBManager(Generic[ConfigT]):
         )
         logger.info(f"Connecting to {config.connection_string}")
         self.sessionmaker = sessionmaker(bind=self.engine)
+        self.role_cache: StatsCache = StatsCache(
+            maxsize=ROLE_CACHE_MAXSIZE, ttl=ROLE_CACHE_TTL_SEC
+        )
+        self.settings_cache: StatsCache = StatsCache(
+            maxsize=1, ttl=SETTINGS_CACHE_TTL_SEC
+        )
+        self.api_cache: StatsCache = StatsCache(
+            maxsize=API_CACHE_MAXSIZE, ttl=API_CACHE_TTL_SEC
+        )
+        self.peer_client_cache: StatsCache = StatsCache(
+            maxsize=PEER_CLIENT_CACHE_MAXSIZE, ttl=PEER_CLIENT_CACHE_TTL_SEC
+        )
         self.update_settings()
         logger.info(f"Successfully connected to {config.connection_string}")
 
     def update_settings(self) -> None:
         pass
 
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            "role": self.role_cache.stats(),
+            "settings": self.settings_cache.stats(),
+            "api": self.api_cache.stats(),
+            "peer_client": self.peer_client_cache.stats(),
+        }
+
     def init_tables(self, reset: bool = False) -> None:
         Base = SQLiteBase if self.engine.dialect.name == "sqlite" else PostgresBase
 
-        with self.sessionmaker().begin() as _:
+        with self.sessionmaker.begin() as session:
             if reset:
                 Base.metadata.drop_all(bind=self.engine)
+                self.role_cache.invalidate()
+                self.settings_cache.invalidate()
+                self.api_cache.invalidate()
             Base.metadata.create_all(self.engine)
+            migrate_updated_at(session, Base.metadata)
+            migrate_json_permissions(session, Base.metadata)
@@ -1,6 +1,7 @@
 # stdlib
 from abc import ABC
 from abc import abstractmethod
+from datetime import datetime
 import enum
 from typing import Any
 from typing import Literal
@@ -28,11 +29,46 @@ from ...types.uid import UID
 from .errors import StashDBException
 from .schema import PostgresBase
 from .schema import SQLiteBase
+from .schema import get_permissions_table
+
+
+def make_permissions_clause(
+    table: Table,
+    permission: ActionObjectPermission,
+    object_id: Any = None,
+) -> sa.sql.elements.ColumnElement:
+    """Filter rows of `table` on which `permission` is granted, either to the user or to everyone.
+
+    The clause is an EXISTS subquery on the permissions table of `table`, which is served by
+    the (verify_key, permission, object_id) index. If object_id is None, the subquery is
+    correlated to the id of the outer row.
+    """
+    permissions_table = get_permissions_table(table)
+    verify_key = (
+        permission.credentials.verify if permission.credentials is not None else ""
+    )
+    compound_permission = permission.compound_permission_string
+    object_id = table.c.id if object_id is None else object_id
+
+    return sa.exists().where(
+        permissions_table.c.object_id == object_id,
+        sa.or_(
+            sa.and_(
+                permissions_table.c.verify_key == verify_key,
+                permissions_table.c.permission == permission.permission.name,
+            ),
+            sa.and_(
+                permissions_table.c.verify_key == "",
+                permissions_table.c.permission == compound_permission,
+            ),
+        ),
+    )
 
 
 class FilterOperator(enum.Enum):
     EQ = "eq"
     CONTAINS = "contains"
+    IN = "in"
 
 
 class Query(ABC):
@@ -110,6 +146,7 @@ class Query(ABC):
         example usage:
         Query(User).filter("name", "eq", "Alice")
         Query(User).filter("friends", "contains", "Bob")
+        Query(User).filter("name", "in", ["Alice", "Bob"])
 
         Args:
             field (str): Field to filter on
@@ -199,6 +236,14 @@ class Query(ABC):
             return self._eq_filter(table, field, value)
         elif operator == FilterOperator.CONTAINS:
             return self._contains_filter(table, field, value)
+        elif operator == FilterOperator.IN:
+            return self._in_filter(table, field, value)
+
+    def updated_since(self, since: datetime) -> Self:
+        """Only include objects that were created or updated after `since`."""
+        # `migrate_updated_at` backfills `_updated_at`, so the index can be used
+        self.stmt = self.stmt.where(self.table.c._updated_at > since)
+        return self
 
     def order_by(
         self,
@@ -264,12 +309,11 @@ class Query(ABC):
         self.stmt = self.stmt.offset(offset)
         return self
 
-    @abstractmethod
     def _make_permissions_clause(
         self,
         permission: ActionObjectPermission,
-    ) -> sa.sql.elements.BinaryExpression:
-        pass
+    ) -> sa.sql.elements.ColumnElement:
+        return make_permissions_clause(self.table, permission)
 
     @abstractmethod
     def _contains_filter(
@@ -280,6 +324,15 @@ class Query(ABC):
     ) -> sa.sql.elements.BinaryExpression:
         pass
 
+    @abstractmethod
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        values: list[Any],
+    ) -> sa.sql.elements.BinaryExpression:
+        pass
+
     def _get_column(self, column: str) -> Column:
         if column == "id":
             return self.table.c.id
@@ -294,17 +347,6 @@ class Query(ABC):
 
 
 class SQLiteQuery(Query):
-    def _make_permissions_clause(
-        self,
-        permission: ActionObjectPermission,
-    ) -> sa.sql.elements.BinaryExpression:
-        permission_string = permission.permission_string
-        compound_permission_string = permission.compound_permission_string
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
-        )
-
     def _get_table(self, object_type: type[SyftObject]) -> Table:
         cname = object_type.__canonical_name__
         if cname not in SQLiteBase.metadata.tables:
@@ -336,18 +378,23 @@ class SQLiteQuery(Query):
         json_value = serialize_json(value)
         return table.c.fields[field] == func.json_quote(json_value)
 
-
-class PostgresQuery(Query):
-    def _make_permissions_clause(
-        self, permission: ActionObjectPermission
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        values: list[Any],
     ) -> sa.sql.elements.BinaryExpression:
-        permission_string = [permission.permission_string]
-        compound_permission_string = [permission.compound_permission_string]
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
-        )
+        if field == "id":
+            return table.c.id.in_([UID(value) for value in values])
 
+        if "." in field:
+            field = field.split(".")  # type: ignore
+
+        json_values = [func.json_quote(serialize_json(value)) for value in values]
+        return table.c.fields[field].in_(json_values)
+
+
+class PostgresQuery(Query):
     def _contains_filter(
         self,
         table: Table,
@@ -381,3 +428,18 @@ class PostgresQuery(Query):
         json_value = serialize_json(value)
         # NOTE: there might be a bug with casting everything to text
         return table.c.fields[field].astext == sa.cast(json_value, sa.Text)
+
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        values: list[Any],
+    ) -> sa.sql.elements.BinaryExpression:
+        if field == "id":
+            return table.c.id.in_([UID(value) for value in values])
+
+        if "." in field:
+            field = field.split(".")  # type: ignore
+
+        json_values = [sa.cast(serialize_json(value), sa.Text) for value in values]
+        return table.c.fields[field].astext.in_(json_values)
@@ -1,22 +1,34 @@
 # stdlib
 
 # stdlib
+from datetime import datetime
+from datetime import timezone
+from typing import Any
 import uuid
 
 # third party
 import sqlalchemy as sa
 from sqlalchemy import Column
 from sqlalchemy import Dialect
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import MetaData
 from sqlalchemy import Table
 from sqlalchemy import TypeDecorator
+from sqlalchemy import func
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Session
 from sqlalchemy.types import JSON
 
 # relative
 from ...types.syft_object import SyftObject
 from ...types.uid import UID
 
+# number of rows moved per statement when migrating JSON permissions
+MIGRATION_BATCH_SIZE = 1000
+
 
 class SQLiteBase(DeclarativeBase):
     pass
@@ -41,6 +53,81 @@ class UIDTypeDecorator(TypeDecorator):
             return UID(value)
 
 
+def utcnow() -> datetime:
+    # naive UTC, like the CURRENT_TIMESTAMP server default of `_created_at`
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def permissions_table_name(table_name: str) -> str:
+    return f"{table_name}_permissions"
+
+
+def tombstones_table_name(table_name: str) -> str:
+    return f"{table_name}_tombstones"
+
+
+def permission_string_to_row(uid: UID, permission_string: str) -> dict[str, Any]:
+    """Split an ActionObjectPermission.permission_string into a permissions table row.
+
+    Compound permissions (e.g. ALL_READ) are not tied to a user, they are stored with
+    an empty verify_key so they can be part of the primary key. So are permissions
+    created without credentials, whose permission string is just the permission.
+    """
+    if permission_string.startswith("ALL_") or "_" not in permission_string:
+        verify_key, permission = "", permission_string
+    else:
+        verify_key, permission = permission_string.split("_", 1)
+    return {"object_id": uid, "permission": permission, "verify_key": verify_key}
+
+
+def row_to_permission_string(permission: str, verify_key: str) -> str:
+    if verify_key:
+        return f"{verify_key}_{permission}"
+    return permission
+
+
+def create_permissions_table(table_name: str, metadata: MetaData) -> Table:
+    """Create the permissions table for an object table.
+
+    Every row grants a single permission on a single object, either to one user or,
+    for compound permissions, to everyone. The primary key serves lookups by object,
+    the secondary index serves permission-filtered reads by user.
+    """
+    name = permissions_table_name(table_name)
+    if name not in metadata.tables:
+        Table(
+            name,
+            metadata,
+            Column(
+                "object_id",
+                UIDTypeDecorator,
+                ForeignKey(f"{table_name}.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            Column("permission", sa.String, primary_key=True),
+            Column("verify_key", sa.String, primary_key=True, default=""),
+            Index(f"ix_{name}_lookup", "verify_key", "permission", "object_id"),
+        )
+    return metadata.tables[name]
+
+
+def create_tombstones_table(table_name: str, metadata: MetaData) -> Table:
+    """Create the tombstones table for an object table.
+
+    Objects are hard deleted, a tombstone records when an object was deleted so
+    incremental readers can learn about the deletion.
+    """
+    name = tombstones_table_name(table_name)
+    if name not in metadata.tables:
+        Table(
+            name,
+            metadata,
+            Column("id", UIDTypeDecorator, primary_key=True),
+            Column("_deleted_at", sa.DateTime, default=utcnow, index=True),
+        )
+    return metadata.tables[name]
+
+
 def create_table(
     object_type: type[SyftObject],
     dialect: Dialect,
@@ -71,6 +158,8 @@ def create_table(
             Base.metadata,
             Column("id", UIDTypeDecorator, primary_key=True, default=uuid.uuid4),
             Column("fields", fields_type, default={}),
+            # NOTE: permissions are stored in the permissions table, this column is
+            # only kept to migrate databases created before it was introduced.
             Column("permissions", permissions_type, default=[]),
             Column(
                 "storage_permissions",
@@ -80,8 +169,120 @@ def create_table(
             Column(
                 "_created_at", sa.DateTime, server_default=sa.func.now(), index=True
             ),
-            Column("_updated_at", sa.DateTime, server_onupdate=sa.func.now()),
+            Column(
+                "_updated_at", sa.DateTime, default=utcnow, onupdate=utcnow, index=True
+            ),
             Column("_deleted_at", sa.DateTime, index=True),
         )
+    create_permissions_table(table_name, Base.metadata)
+    create_tombstones_table(table_name, Base.metadata)
 
     return Base.metadata.tables[table_name]
+
+
+def get_permissions_table(table: Table) -> Table:
+    return table.metadata.tables[permissions_table_name(table.name)]
+
+
+def get_tombstones_table(table: Table) -> Table:
+    return table.metadata.tables[tombstones_table_name(table.name)]
+
+
+def insert_ignore_duplicates(table: Table, dialect_name: str) -> sa.Insert:
+    insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+    return insert(table).on_conflict_do_nothing()
+
+
+def insert_or_update(
+    table: Table, dialect_name: str, update_columns: list[str]
+) -> sa.Insert:
+    """INSERT ... ON CONFLICT (primary key) DO UPDATE, only updating `update_columns` of existing rows."""
+    insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+    stmt = insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=list(table.primary_key.columns),
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+
+
+def migrate_updated_at(session: Session, metadata: MetaData) -> None:
+    """Add the indexed `_updated_at` column to tables created before it was maintained.
+
+    `create_all` only creates missing tables, so existing tables get the column and its
+    index here, and rows without `_updated_at` are backfilled from `_created_at`.
+    """
+    connection = session.connection()
+    quote = connection.dialect.identifier_preparer.quote
+    inspector = sa.inspect(connection)
+
+    for table in list(metadata.tables.values()):
+        if permissions_table_name(table.name) not in metadata.tables:
+            continue
+
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        if "_updated_at" not in columns:
+            column_type = table.c._updated_at.type.compile(dialect=connection.dialect)
+            session.execute(
+                sa.text(
+                    f"ALTER TABLE {quote(table.name)} "
+                    f"ADD COLUMN _updated_at {column_type}"
+                )
+            )
+        for index in table.indexes:
+            if "_updated_at" in index.columns:
+                index.create(connection, checkfirst=True)
+
+        session.execute(
+            table.update()
+            .where(table.c._updated_at.is_(None))
+            .values(_updated_at=table.c._created_at)
+        )
+
+
+def migrate_json_permissions(session: Session, metadata: MetaData) -> None:
+    """Move permissions from the legacy JSON `permissions` column to the permissions tables.
+
+    Rows are emptied after migrating, so running this on an up-to-date database only
+    costs one query per table.
+    """
+    dialect_name = session.get_bind().dialect.name
+    json_array_length = (
+        func.json_array_length if dialect_name == "sqlite" else func.jsonb_array_length
+    )
+
+    for table in list(metadata.tables.values()):
+        name = permissions_table_name(table.name)
+        if name not in metadata.tables:
+            continue
+
+        last_id: UID | None = None
+        while True:
+            # page through the rows by id, so only one batch is held in memory
+            stmt = (
+                sa.select(table.c.id, table.c.permissions)
+                .where(json_array_length(table.c.permissions) > 0)
+                .order_by(table.c.id)
+                .limit(MIGRATION_BATCH_SIZE)
+            )
+            if last_id is not None:
+                stmt = stmt.where(table.c.id > last_id)
+            batch = session.execute(stmt).all()
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            permission_rows = [
+                permission_string_to_row(row.id, permission_string)
+                for row in batch
+                for permission_string in row.permissions
+            ]
+            session.execute(
+                insert_ignore_duplicates(metadata.tables[name], dialect_name),
+                permission_rows,
+            )
+            session.execute(
+                table.update()
+                .where(table.c.id.in_([row.id for row in batch]))
+                # keep _updated_at, so migrated rows don't show up as changed in sync
+                .values(permissions=[], _updated_at=table.c._updated_at)
+            )
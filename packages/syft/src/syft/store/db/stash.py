@@ -1,5 +1,7 @@
 # stdlib
+from collections import defaultdict
 from collections.abc import Callable
+from datetime import datetime
 from functools import wraps
 import inspect
 from typing import Any
@@ -14,6 +16,7 @@ from pydantic import ValidationError
 import sqlalchemy as sa
 from sqlalchemy import Row
 from sqlalchemy import Table
+from sqlalchemy import event
 from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -45,9 +48,17 @@ from ..document_store_errors import StashException
 from ..document_store_errors import UniqueConstraintException
 from .db import DBManager
 from .query import Query
+from .query import make_permissions_clause
 from .schema import PostgresBase
 from .schema import SQLiteBase
 from .schema import create_table
+from .schema import get_permissions_table
+from .schema import get_tombstones_table
+from .schema import insert_ignore_duplicates
+from .schema import insert_or_update
+from .schema import permission_string_to_row
+from .schema import row_to_permission_string
+from .schema import utcnow
 from .sqlite import SQLiteDBManager
 
 StashT = TypeVar("StashT", bound=SyftObject)
@@ -105,6 +116,8 @@ class ObjectStash(Generic[StashT]):
         self.db = store
         self.object_type = self.get_object_type()
         self.table = create_table(self.object_type, self.dialect)
+        self.permissions_table = get_permissions_table(self.table)
+        self.tombstones_table = get_tombstones_table(self.table)
         self.sessionmaker: Callable[[], Session] = self.db.sessionmaker
 
     @property
@@ -186,16 +199,10 @@ class ObjectStash(Generic[StashT]):
         if not unique_fields:
             return True
 
-        filters = []
-        for field_name in unique_fields:
-            field_value = getattr(obj, field_name, None)
-            if not is_json_primitive(field_value):
-                raise StashException(
-                    f"Cannot check uniqueness of non-primitive field {field_name}"
-                )
-            if field_value is None:
-                continue
-            filters.append((field_name, "eq", field_value))
+        filters = [
+            (field_name, "eq", field_value)
+            for field_name, field_value in self._get_unique_values(obj).items()
+        ]
 
         query = self.query()
         query = query.filter_or(
@@ -212,6 +219,69 @@ class ObjectStash(Generic[StashT]):
             return res
         return True
 
+    def _get_unique_values(self, obj: StashT) -> dict[str, Any]:
+        values = {}
+        for field_name in self.unique_fields:
+            field_value = getattr(obj, field_name, None)
+            if not is_json_primitive(field_value):
+                raise StashException(
+                    f"Cannot check uniqueness of non-primitive field {field_name}"
+                )
+            if field_value is not None:
+                values[field_name] = field_value
+        return values
+
+    @with_session
+    def _get_unique_conflicts(
+        self, objs: list[StashT], session: Session = None
+    ) -> set[UID]:
+        """Batched version of `is_unique`.
+
+        Returns the ids of all objects that share a unique field value with a stored object
+        or with an earlier object in `objs`. Like `is_unique`, an object never conflicts with
+        the stored object that has the same id.
+        """
+        conflicts: set[UID] = set()
+        batch_values: dict[tuple[str, Any], UID] = {}
+        values_per_field: dict[str, list[Any]] = defaultdict(list)
+        obj_values = []
+
+        for obj in objs:
+            values = {
+                field_name: serialize_json(value)
+                for field_name, value in self._get_unique_values(obj).items()
+            }
+            obj_values.append(values)
+            for field_name, value in values.items():
+                if batch_values.setdefault((field_name, value), obj.id) != obj.id:
+                    conflicts.add(obj.id)
+                values_per_field[field_name].append(value)
+
+        if not values_per_field:
+            return conflicts
+
+        query = self.query().filter_or(
+            *[
+                (field_name, "in", values)
+                for field_name, values in values_per_field.items()
+            ]
+        )
+        stored_values: dict[tuple[str, Any], set[UID]] = defaultdict(set)
+        for row in query.execute(session).all():
+            for field_name in values_per_field:
+                stored_values[(field_name, row.fields.get(field_name))].add(row.id)
+
+        for obj, values in zip(objs, obj_values):
+            for field_name, value in values.items():
+                if stored_values[(field_name, value)] - {obj.id}:
+                    conflicts.add(obj.id)
+        return conflicts
+
+    @with_session
+    def _get_existing_uids(self, uids: list[UID], session: Session = None) -> set[UID]:
+        stmt = select(self.table.c.id).where(self.table.c.id.in_(uids))
+        return set(session.execute(stmt).scalars().all())
+
     @with_session
     def exists(
         self, credentials: SyftVerifyKey, uid: UID, session: Session = None
@@ -239,6 +309,16 @@ class ObjectStash(Generic[StashT]):
             session=session,
         ).unwrap()
 
+    @with_session
+    def _get_many_by_uid(
+        self, credentials: SyftVerifyKey, uids: list[UID], session: Session = None
+    ) -> list[StashT]:
+        objs = self.get_all(
+            credentials, filters={"id__in": uids}, session=session
+        ).unwrap()
+        objs_by_uid = {obj.id: obj for obj in objs}
+        return [objs_by_uid[uid] for uid in uids if uid in objs_by_uid]
+
     def _get_field_filter(
         self,
         field_name: str,
@@ -297,32 +377,39 @@ class ObjectStash(Generic[StashT]):
             # this happens when we create stashes in tests
             return ServiceRole.GUEST
 
-        try:
-            query = self.query(User).filter("verify_key", "eq", credentials)
-        except Exception as e:
-            print("Error getting role", e)
-            raise e
+        def _get_role() -> ServiceRole:
+            try:
+                query = self.query(User).filter("verify_key", "eq", credentials)
+            except Exception as e:
+                print("Error getting role", e)
+                raise e
 
-        user = query.execute(session).first()
-        if user is None:
-            return ServiceRole.GUEST
+            user = query.execute(session).first()
+            if user is None:
+                return ServiceRole.GUEST
+
+            return self.row_as_obj(user).role
 
-        return self.row_as_obj(user).role
+        return self.db.role_cache.get_or_compute(credentials, _get_role)
 
     def _get_permission_filter_from_permisson(
         self,
         permission: ActionObjectPermission,
-    ) -> sa.sql.elements.BinaryExpression:
-        permission_string = permission.permission_string
-        compound_permission_string = permission.compound_permission_string
-
-        if self.db.engine.dialect.name == "postgresql":
-            permission_string = [permission_string]  # type: ignore
-            compound_permission_string = [compound_permission_string]  # type: ignore
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
+        object_id: UID | None = None,
+    ) -> sa.sql.elements.ColumnElement:
+        return make_permissions_clause(self.table, permission, object_id=object_id)
+
+    def _insert_permissions(
+        self, uid: UID, permission_strings: list[str], session: Session
+    ) -> None:
+        if not permission_strings:
+            return None
+        stmt = insert_ignore_duplicates(self.permissions_table, self.dialect.name)
+        session.execute(
+            stmt,
+            [permission_string_to_row(uid, p) for p in permission_strings],
         )
+        return None
 
     @with_session
     def _apply_permission_filter(
@@ -355,6 +442,19 @@ class ObjectStash(Generic[StashT]):
         )
         return stmt
 
+    def _serialize_fields(self, obj: StashT) -> dict[str, Any]:
+        fields = cast(dict[str, Any], serialize_json(obj))
+        try:
+            # check if the fields are deserializable
+            # TODO: Ideally, we want to make sure we don't serialize what we cannot deserialize
+            #       and remove this check.
+            deserialize_json(fields)
+        except Exception as e:
+            raise StashException(
+                f"Error serializing object: {e}. Some fields are invalid."
+            )
+        return fields
+
     @as_result(SyftException, StashException)
     @with_session
     def set(
@@ -394,24 +494,16 @@ class ObjectStash(Generic[StashT]):
                 self.server_uid.no_dash,
             )
 
-        fields = serialize_json(obj)
-        try:
-            # check if the fields are deserializable
-            # TODO: Ideally, we want to make sure we don't serialize what we cannot deserialize
-            #       and remove this check.
-            deserialize_json(fields)
-        except Exception as e:
-            raise StashException(
-                f"Error serializing object: {e}. Some fields are invalid."
-            )
+        fields = self._serialize_fields(obj)
         # create the object with the permissions
         stmt = self.table.insert().values(
             id=uid,
             fields=fields,
-            permissions=permissions,
             storage_permissions=storage_permissions,
         )
         session.execute(stmt)
+        self._insert_permissions(uid, permissions, session=session)
+        self._schedule_after_write([uid], session=session)
         return self.get_by_uid(credentials, uid, session=session).unwrap()
 
     @as_result(ValidationError, AttributeError)
@@ -478,19 +570,14 @@ class ObjectStash(Generic[StashT]):
             has_permission=has_permission,
             session=session,
         )
-        fields = serialize_json(obj)
-        try:
-            deserialize_json(fields)
-        except Exception as e:
-            raise StashException(
-                f"Error serializing object: {e}. Some fields are invalid."
-            )
+        fields = self._serialize_fields(obj)
         stmt = stmt.values(fields=fields)
         result = session.execute(stmt)
         if result.rowcount == 0:
             raise NotFoundException(
                 f"{self.object_type.__name__}: {obj.id} not found or no permission to update."
             )
+        self._schedule_after_write([obj.id], session=session)
         return self.get_by_uid(credentials, obj.id, session=session).unwrap()
 
     @as_result(StashException, NotFoundException)
@@ -515,6 +602,17 @@ class ObjectStash(Generic[StashT]):
             raise NotFoundException(
                 f"{self.object_type.__name__}: {uid} not found or no permission to delete."
             )
+        # SQLite does not enforce the ON DELETE CASCADE foreign key by default
+        session.execute(
+            self.permissions_table.delete().where(
+                self.permissions_table.c.object_id == uid
+            )
+        )
+        session.execute(
+            insert_or_update(self.tombstones_table, self.dialect.name, ["_deleted_at"]),
+            {"id": uid},
+        )
+        self._schedule_after_write([uid], session=session)
         return uid
 
     @as_result(StashException)
@@ -578,6 +676,7 @@ class ObjectStash(Generic[StashT]):
         sort_order: str | None = None,
         limit: int | None = None,
         offset: int = 0,
+        updated_since: datetime | None = None,
         session: Session = None,
     ) -> list[StashT]:
         """
@@ -599,6 +698,8 @@ class ObjectStash(Generic[StashT]):
                 Defaults to None.
             limit (int | None, optional): limit the number of results. Defaults to None.
             offset (int, optional): offset the results. Defaults to 0.
+            updated_since (datetime | None, optional): If provided, only objects created or
+                updated after this (naive UTC) time are returned. Defaults to None.
 
         Returns:
             list[StashT]: list of objects.
@@ -612,10 +713,55 @@ class ObjectStash(Generic[StashT]):
         for field_name, operator, field_value in parse_filters(filters):
             query = query.filter(field_name, operator, field_value)
 
+        if updated_since is not None:
+            query = query.updated_since(updated_since)
+
         query = query.order_by(order_by, sort_order).limit(limit).offset(offset)
         result = query.execute(session).all()
         return [self.row_as_obj(row) for row in result]
 
+    @as_result(StashException)
+    @with_session
+    def get_deleted_since(
+        self, since: datetime | None = None, session: Session = None
+    ) -> list[UID]:
+        """Get the uids of objects deleted after `since` (naive UTC), from their tombstones.
+
+        Objects that were created again after their deletion are not included.
+        """
+        stmt = select(self.tombstones_table.c.id).where(
+            self.tombstones_table.c.id.not_in(select(self.table.c.id))
+        )
+        if since is not None:
+            stmt = stmt.where(self.tombstones_table.c._deleted_at > since)
+        return list(session.execute(stmt).scalars().all())
+
+    def _touch(self, uid: UID, session: Session) -> None:
+        # permissions live in their own table, mark the object itself as updated
+        session.execute(
+            self.table.update()
+            .where(self.table.c.id == uid)
+            .values(_updated_at=utcnow())
+        )
+        self._schedule_after_write([uid], session=session)
+
+    def _after_write(self, uids: list[UID]) -> None:
+        """Called after the objects with `uids` are written, once the write is committed.
+
+        Stashes override it to clear caches or wake up waiters. Running it after the
+        commit keeps other threads from caching the state before the write.
+        """
+
+    def _schedule_after_write(self, uids: list[UID], session: Session) -> None:
+        # most stashes have nothing to do after a write
+        after_write = getattr(self._after_write, "__func__", None)
+        if not uids or after_write is ObjectStash._after_write:
+            return
+        # fires on the commit of the outermost transaction, not on a rollback
+        event.listen(
+            session, "after_commit", lambda _: self._after_write(uids), once=True
+        )
+
     # PERMISSIONS
     def get_ownership_permissions(
         self, uid: UID, credentials: SyftVerifyKey
@@ -635,20 +781,15 @@ class ObjectStash(Generic[StashT]):
         session: Session = None,
         ignore_missing: bool = False,
     ) -> None:
-        try:
-            existing_permissions = self._get_permissions_for_uid(
-                permission.uid, session=session
-            ).unwrap()
-        except NotFoundException:
+        if not self.exists(permission.credentials, permission.uid, session=session):
             if ignore_missing:
                 return None
-            raise
-
-        existing_permissions.add(permission.permission_string)
+            raise NotFoundException(f"No permissions found for uid: {permission.uid}")
 
-        stmt = self.table.update().where(self.table.c.id == permission.uid)
-        stmt = stmt.values(permissions=list(existing_permissions))
-        session.execute(stmt)
+        self._insert_permissions(
+            permission.uid, [permission.permission_string], session=session
+        )
+        self._touch(permission.uid, session=session)
         return None
 
     @as_result(NotFoundException)
@@ -669,20 +810,14 @@ class ObjectStash(Generic[StashT]):
     def remove_permission(
         self, permission: ActionObjectPermission, session: Session = None
     ) -> None:
-        # TODO not threadsafe
-        try:
-            permissions = self._get_permissions_for_uid(permission.uid).unwrap()
-            permissions.remove(permission.permission_string)
-        except (NotFoundException, KeyError):
-            # TODO add error handling to permissions
-            return None
-
-        stmt = (
-            self.table.update()
-            .where(self.table.c.id == permission.uid)
-            .values(permissions=list(permissions))
+        row = permission_string_to_row(permission.uid, permission.permission_string)
+        stmt = self.permissions_table.delete().where(
+            self.permissions_table.c.object_id == row["object_id"],
+            self.permissions_table.c.permission == row["permission"],
+            self.permissions_table.c.verify_key == row["verify_key"],
         )
-        session.execute(stmt)
+        if session.execute(stmt).rowcount:
+            self._touch(permission.uid, session=session)
         return None
 
     @with_session
@@ -700,39 +835,43 @@ class ObjectStash(Generic[StashT]):
     def has_permissions(
         self, permissions: list[ActionObjectPermission], session: Session = None
     ) -> bool:
-        # TODO: we should use a permissions table to check all permissions at once
+        if not permissions:
+            return True
 
         permission_filters = [
-            sa.and_(
-                self._get_field_filter("id", p.uid),
-                self._get_permission_filter_from_permisson(permission=p),
-            )
+            self._get_permission_filter_from_permisson(permission=p, object_id=p.uid)
             for p in permissions
         ]
-
-        stmt = self.table.select().where(
-            sa.and_(
-                *permission_filters,
-            ),
-        )
-        result = session.execute(stmt).first()
-        return result is not None
+        stmt = select(sa.and_(*permission_filters))
+        return bool(session.execute(stmt).scalar())
 
     @as_result(StashException)
     @with_session
     def _get_permissions_for_uid(self, uid: UID, session: Session = None) -> Set[str]:  # noqa: UP006
-        stmt = select(self.table.c.permissions).where(self.table.c.id == uid)
-        result = session.execute(stmt).scalar_one_or_none()
-        if result is None:
+        stmt = select(
+            self.permissions_table.c.permission, self.permissions_table.c.verify_key
+        ).where(self.permissions_table.c.object_id == uid)
+        result = session.execute(stmt).all()
+        if not result and not self.exists(self.root_verify_key, uid, session=session):
             raise NotFoundException(f"No permissions found for uid: {uid}")
-        return set(result)
+        return {row_to_permission_string(*row) for row in result}
 
     @as_result(StashException)
     @with_session
     def get_all_permissions(self, session: Session = None) -> dict[UID, Set[str]]:  # noqa: UP006
-        stmt = select(self.table.c.id, self.table.c.permissions)
-        results = session.execute(stmt).all()
-        return {UID(row.id): set(row.permissions) for row in results}
+        ids = session.execute(select(self.table.c.id)).scalars().all()
+        permissions: dict[UID, Set[str]] = {UID(uid): set() for uid in ids}  # noqa: UP006
+
+        stmt = select(
+            self.permissions_table.c.object_id,
+            self.permissions_table.c.permission,
+            self.permissions_table.c.verify_key,
+        )
+        for row in session.execute(stmt).all():
+            permissions.setdefault(UID(row.object_id), set()).add(
+                row_to_permission_string(row.permission, row.verify_key)
+            )
+        return permissions
 
     # STORAGE PERMISSIONS
     @with_session
@@ -876,3 +1015,190 @@ class ObjectStash(Generic[StashT]):
             return self.update(
                 credentials=credentials, obj=obj, session=session
             ).unwrap()
+
+    @as_result(SyftException, StashException)
+    @with_session
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[StashT],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+        session: Session = None,
+        skip_check_type: bool = False,
+    ) -> list[StashT]:
+        """Insert multiple objects at once.
+
+        Uniqueness is checked for the whole batch in one query, and objects and their
+        permissions are written with one multi-row INSERT each.
+
+        Args:
+            credentials (SyftVerifyKey): credentials of the owner of the new objects.
+            objs (list[StashT]): objects to insert.
+            add_permissions (list[ActionObjectPermission] | None, optional): extra permissions,
+                each is granted on the object with the same uid. Defaults to None.
+            add_storage_permission (bool, optional): add a storage permission for this server.
+                Defaults to True.
+            ignore_duplicates (bool, optional): If True, objects that already exist or violate
+                a unique constraint are skipped instead of raising. Defaults to False.
+            skip_check_type (bool, optional): skip the object type check. Defaults to False.
+
+        Returns:
+            list[StashT]: the inserted objects, in input order.
+        """
+        if not self.allow_any_type and not skip_check_type:
+            for obj in objs:
+                self.check_type(obj, self.object_type).unwrap()
+
+        if not objs:
+            return []
+
+        # ids that are already taken, either in the database or earlier in the batch
+        taken_uids = self._get_existing_uids([obj.id for obj in objs], session=session)
+        conflicts = self._get_unique_conflicts(objs, session=session)
+
+        new_objs = []
+        for obj in objs:
+            if obj.id not in taken_uids and obj.id not in conflicts:
+                new_objs.append(obj)
+            taken_uids.add(obj.id)
+
+        if len(new_objs) != len(objs) and not ignore_duplicates:
+            unique_fields_str = ", ".join(self.unique_fields)
+            raise UniqueConstraintException(
+                public_message=f"Duplication Key Error for "
+                f"{len(objs) - len(new_objs)} {self.object_type.__name__} objects.\n"
+                f"The fields that should be unique are {unique_fields_str}."
+            )
+        if not new_objs:
+            return []
+
+        extra_permissions: dict[UID, list[str]] = defaultdict(list)
+        for permission in add_permissions or []:
+            extra_permissions[permission.uid].append(permission.permission_string)
+
+        storage_permissions = []
+        if add_storage_permission:
+            storage_permissions.append(self.server_uid.no_dash)
+
+        rows = [
+            {
+                "id": obj.id,
+                "fields": self._serialize_fields(obj),
+                "storage_permissions": storage_permissions,
+            }
+            for obj in new_objs
+        ]
+        permission_rows = [
+            permission_string_to_row(obj.id, permission_string)
+            for obj in new_objs
+            for permission_string in self.get_ownership_permissions(obj.id, credentials)
+            + extra_permissions[obj.id]
+        ]
+
+        if ignore_duplicates:
+            stmt = insert_ignore_duplicates(self.table, self.dialect.name)
+        else:
+            stmt = self.table.insert()
+        # objects inserted concurrently since the uniqueness check are skipped,
+        # only the inserted objects get permissions
+        inserted_uids = set(
+            session.scalars(stmt.returning(self.table.c.id), rows).all()
+        )
+        permission_rows = [
+            row for row in permission_rows if row["object_id"] in inserted_uids
+        ]
+        if permission_rows:
+            session.execute(
+                insert_ignore_duplicates(self.permissions_table, self.dialect.name),
+                permission_rows,
+            )
+
+        uids = [obj.id for obj in new_objs if obj.id in inserted_uids]
+        self._schedule_after_write(uids, session=session)
+        return self._get_many_by_uid(credentials, uids, session=session)
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        UniqueConstraintException,
+    )
+    @with_session
+    def upsert_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[StashT],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[StashT]:
+        """Insert or update multiple objects at once, batched version of `upsert`.
+
+        All objects are written with a single INSERT ... ON CONFLICT (id) DO UPDATE.
+        New objects are owned by `credentials`, existing objects require write permission.
+
+        Returns:
+            list[StashT]: the stored objects, in input order.
+        """
+        if not self.allow_any_type:
+            for obj in objs:
+                self.check_type(obj, self.object_type).unwrap()
+
+        uids = [obj.id for obj in objs]
+        if not uids:
+            return []
+        if len(set(uids)) != len(uids):
+            raise UniqueConstraintException(
+                f"Cannot upsert the same {self.object_type.__name__} twice in one batch"
+            )
+
+        existing_uids = self._get_existing_uids(uids, session=session)
+        if existing_uids and not has_permission:
+            stmt = select(self.table.c.id).where(self.table.c.id.in_(existing_uids))
+            stmt = self._apply_permission_filter(
+                stmt,
+                credentials=credentials,
+                permission=ActionPermission.WRITE,
+                session=session,
+            )
+            writable_uids = set(session.execute(stmt).scalars().all())
+            if existing_uids - writable_uids:
+                raise NotFoundException(
+                    f"{self.object_type.__name__}: {existing_uids - writable_uids} "
+                    "not found or no permission to update."
+                )
+
+        if self._get_unique_conflicts(objs, session=session):
+            raise UniqueConstraintException(
+                f"Some fields are not unique for {self.object_type.__name__} "
+                f"and unique fields {self.unique_fields}"
+            )
+
+        storage_permissions = [self.server_uid.no_dash]
+        rows = [
+            {
+                "id": obj.id,
+                "fields": self._serialize_fields(obj),
+                "storage_permissions": storage_permissions,
+            }
+            for obj in objs
+        ]
+        permission_rows = [
+            permission_string_to_row(uid, permission_string)
+            for uid in uids
+            if uid not in existing_uids
+            for permission_string in self.get_ownership_permissions(uid, credentials)
+        ]
+
+        stmt = insert_or_update(
+            self.table, self.dialect.name, ["fields", "_updated_at"]
+        )
+        session.execute(stmt, rows)
+        if permission_rows:
+            session.execute(
+                insert_ignore_duplicates(self.permissions_table, self.dialect.name),
+                permission_rows,
+            )
+
+        self._schedule_after_write(uids, session=session)
+        return self._get_many_by_uid(credentials, uids, session=session)
@@ -67,7 +67,26 @@ class BlobFile(SyftObject):
         stream: bool = False,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         force: bool = False,
+        offset: int = 0,
+        length: int | None = None,
     ) -> Any:
+        """Read the file, or `length` bytes from `offset` of it.
+
+        Byte ranges are read by the server without loading the whole file, or
+        streamed with ranged requests when `stream` is True.
+        """
+        if not stream and (offset > 0 or length is not None):
+            read_range_method = from_api_or_context(
+                "blob_storage.read_range",
+                self.syft_server_location,
+                self.syft_client_verify_key,
+            )
+            if read_range_method is None:
+                return None
+            return read_range_method(
+                self.syft_blob_storage_entry_id, offset=offset, length=length
+            )
+
         # get blob retrieval object from api + syft_blob_storage_entry_id
         read_method = from_api_or_context(
             "blob_storage.read", self.syft_server_location, self.syft_client_verify_key
@@ -75,7 +94,11 @@ class BlobFile(SyftObject):
         if read_method is not None:
             blob_retrieval_object = read_method(self.syft_blob_storage_entry_id)
             return blob_retrieval_object._read_data(
-                stream=stream, chunk_size=chunk_size, _deserialize=False
+                stream=stream,
+                chunk_size=chunk_size,
+                _deserialize=False,
+                offset=offset,
+                length=length,
             )
         else:
             return None
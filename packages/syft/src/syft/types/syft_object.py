@@ -118,13 +118,14 @@ def _get_optional_inner_type(x: Any) -> Any:
 
 
 class SyftHashableObject:
-    __hash_exclude_attrs__: list = []
+    # frozen into a set when the class is registered for serde, the serializer also
+    # leaves out the DYNAMIC_SYFT_ATTRIBUTES when hashing
+    __hash_exclude_attrs__: Iterable[str] = ()
 
     def __hash__(self) -> int:
         return int.from_bytes(self.__sha256__(), byteorder="big")
 
     def __sha256__(self) -> bytes:
-        self.__hash_exclude_attrs__.extend(DYNAMIC_SYFT_ATTRIBUTES)
         _bytes = serialize(self, to_bytes=True, for_hashing=True)
         return sha256(_bytes).digest()
 
@@ -142,6 +143,39 @@ class SyftBaseObject(pydantic.BaseModel, SyftHashableObject):
     syft_server_location: UID | None = Field(default=None, exclude=True)
     syft_client_verify_key: SyftVerifyKey | None = Field(default=None, exclude=True)
 
+    # If enabled, the digest is cached until a field is set. Only enable it for classes
+    # that are hashed often and whose fields are not mutated in place.
+    __cache_sha256__: ClassVar[bool] = False
+    _syft_sha256: bytes | None = None
+
+    def __sha256__(self) -> bytes:
+        if not self.__cache_sha256__:
+            return super().__sha256__()
+        if self._syft_sha256 is None:
+            self._syft_sha256 = super().__sha256__()
+        return self._syft_sha256
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_") and name not in DYNAMIC_SYFT_ATTRIBUTES:
+            self._syft_sha256 = None
+
+    # copies can be changed without __setattr__, e.g. by model_copy(update=...)
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        copied._syft_sha256 = None
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        copied = super().__deepcopy__(memo)
+        copied._syft_sha256 = None
+        return copied
+
+    def copy(self, *args: Any, **kwargs: Any) -> Self:
+        copied = super().copy(*args, **kwargs)
+        copied._syft_sha256 = None
+        return copied
+
     def _set_obj_location_(self, server_uid: UID, credentials: SyftVerifyKey) -> None:
         self.syft_server_location = server_uid
         self.syft_client_verify_key = credentials
@@ -0,0 +1,71 @@
+# stdlib
+from collections.abc import Callable
+from collections.abc import Hashable
+import threading
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+# third party
+from cachetools import TTLCache
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class StatsCache(Generic[V]):
+    """A thread-safe, bounded TTL cache that counts its hits and misses.
+
+    Entries expire after `ttl` seconds, which bounds how stale a value can be
+    when it is changed by another process.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        # bumped on every invalidation, values computed before it are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], V]) -> V:
+        """Return the cached value for `key`, or compute and cache it.
+
+        `compute` is called without holding the lock. None is returned but not cached.
+        """
+        with self._lock:
+            # a single lookup, the entry can expire between `in` and `[]`
+            value = self._cache.get(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            self.misses += 1
+            generation = self._generation
+
+        value = compute()
+        if value is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._cache[key] = value
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop `key` from the cache, or every entry if no key is given."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+            }
@@ -20,6 +20,14 @@ class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
         self._APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+        # numpy arrays as raw Arrow IPC behind a header, older clients and servers
+        # only read the (tensor, size, dtype) tuple format
+        self._NUMPY_ARROW_IPC_SERDE = str_to_bool(
+            os.getenv(
+                "NUMPY_ARROW_IPC_SERDE",
+                "False",
+            )
+        )
         self._CAN_REGISTER = str_to_bool(
             os.getenv(
                 "ENABLE_SIGNUP",
@@ -47,6 +55,14 @@ class ExperimentalFlags:
     def APACHE_ARROW_COMPRESSION(self, value: ApacheArrowCompression) -> None:
         self._APACHE_ARROW_COMPRESSION = value
 
+    @property
+    def NUMPY_ARROW_IPC_SERDE(self) -> bool:
+        return self._NUMPY_ARROW_IPC_SERDE
+
+    @NUMPY_ARROW_IPC_SERDE.setter
+    def NUMPY_ARROW_IPC_SERDE(self, value: bool) -> None:
+        self._NUMPY_ARROW_IPC_SERDE = value
+
     @property
     def USE_NEW_SERVICE(self) -> bool:
         return str_to_bool(os.getenv("USE_NEW_SERVICE", "False"))
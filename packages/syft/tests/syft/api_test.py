@@ -70,3 +70,37 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_api_cached_per_user(worker):
+    verify_key = worker.root_client.verify_key
+    protocol = worker.current_protocol
+    api_cache = worker.db.api_cache
+    api_cache.invalidate()
+
+    api = worker.get_api(verify_key, protocol)
+    serialized = worker.get_serialized_api(verify_key, protocol)
+    hits = api_cache.stats()["hits"]
+
+    # every client gets its own copy of the cached api
+    assert worker.get_api(verify_key, protocol) is not api
+    assert worker.get_serialized_api(verify_key, protocol) is serialized
+    assert api_cache.stats()["hits"] == hits + 2
+
+    @sy.api_endpoint_method()
+    def private_endpoint(context) -> int:
+        return 1
+
+    @sy.api_endpoint_method()
+    def mock_endpoint(context) -> int:
+        return 0
+
+    new_endpoint = sy.TwinAPIEndpoint(
+        path="test.cached_api",
+        private_function=private_endpoint,
+        mock_function=mock_endpoint,
+    )
+    worker.root_client.api.services.api.add(endpoint=new_endpoint)
+
+    assert "test.cached_api" not in api.endpoints
+    assert "test.cached_api" in worker.get_api(verify_key, protocol).endpoints
@@ -1,8 +1,11 @@
 # stdlib
+import asyncio
 import io
+import time
 
 # third party
 import numpy as np
+import pandas as pd
 import pytest
 
 # syft absolute
@@ -11,7 +14,10 @@ from syft import ActionObject
 from syft import Dataset
 from syft import Worker
 from syft.client.datasite_client import DatasiteClient
+from syft.server.routes import forward_request_body
+from syft.service.blob_storage import util as blob_storage_util
 from syft.service.blob_storage.util import can_upload_to_blob_storage
+from syft.service.blob_storage.util import estimate_mb_size
 from syft.service.blob_storage.util import min_size_for_blob_storage_upload
 from syft.service.context import AuthedServiceContext
 from syft.service.response import SyftSuccess
@@ -90,6 +96,27 @@ def test_blob_storage_read(worker):
     worker.cleanup()
 
 
+def test_blob_storage_read_range(worker):
+    blob_storage = worker.services.blob_storage
+    authed_context = AuthedServiceContext(
+        server=worker, credentials=worker.signing_key.verify_key
+    )
+    blob_data = CreateBlobStorageEntry.from_obj(data)
+    blob_deposit = blob_storage.allocate(authed_context, blob_data)
+    blob_deposit.write(io.BytesIO(data)).unwrap()
+    uid = blob_deposit.blob_storage_entry_id
+
+    assert blob_storage.read_range(authed_context, uid, offset=2, length=5) == data[2:7]
+    assert blob_storage.read_range(authed_context, uid, offset=3) == data[3:]
+    assert blob_storage.read_range(authed_context, uid, offset=len(data) + 1) == b""
+
+    retrieval = blob_storage.read(authed_context, uid)
+    assert retrieval.read(offset=2, length=5) == data[2:7]
+    with pytest.raises(SyftException):
+        retrieval.read(offset=-1)
+    worker.cleanup()
+
+
 def test_blob_storage_delete(authed_context, blob_storage):
     blob_data = CreateBlobStorageEntry.from_obj(data)
     blob_deposit = blob_storage.allocate(authed_context, blob_data)
@@ -140,6 +167,42 @@ def test_action_obj_send_save_to_blob_storage(worker):
     assert all(syft_retrieved_data.read() == data_big)
 
 
+def test_estimate_mb_size():
+    array = np.zeros((1024, 1024), dtype=np.float32)
+    assert estimate_mb_size(array) == pytest.approx(4, abs=0.2)
+    assert estimate_mb_size(pd.DataFrame({"a": array[0]})) < 1
+    assert estimate_mb_size(np.array(["a", "b"])) is None
+    assert estimate_mb_size(np.array([object()])) is None
+    assert estimate_mb_size({"a": array}) is None
+
+
+def test_serialize_for_blob_storage_skips_small_data(worker, monkeypatch):
+    metadata = worker.root_client.api.metadata
+    assert min_size_for_blob_storage_upload(metadata) == 1
+
+    calls = []
+
+    def serialize(obj, to_bytes):
+        calls.append(obj)
+        return sy.serialize(obj, to_bytes=to_bytes)
+
+    monkeypatch.setattr(blob_storage_util, "serialize", serialize)
+
+    small = np.arange(100)
+    assert (
+        blob_storage_util.serialize_for_blob_storage(small, metadata).unwrap() is None
+    )
+    assert calls == []
+
+    big = np.random.randint(0, 2**15, size=1024 * 1024, dtype=np.int16)
+    serialized = blob_storage_util.serialize_for_blob_storage(big, metadata).unwrap()
+    assert len(calls) == 1
+    assert (sy.deserialize(serialized, from_bytes=True) == big).all()
+    # compressed below the threshold, decided from the serialized bytes
+    compressible = np.ones(1024 * 1024, dtype=np.int16)
+    assert not can_upload_to_blob_storage(compressible, metadata).unwrap()
+
+
 def test_upload_dataset_save_to_blob_storage(
     worker: Worker, big_dataset: Dataset, small_dataset: Dataset
 ) -> None:
@@ -151,3 +214,37 @@ def test_upload_dataset_save_to_blob_storage(
     # the big dataset should be saved to the blob storage
     root_client.upload_dataset(big_dataset)
     assert len(root_client.api.services.blob_storage.get_all()) == 2
+
+
+def test_forward_request_body() -> None:
+    chunks = [bytes([i]) * 1024 for i in range(64)]
+    read = []
+
+    async def body():
+        for chunk in chunks:
+            read.append(chunk)
+            yield chunk
+
+    def send(data):
+        received = b""
+        for chunk in data:
+            # the body is read at most queue_size + 1 chunks ahead of the sender
+            assert len(read) <= len(received) // 1024 + 4
+            time.sleep(0.001)
+            received += chunk
+        return received
+
+    result = asyncio.run(forward_request_body(body(), send, queue_size=2))
+    assert result == b"".join(chunks)
+
+
+def test_forward_request_body_aborts_on_error() -> None:
+    async def body():
+        yield b"data"
+        raise ConnectionResetError("client disconnected")
+
+    def send(data):
+        return b"".join(data)
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(forward_request_body(body(), send))
@@ -0,0 +1,131 @@
+# stdlib
+from io import BytesIO
+import threading
+import time
+
+# third party
+import requests
+
+# syft absolute
+import syft as sy
+from syft.store import blob_storage
+from syft.store.blob_storage import BlobRetrievalByURL
+from syft.store.blob_storage import seaweedfs
+from syft.store.blob_storage.seaweedfs import MAX_FILE_PART_SIZE
+from syft.store.blob_storage.seaweedfs import MIN_FILE_PART_SIZE
+from syft.store.blob_storage.seaweedfs import SeaweedFSBlobDeposit
+from syft.store.blob_storage.seaweedfs import SeaweedFSConnection
+from syft.store.blob_storage.seaweedfs import get_part_size
+from syft.types.server_url import ServerURL
+from syft.types.uid import UID
+
+
+class S3PartStub:
+    """Stands in for the presigned upload_part urls of an S3-compatible store."""
+
+    def __init__(self, fail_first_attempt: bool = False) -> None:
+        self.parts: dict[str, bytes] = {}
+        self.fail_first_attempt = fail_first_attempt
+        self.attempts: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def put(self, url: str, data, **kwargs) -> requests.Response:
+        with self.lock:
+            self.attempts[url] = self.attempts.get(url, 0) + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            body = b"".join(data)
+            time.sleep(0.05)
+            response = requests.Response()
+            if self.fail_first_attempt and self.attempts[url] == 1:
+                response.status_code = 500
+            else:
+                self.parts[url] = body
+                response.status_code = 200
+                response.headers["ETag"] = f"etag-{url}"
+            response.url = url
+            return response
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def write_to_stub(monkeypatch, stub: S3PartStub, data: bytes, n_parts: int) -> dict:
+    completed = {}
+
+    def mark_write_complete(etags, uid, no_lines):
+        completed.update(etags=etags, no_lines=no_lines)
+        return True
+
+    monkeypatch.setattr(seaweedfs.requests, "put", stub.put)
+    monkeypatch.setattr(
+        seaweedfs, "from_api_or_context", lambda *args, **kwargs: mark_write_complete
+    )
+    monkeypatch.setattr(seaweedfs, "DEFAULT_UPLOAD_CHUNK_SIZE", 7)
+
+    urls = [ServerURL(host_or_ip="localhost", path=f"/part{i}") for i in range(n_parts)]
+    deposit = SeaweedFSBlobDeposit(
+        blob_storage_entry_id=UID(), urls=urls, size=len(data)
+    )
+    deposit.write(BytesIO(data)).unwrap()
+    return completed
+
+
+def test_seaweedfs_deposit_uploads_parts_in_parallel(monkeypatch) -> None:
+    data = b"line\n" * 1000
+    stub = S3PartStub()
+    completed = write_to_stub(monkeypatch, stub, data, n_parts=8)
+
+    assert stub.max_in_flight > 1
+    parts = sorted(stub.parts.items(), key=lambda item: int(item[0].split("part")[1]))
+    assert b"".join(part for _, part in parts) == data
+    assert [etag["PartNumber"] for etag in completed["etags"]] == list(range(1, 9))
+    assert completed["no_lines"] == 1000
+
+
+def test_seaweedfs_deposit_retries_parts(monkeypatch) -> None:
+    data = b"0123456789" * 100
+    stub = S3PartStub(fail_first_attempt=True)
+    monkeypatch.setattr(seaweedfs, "wait_exponential", lambda **kwargs: lambda _: 0)
+    write_to_stub(monkeypatch, stub, data, n_parts=3)
+
+    assert all(attempts == 2 for attempts in stub.attempts.values())
+    assert b"".join(stub.parts[url] for url in sorted(stub.parts)) == data
+
+
+def test_seaweedfs_part_size() -> None:
+    assert get_part_size(1024) == MIN_FILE_PART_SIZE
+    assert get_part_size(1024**3) == 1024**3 // 16
+    assert get_part_size(1024**4) == MAX_FILE_PART_SIZE
+
+
+def test_seaweedfs_read_range_returns_raw_bytes(monkeypatch) -> None:
+    data = sy.serialize({"test": "test"}, to_bytes=True)
+
+    class PresignedLocation:
+        def generate_url(self, connection, type_, bucket_name):
+            return BlobRetrievalByURL(
+                url="http://localhost/blob", file_name="blob", type_=type_
+            )
+
+    def get(url: str, headers=None, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = data
+        if headers is not None:
+            start, end = headers["Range"].removeprefix("bytes=").split("-")
+            response._content = data[int(start) : int(end) + 1 if end else None]
+        return response
+
+    monkeypatch.setattr(blob_storage.requests, "get", get)
+    connection = SeaweedFSConnection.__new__(SeaweedFSConnection)
+    connection.default_bucket_name = "bucket"
+    location = PresignedLocation()
+
+    # the whole blob is not deserialized either
+    assert connection.read_range(location) == data
+    assert connection.read_range(location, offset=2, length=5) == data[2:7]
+    assert connection.read_range(location, offset=3) == data[3:]
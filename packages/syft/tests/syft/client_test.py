@@ -1,3 +1,17 @@
+# stdlib
+import threading
+
+# third party
+from requests import Response
+from requests.adapters import BaseAdapter
+
+# syft absolute
+from syft.client.client import HTTPConnection
+from syft.client.client import HTTP_POOL_MAXSIZE
+from syft.client.client import request_timeout
+from syft.serde.serialize import _serialize
+
+
 def test_client_logged_in_user(worker):
     guest_client = worker.guest_client
     assert guest_client.logged_in_user == ""
@@ -15,3 +29,89 @@ def test_client_logged_in_user(worker):
     client = client.login(email="sheldon@caltech.edu", password="bazinga")
 
     assert client.logged_in_user == "sheldon@caltech.edu"
+
+
+def test_http_connection_reuses_session(monkeypatch):
+    connection = HTTPConnection(url="http://localhost:8080")
+    session = connection.session
+    assert connection.session is session
+
+    adapter = session.get_adapter("http://localhost:8080")
+    assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+
+    calls = []
+
+    def post(url, data, headers, timeout):
+        calls.append(url)
+        response = Response()
+        response.status_code = 200
+        response._content = _serialize("ok", to_bytes=True)
+        return response
+
+    monkeypatch.setattr(session, "post", post)
+
+    assert connection.make_call(None) == "ok"
+    assert connection.make_call(None) == "ok"
+    assert calls == [str(connection.api_url)] * 2
+
+
+def test_http_connection_request_timeout(monkeypatch):
+    connection = HTTPConnection(url="http://localhost:8080")
+    timeouts = []
+
+    def post(url, data, headers, timeout):
+        timeouts.append(timeout)
+        response = Response()
+        response.status_code = 200
+        response._content = _serialize("ok", to_bytes=True)
+        return response
+
+    monkeypatch.setattr(connection.session, "post", post)
+
+    connection.make_call(None)
+    with request_timeout(0.5):
+        connection.make_call(None)
+        with request_timeout(0.1):
+            connection.make_call(None)
+        connection.make_call(None)
+
+        # the timeout only applies to the requests made in this thread
+        thread = threading.Thread(target=connection.make_call, args=(None,))
+        thread.start()
+        thread.join()
+    connection.make_call(None)
+
+    assert timeouts == [None, 0.5, 0.1, 0.5, None, None]
+
+
+def test_http_connection_put_content_length():
+    connection = HTTPConnection(url="http://localhost:8080")
+    sent = []
+
+    class RecordingAdapter(BaseAdapter):
+        def send(self, request, **kwargs):
+            sent.append((request.headers, b"".join(request.body)))
+            response = Response()
+            response.status_code = 200
+            return response
+
+        def close(self):
+            pass
+
+    connection.session.mount("http://", RecordingAdapter())
+
+    def body():
+        yield b"ab"
+        yield b"cd"
+
+    connection._make_put("/upload", body(), stream=True, content_length=4)
+    headers, data = sent[-1]
+    assert headers["Content-Length"] == "4"
+    assert "Transfer-Encoding" not in headers
+    assert data == b"abcd"
+
+    # without a length the body is chunked
+    connection._make_put("/upload", body(), stream=True)
+    headers, data = sent[-1]
+    assert headers["Transfer-Encoding"] == "chunked"
+    assert data == b"abcd"
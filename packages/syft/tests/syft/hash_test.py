@@ -1,11 +1,15 @@
 # stdlib
+import copy
+from typing import ClassVar
 from uuid import uuid4
 
 # syft absolute
 from syft.serde.serializable import serializable
+from syft.service.policy.policy import register_policy_class
 from syft.types.syft_object import SYFT_OBJECT_VERSION_1
 from syft.types.syft_object import SyftBaseObject
 from syft.types.syft_object import SyftHashableObject
+from syft.types.syft_object_registry import SyftObjectRegistry
 
 
 @serializable(
@@ -36,6 +40,13 @@ class MockWrapper(SyftBaseObject, SyftHashableObject):
     data: MockObject | None
 
 
+@serializable(attrs=["id", "data"])
+class CachedMockWrapper(MockWrapper):
+    __canonical_name__ = "CachedMockWrapper"
+    __version__ = SYFT_OBJECT_VERSION_1
+    __cache_sha256__: ClassVar[bool] = True
+
+
 def test_simple_hashing():
     obj1 = MockObject(key="key", value="value")
     obj2 = MockObject(key="key", value="value")
@@ -56,3 +67,73 @@ def test_nested_hashing():
     )
 
     assert obj1.hash() == obj2.hash()
+
+
+def test_hash_not_cached_by_default():
+    obj = MockWrapper(id=str(uuid4()), data=MockObject(key="key", value="value"))
+    digest = obj.hash()
+
+    assert obj._syft_sha256 is None
+    obj.data.value = "other"
+    assert obj.hash() != digest
+
+
+def test_hash_cached_until_set():
+    obj = CachedMockWrapper(id=str(uuid4()), data=MockObject(key="key", value="value"))
+    digest = obj.hash()
+
+    assert obj._syft_sha256 is not None
+    assert obj.hash() == digest
+
+    # location attributes are not hashed and keep the digest
+    obj.syft_server_location = None
+    assert obj._syft_sha256 is not None
+
+    obj.data = MockObject(key="key", value="other")
+    assert obj._syft_sha256 is None
+    assert obj.hash() != digest
+
+
+def test_hash_not_cached_in_copies():
+    obj = CachedMockWrapper(id=str(uuid4()), data=MockObject(key="key", value="value"))
+    digest = obj.hash()
+
+    copies = [
+        copy.copy(obj),
+        copy.deepcopy(obj),
+        obj.model_copy(),
+        obj.model_copy(update={"id": str(uuid4())}),
+        obj.copy(update={"id": str(uuid4())}),
+    ]
+    for obj_copy in copies:
+        assert obj_copy._syft_sha256 is None
+        assert (obj_copy.hash() == digest) == (obj_copy.id == obj.id)
+
+
+def test_hash_exclude_attrs_not_extended():
+    obj = MockObject(key="key", value="value")
+    for _ in range(3):
+        obj.hash()
+
+    assert MockObject.__hash_exclude_attrs__ == ["flag"]
+    assert SyftHashableObject.__hash_exclude_attrs__ == ()
+
+
+class MockPolicy(SyftBaseObject, SyftHashableObject):
+    __canonical_name__ = "MockPolicy"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    limit: int
+
+
+def test_hash_registered_policy_class():
+    # user policies are registered without recursive_serde_register
+    register_policy_class(MockPolicy, "MockPolicy")
+    assert MockPolicy(limit=1).hash() == MockPolicy(limit=1).hash()
+    assert MockPolicy(limit=1).hash() != MockPolicy(limit=2).hash()
+
+    # also with an exclude list instead of a set
+    serde_attributes = list(SyftObjectRegistry.get_serde_properties("MockPolicy", 1))
+    serde_attributes[6] = ["limit"]
+    SyftObjectRegistry.register_cls("MockPolicy", 1, tuple(serde_attributes))
+    assert MockPolicy(limit=1).hash() == MockPolicy(limit=2).hash()
@@ -0,0 +1,43 @@
+# syft absolute
+from syft.protocol.data_protocol import get_data_protocol
+from syft.protocol.data_protocol import get_migration_chain
+from syft.protocol.data_protocol import migrate_args_and_kwargs
+from syft.service.user.user import User
+from syft.service.user.user import UserV1
+
+
+def test_protocol_state_cached() -> None:
+    data_protocol = get_data_protocol()
+    protocol = data_protocol.supported_protocols[0]
+
+    state = data_protocol.get_state(protocol)
+
+    assert state == data_protocol.build_state(stop_key=str(protocol))
+    assert data_protocol.get_state(protocol) is state
+
+
+def test_migration_chain_cached() -> None:
+    user = User(email="info@openmined.org", name="Jane Doe")
+    user_v1 = get_migration_chain("User", 2, 1)(user)
+
+    assert isinstance(user_v1, UserV1)
+    assert user_v1.email == user.email
+    assert get_migration_chain("User", 2, 1) is get_migration_chain("User", 2, 1)
+
+    user_v2 = get_migration_chain("User", 1, 2)(user_v1)
+    assert isinstance(user_v2, User)
+    assert user_v2.email == user.email
+
+
+def test_migrate_args_and_kwargs_to_older_protocol() -> None:
+    data_protocol = get_data_protocol()
+    protocol = data_protocol.supported_protocols[0]
+    user_version = int(max(data_protocol.get_state(protocol)["User"]))
+    user = User(email="info@openmined.org", name="Jane Doe")
+
+    args, kwargs = migrate_args_and_kwargs(
+        (user,), {"users": [user]}, to_protocol=protocol
+    )
+
+    assert args[0].__version__ == user_version
+    assert kwargs["users"][0].__version__ == user_version
@@ -1,9 +1,17 @@
+# stdlib
+import threading
+import time
+
 # syft absolute
 from syft.abstract_server import ServerType
 from syft.server.credentials import SyftSigningKey
+from syft.service.context import AuthedServiceContext
 from syft.service.network.network_service import NetworkStash
+from syft.service.network.routes import HTTPServerRoute
 from syft.service.network.server_peer import ServerPeer
+from syft.service.network.server_peer import ServerPeerConnectionStatus
 from syft.service.network.server_peer import ServerPeerUpdate
+from syft.service.network.utils import PeerHealthCheckTask
 from syft.types.uid import UID
 
 
@@ -29,3 +37,235 @@ def test_add_route() -> None:
     ).unwrap()
 
     assert peer.name == "new name"
+
+
+def test_health_check_evicts_unreachable_peer_client(worker) -> None:
+    peer = ServerPeer(
+        id=UID(),
+        name="unreachable",
+        verify_key=SyftSigningKey.generate().verify_key,
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+        server_routes=[HTTPServerRoute(host_or_ip="localhost", port=1)],
+    )
+    worker.services.network.stash.set(worker.verify_key, peer).unwrap()
+    key = peer.client_cache_key()
+    assert key == peer.client_cache_key()
+
+    worker.db.peer_client_cache.get_or_compute(key, lambda: worker.root_client)
+    assert worker.db.cache_stats()["peer_client"]["size"] == 1
+
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    task = PeerHealthCheckTask()
+    task.peer_route_heathcheck(context)
+    task.stop()
+
+    stored = worker.services.network.stash.get_by_uid(worker.verify_key, peer.id)
+    assert stored.unwrap().ping_status == ServerPeerConnectionStatus.TIMEOUT
+    assert worker.db.cache_stats()["peer_client"]["size"] == 0
+
+
+def test_client_cache_key_changes_with_route() -> None:
+    route = HTTPServerRoute(host_or_ip="localhost", port=8080)
+    peer = ServerPeer(
+        id=UID(),
+        name="test",
+        verify_key=SyftSigningKey.generate().verify_key,
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+        server_routes=[route],
+    )
+    key = peer.client_cache_key()
+    assert key == (peer.id, ("HTTPServerRoute", "localhost", 8080, "http", None, None))
+
+    route.port = 8081
+    assert peer.client_cache_key() != key
+
+
+def test_health_check_times_out_slow_peers(worker) -> None:
+    peers = [
+        ServerPeer(
+            id=UID(),
+            name=name,
+            verify_key=SyftSigningKey.generate().verify_key,
+            server_type=ServerType.DATASITE,
+            admin_email="info@openmined.org",
+        )
+        for name in ["fast", "slow"]
+    ]
+    for peer in peers:
+        worker.services.network.stash.set(worker.verify_key, peer).unwrap()
+
+    release = threading.Event()
+    checked = []
+
+    class SlowPeerHealthCheckTask(PeerHealthCheckTask):
+        peer_timeout = 0.2
+
+        def _check_peer(self, context, peer):
+            checked.append(peer.name)
+            if peer.name == "slow":
+                release.wait()
+            return ServerPeerUpdate(
+                id=peer.id, ping_status=ServerPeerConnectionStatus.ACTIVE
+            )
+
+    task = SlowPeerHealthCheckTask()
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    try:
+        task.peer_route_heathcheck(context)
+        task.peer_route_heathcheck(context)
+
+        fast, slow = (
+            worker.services.network.stash.get_by_uid(
+                worker.verify_key, peer.id
+            ).unwrap()
+            for peer in peers
+        )
+        assert fast.ping_status == ServerPeerConnectionStatus.ACTIVE
+        assert slow.ping_status == ServerPeerConnectionStatus.TIMEOUT
+        assert "did not respond" in slow.ping_status_message
+        # the pending check of the slow peer is not submitted again
+        assert checked.count("fast") == 2
+        assert checked.count("slow") == 1
+    finally:
+        release.set()
+        task.stop()
+
+
+def test_health_check_skips_queued_peers(worker) -> None:
+    peers = [
+        ServerPeer(
+            id=UID(),
+            name=f"peer-{i}",
+            verify_key=SyftSigningKey.generate().verify_key,
+            server_type=ServerType.DATASITE,
+            admin_email="info@openmined.org",
+        )
+        for i in range(2)
+    ]
+    for peer in peers:
+        worker.services.network.stash.set(worker.verify_key, peer).unwrap()
+
+    release = threading.Event()
+    checked = []
+
+    class SingleWorkerHealthCheckTask(PeerHealthCheckTask):
+        max_workers = 1
+        peer_timeout = 0.2
+
+        def _check_peer(self, context, peer):
+            checked.append(peer.id)
+            release.wait()
+            return ServerPeerUpdate(
+                id=peer.id, ping_status=ServerPeerConnectionStatus.ACTIVE
+            )
+
+    task = SingleWorkerHealthCheckTask()
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    try:
+        task.peer_route_heathcheck(context)
+
+        statuses = {
+            peer.id: worker.services.network.stash.get_by_uid(
+                worker.verify_key, peer.id
+            )
+            .unwrap()
+            .ping_status
+            for peer in peers
+        }
+        # the check of the second peer has not started, so it is not timed out
+        assert checked == [checked[0]]
+        assert statuses[checked[0]] == ServerPeerConnectionStatus.TIMEOUT
+        assert [status for uid, status in statuses.items() if uid != checked[0]] == [
+            None
+        ]
+    finally:
+        release.set()
+        task.stop()
+
+
+def test_health_check_times_checks_from_their_start(worker) -> None:
+    peers = [
+        ServerPeer(
+            id=UID(),
+            name=name,
+            verify_key=SyftSigningKey.generate().verify_key,
+            server_type=ServerType.DATASITE,
+            admin_email="info@openmined.org",
+            server_routes=[HTTPServerRoute(host_or_ip="localhost", port=1)],
+        )
+        for name in ["first", "late"]
+    ]
+    for peer in peers:
+        worker.services.network.stash.set(worker.verify_key, peer).unwrap()
+    late = peers[1]
+    worker.db.peer_client_cache.get_or_compute(
+        late.client_cache_key(), lambda: worker.root_client
+    )
+
+    release = threading.Event()
+
+    class SingleWorkerHealthCheckTask(PeerHealthCheckTask):
+        max_workers = 1
+        peer_timeout = 0.5
+
+        def _check_peer(self, context, peer):
+            if peer.name == "first":
+                time.sleep(0.2)
+            else:
+                release.wait()
+            return ServerPeerUpdate(
+                id=peer.id, ping_status=ServerPeerConnectionStatus.ACTIVE
+            )
+
+    task = SingleWorkerHealthCheckTask()
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    try:
+        task.peer_route_heathcheck(context)
+
+        # the late check was still running at the deadline, but not for `peer_timeout`
+        stored = worker.services.network.stash.get_by_uid(worker.verify_key, late.id)
+        assert stored.unwrap().ping_status is None
+        assert worker.db.peer_client_cache.stats()["size"] == 1
+    finally:
+        release.set()
+        task.stop()
+
+
+def test_update_peers() -> None:
+    network_stash = NetworkStash.random()
+    credentials = network_stash.db.root_verify_key
+    peers = [
+        ServerPeer(
+            id=UID(),
+            name=f"peer-{i}",
+            verify_key=SyftSigningKey.generate().verify_key,
+            server_type=ServerType.DATASITE,
+            admin_email="info@openmined.org",
+        )
+        for i in range(3)
+    ]
+    for peer in peers:
+        network_stash.set(credentials, peer).unwrap()
+
+    peer_updates = [
+        ServerPeerUpdate(id=peer.id, ping_status=ServerPeerConnectionStatus.ACTIVE)
+        for peer in peers
+    ]
+    peer_updates[1].ping_status = ServerPeerConnectionStatus.TIMEOUT
+    # updates of deleted peers are skipped
+    peer_updates.append(
+        ServerPeerUpdate(id=UID(), ping_status=ServerPeerConnectionStatus.ACTIVE)
+    )
+
+    updated = network_stash.update_peers(credentials, peer_updates).unwrap()
+
+    assert [peer.id for peer in updated] == [peer.id for peer in peers]
+    stored = [network_stash.get_by_uid(credentials, peer.id).unwrap() for peer in peers]
+    assert [peer.ping_status for peer in stored] == [
+        ServerPeerConnectionStatus.ACTIVE,
+        ServerPeerConnectionStatus.TIMEOUT,
+        ServerPeerConnectionStatus.ACTIVE,
+    ]
+    assert [peer.name for peer in stored] == [peer.name for peer in peers]
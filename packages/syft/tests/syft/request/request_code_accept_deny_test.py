@@ -180,3 +180,48 @@ def test_code_accept_deny(worker: Worker, ds_client: SyftClient):
 
     assert exc.type is SyftException
     assert deny_reason in exc.value.public_message
+
+
+def test_request_status_and_info_pages(worker: Worker, ds_client: SyftClient):
+    root_client = worker.root_client
+
+    @syft.syft_function_single_use()
+    def first_function():
+        return 1
+
+    @syft.syft_function_single_use()
+    def second_function():
+        return 2
+
+    @syft.syft_function_single_use()
+    def third_function():
+        return 3
+
+    for func in [first_function, second_function, third_function]:
+        ds_client.code.request_code_execution(func)
+
+    request_api = root_client.api.services.request
+    requests = request_api.get_all()
+    assert len(request_api.get_all_pending()) == 3
+
+    requests[0].approve()
+    assert [request.id for request in request_api.get_all_approved()] == [
+        requests[0].id
+    ]
+    assert [request.id for request in request_api.get_all_pending()] == [
+        request.id for request in requests[1:]
+    ]
+
+    infos = request_api.get_all_info()
+    assert [info.request.id for info in infos] == [request.id for request in requests]
+    assert all(info.user.email == ds_client.account.email for info in infos)
+
+    pages = [
+        [info.request.id for info in page]
+        for page in request_api.get_all_info(page_size=2)
+    ]
+    assert pages == [[requests[0].id, requests[1].id], [requests[2].id]]
+    page = request_api.get_all_info(page_index=1, page_size=2)
+    assert [info.request.id for info in page] == pages[1]
+    page = request_api.get_all_info(page_size=2, after=pages[0][-1])
+    assert [info.request.id for info in page] == pages[1]
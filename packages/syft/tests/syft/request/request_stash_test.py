@@ -5,8 +5,10 @@ from syft.client.client import SyftClient
 from syft.server.credentials import SyftVerifyKey
 from syft.service.context import AuthedServiceContext
 from syft.service.request.request import Request
+from syft.service.request.request import RequestStatus
 from syft.service.request.request import SubmitRequest
 from syft.service.request.request_stash import RequestStash
+from syft.types.datetime import DateTime
 
 
 def test_requeststash_get_all_for_verify_key_no_requests(
@@ -67,3 +69,101 @@ def test_requeststash_get_all_for_verify_key_success(
         requests.ok()[1] == stash_set_result_2.ok()
         or requests.ok()[0] == stash_set_result_2.ok()
     )
+
+
+def test_requeststash_get_all_sorted_pages(
+    root_verify_key,
+    request_stash: RequestStash,
+    authed_context_guest_datasite_client: AuthedServiceContext,
+) -> None:
+    requests = []
+    for timestamp in [3.0, 1.0, 2.0]:
+        request = SubmitRequest(changes=[]).to(
+            Request, context=authed_context_guest_datasite_client
+        )
+        request.request_time = DateTime(utc_timestamp=timestamp)
+        requests.append(request_stash.set(root_verify_key, request).unwrap())
+    newest_first = [requests[0].id, requests[2].id, requests[1].id]
+
+    result = request_stash.get_all_sorted(root_verify_key).unwrap()
+    assert [request.id for request in result] == newest_first
+
+    # requests stored before the index existed are indexed on the first read
+    with request_stash.sessionmaker.begin() as session:
+        session.execute(request_stash.index_table.delete())
+    request_stash._index_complete = False
+    result = request_stash.get_all_sorted(root_verify_key).unwrap()
+    assert [request.id for request in result] == newest_first
+
+    first_page = request_stash.get_all_sorted(root_verify_key, limit=2).unwrap()
+    second_page = request_stash.get_all_sorted(
+        root_verify_key, limit=2, after=first_page[-1].id
+    ).unwrap()
+    assert [request.id for request in first_page + second_page] == newest_first
+
+
+def test_requeststash_get_all_with_status(
+    root_verify_key,
+    request_stash: RequestStash,
+    authed_context_guest_datasite_client: AuthedServiceContext,
+) -> None:
+    approved, unknown = (
+        request_stash.set(
+            root_verify_key,
+            SubmitRequest(changes=[]).to(
+                Request, context=authed_context_guest_datasite_client
+            ),
+        ).unwrap()
+        for _ in range(2)
+    )
+    request_stash.set_status(approved.id, RequestStatus.APPROVED).unwrap()
+
+    result = dict(
+        request_stash.get_all_with_status(
+            root_verify_key, status=RequestStatus.APPROVED
+        ).unwrap()
+    )
+    assert {request.id: status for request, status in result.items()} == {
+        approved.id: RequestStatus.APPROVED,
+        unknown.id: None,
+    }
+    rejected = request_stash.get_all_with_status(
+        root_verify_key, status=RequestStatus.REJECTED
+    ).unwrap()
+    assert [request.id for request, _ in rejected] == [unknown.id]
+
+    # writing the request clears its stored status
+    request_stash.update(root_verify_key, approved).unwrap()
+    assert all(
+        status is None
+        for _, status in request_stash.get_all_with_status(root_verify_key).unwrap()
+    )
+
+
+def test_requeststash_set_many_is_indexed(
+    root_verify_key,
+    request_stash: RequestStash,
+    authed_context_guest_datasite_client: AuthedServiceContext,
+) -> None:
+    requests = []
+    for timestamp in [1.0, 2.0, 3.0]:
+        request = SubmitRequest(changes=[]).to(
+            Request, context=authed_context_guest_datasite_client
+        )
+        request.request_time = DateTime(utc_timestamp=timestamp)
+        requests.append(request)
+
+    # the index of requests stored before it existed is completed on the first read
+    request_stash.set(root_verify_key, requests[0]).unwrap()
+    assert len(request_stash.get_all_sorted(root_verify_key).unwrap()) == 1
+
+    request_stash.set_many(root_verify_key, requests[1:2]).unwrap()
+    request_stash.set_status(requests[1].id, RequestStatus.APPROVED).unwrap()
+    request_stash.upsert_many(root_verify_key, requests[1:]).unwrap()
+
+    result = request_stash.get_all_with_status(root_verify_key).unwrap()
+    assert [(request.id, status) for request, status in result] == [
+        (requests[2].id, None),
+        (requests[1].id, None),
+        (requests[0].id, None),
+    ]
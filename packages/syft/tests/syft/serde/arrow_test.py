@@ -0,0 +1,140 @@
+# third party
+import numpy as np
+import pyarrow as pa
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import ARROW_TENSOR_MAGIC
+from syft.serde.arrow import arraytonumpyutf8
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.arrow import numpy_serialize
+from syft.serde.arrow import numpyutf8toarray
+from syft.serde.serialize import _serialize
+from syft.util.experimental_flags import ApacheArrowCompression
+from syft.util.experimental_flags import flags
+
+
+@pytest.fixture(params=[ApacheArrowCompression.ZSTD, ApacheArrowCompression.NONE])
+def compression(request):
+    original = flags.APACHE_ARROW_COMPRESSION
+    flags.APACHE_ARROW_COMPRESSION = request.param
+    yield request.param
+    flags.APACHE_ARROW_COMPRESSION = original
+
+
+@pytest.fixture
+def arrow_ipc():
+    original = flags.NUMPY_ARROW_IPC_SERDE
+    flags.NUMPY_ARROW_IPC_SERDE = True
+    yield
+    flags.NUMPY_ARROW_IPC_SERDE = original
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12, dtype=np.int32).reshape(3, 4),
+        np.array([True, False, True]),
+        np.random.rand(4, 2).astype(np.float16),
+        np.asfortranarray(np.arange(6.0).reshape(2, 3)),
+        np.array([], dtype=np.uint64),
+        np.array([["a", "ünïcode"], ["", "xyz"]]),
+        np.asfortranarray(np.array([["a", "bc"], ["def", "g"]])),
+        np.array([], dtype="<U3"),
+    ],
+)
+def test_arrow_tensor_round_trip(arrow_ipc, compression, array: np.ndarray) -> None:
+    serialized = numpy_serialize(array)
+    assert serialized.startswith(ARROW_TENSOR_MAGIC)
+
+    deserialized = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+    assert deserialized.dtype == array.dtype
+    assert deserialized.shape == array.shape
+    assert (deserialized == array).all()
+    assert deserialized.flags.writeable
+
+
+def test_arrow_tensor_zero_copy(arrow_ipc, compression) -> None:
+    array = np.arange(1000, dtype=np.int64)
+    buf = bytearray(numpy_serialize(array))
+
+    deserialized = numpy_deserialize(buf)
+    assert (deserialized == array).all()
+    shares_buffer = np.shares_memory(deserialized, np.frombuffer(buf, dtype=np.uint8))
+    assert shares_buffer == (compression is ApacheArrowCompression.NONE)
+
+    # immutable bytes are never handed out as a writeable view
+    deserialized = numpy_deserialize(bytes(buf))
+    deserialized[0] = -1
+    assert (numpy_deserialize(bytes(buf)) == array).all()
+
+
+def test_legacy_arrow_tensor_deserialize() -> None:
+    array = np.arange(12, dtype=np.int32).reshape(3, 4)
+    ipc_sink = pa.BufferOutputStream()
+    pa.ipc.write_tensor(pa.Tensor.from_numpy(array), ipc_sink)
+    buffer = ipc_sink.getvalue()
+    legacy = _serialize(
+        (pa.compress(buffer, asbytes=True, codec="zstd"), buffer.size, "int32"),
+        to_bytes=True,
+    )
+
+    assert (numpy_deserialize(legacy) == array).all()
+
+
+def test_legacy_arrow_tensor_serialize_by_default(compression) -> None:
+    # older versions only read the tuple format
+    array = np.arange(12, dtype=np.int32).reshape(3, 4)
+    serialized = numpy_serialize(array)
+    assert not serialized.startswith(ARROW_TENSOR_MAGIC)
+    assert isinstance(sy.deserialize(serialized, from_bytes=True), tuple)
+
+    deserialized = numpy_deserialize(serialized)
+    assert deserialized.dtype == array.dtype
+    assert (deserialized == array).all()
+    assert deserialized.flags.writeable
+
+
+def test_string_array_zero_copy(arrow_ipc, compression) -> None:
+    array = np.array(["a", "ünïcode", ""] * 10)
+    buf = bytearray(numpy_serialize(array))
+
+    deserialized = numpy_deserialize(buf)
+    assert deserialized.dtype == array.dtype
+    assert (deserialized == array).all()
+    shares_buffer = np.shares_memory(deserialized, np.frombuffer(buf, dtype=np.uint8))
+    assert shares_buffer == (compression is ApacheArrowCompression.NONE)
+
+    deserialized = numpy_deserialize(bytes(buf))
+    deserialized[0] = "b"
+    assert (numpy_deserialize(bytes(buf)) == array).all()
+
+
+def test_legacy_string_array_serialize_by_default() -> None:
+    array = np.array([["a", "ünïcode"], ["", "xyz"]])
+    serialized = numpy_serialize(array)
+    assert serialized == arraytonumpyutf8(array)
+    assert (numpy_deserialize(serialized) == array).all()
+
+
+def test_utf8_string_array_wire_format() -> None:
+    array = np.array([["a", "ünïcode"], ["", "x\x00y"]])
+    encoded = [item.encode("utf-8") for item in array.flatten()]
+    # utf-8 bytes, end offsets and shape, each followed by its length
+    expected = np.concatenate(
+        [
+            np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            np.cumsum([len(item) for item in encoded]),
+            [len(encoded)],
+            array.shape,
+            [array.ndim],
+        ]
+    ).astype(np.uint64)
+
+    serialized = arraytonumpyutf8(array)
+    assert serialized == _serialize(expected, to_bytes=True)
+
+    deserialized = numpyutf8toarray(sy.deserialize(serialized, from_bytes=True))
+    assert deserialized.dtype == array.dtype
+    assert (deserialized == array).all()
@@ -0,0 +1,41 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde import recursive
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024, 4096])
+def test_multi_chunk_round_trip(monkeypatch, chunk_size: int) -> None:
+    monkeypatch.setattr(recursive, "CAPNP_MAX_CHUNK_SIZE", chunk_size)
+
+    data = {
+        "bytes": b"x" * 4096,
+        "str": "y" * 5000,
+        "array": np.arange(2000, dtype=np.int64),
+    }
+    deserialized = sy.deserialize(sy.serialize(data, to_bytes=True), from_bytes=True)
+
+    assert deserialized["bytes"] == data["bytes"]
+    assert isinstance(deserialized["bytes"], bytes)
+    assert deserialized["str"] == data["str"]
+    assert (deserialized["array"] == data["array"]).all()
+
+
+def test_combine_bytes(monkeypatch) -> None:
+    chunk_size = 8
+    monkeypatch.setattr(recursive, "CAPNP_MAX_CHUNK_SIZE", chunk_size)
+    assert recursive.combine_bytes([]) == b""
+
+    single = [b"abc"]
+    assert recursive.combine_bytes(single) is single[0]
+
+    # the last chunk can be empty if the data is a multiple of the chunk size
+    chunks = [b"a" * chunk_size, b"b" * chunk_size, b""]
+    assert recursive.combine_bytes(chunks) == b"a" * chunk_size + b"b" * chunk_size
+
+    # chunks written with a different chunk size
+    chunks = [b"a" * 3, b"b" * 12, b"c"]
+    assert recursive.combine_bytes(chunks) == b"aaa" + b"b" * 12 + b"c"
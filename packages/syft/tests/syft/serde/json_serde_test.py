@@ -0,0 +1,37 @@
+# third party
+from faker import Faker
+
+# syft absolute
+from syft.serde.json_serde import JSON_DESERIALIZATION_PLANS
+from syft.serde.json_serde import JSON_SERIALIZATION_PLANS
+from syft.serde.json_serde import deserialize_json
+from syft.serde.json_serde import serialize_json
+from syft.server.credentials import SyftSigningKey
+from syft.service.user.user import User
+from syft.service.user.user_roles import ServiceRole
+
+
+def test_json_serde_plan_round_trip(faker: Faker) -> None:
+    user = User(
+        email=faker.email(),
+        name=faker.name(),
+        role=ServiceRole.DATA_SCIENTIST,
+        verify_key=SyftSigningKey.generate().verify_key,
+    )
+
+    serialized = serialize_json(user)
+    assert (User, User.__canonical_name__, User.__version__) in JSON_SERIALIZATION_PLANS
+    assert serialized["role"] == ServiceRole.DATA_SCIENTIST.name
+    assert serialized["verify_key"] == str(user.verify_key)
+
+    deserialized = deserialize_json(serialized)
+    assert User in JSON_DESERIALIZATION_PLANS
+    assert deserialized == user
+
+    # plans are reused
+    plan = JSON_SERIALIZATION_PLANS[(User, User.__canonical_name__, User.__version__)]
+    assert serialize_json(user) == serialized
+    assert (
+        JSON_SERIALIZATION_PLANS[(User, User.__canonical_name__, User.__version__)]
+        is plan
+    )
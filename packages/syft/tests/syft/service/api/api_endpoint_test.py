@@ -0,0 +1,84 @@
+# syft absolute
+import syft as sy
+from syft.service.api.api import compile_endpoint_code
+from syft.service.response import SyftSuccess
+
+
+@sy.api_endpoint_method()
+def private_counter(context) -> int:
+    context.state["count"] = context.state.get("count", 0) + 1
+    return context.state["count"]
+
+
+@sy.api_endpoint_method()
+def mock_counter(context) -> int:
+    return -1
+
+
+@sy.api_endpoint_method()
+def private_clients(context) -> int:
+    return int(context.admin_client is not None and context.user_client is not None)
+
+
+def call_private(client, path: str):
+    return client.api.services.api.call_private(path).get()
+
+
+def test_endpoint_state_persisted_separately(worker) -> None:
+    root_client = worker.root_client
+    endpoint = sy.TwinAPIEndpoint(
+        path="test.counter",
+        private_function=private_counter,
+        mock_function=mock_counter,
+    )
+    assert isinstance(root_client.api.services.api.add(endpoint=endpoint), SyftSuccess)
+    stash = worker.services.api.stash
+    endpoint_id = root_client.api.services.api.get(api_path="test.counter").id
+
+    compile_endpoint_code.cache_clear()
+    for count in (1, 2, 3):
+        assert call_private(root_client, "test.counter") == count
+    assert compile_endpoint_code.cache_info().misses == 1
+
+    # the mock does not change its state, nothing is written for it
+    assert root_client.api.services.api.call_public("test.counter").get() == -1
+    with stash.sessionmaker() as session:
+        rows = session.execute(stash.state_table.select()).all()
+    assert [(row.endpoint_id, row.function) for row in rows] == [
+        (endpoint_id, "private_function")
+    ]
+
+    stored = stash.get_by_uid(stash.root_verify_key, endpoint_id).unwrap()
+    assert stored.private_function.state == {"count": 3}
+
+    # writing the whole endpoint compacts the state into the endpoint row
+    root_client.api.services.api.set_state(
+        api_path="test.counter", state={"count": 10}, private=True
+    )
+    with stash.sessionmaker() as session:
+        assert session.execute(stash.state_table.select()).all() == []
+    assert call_private(root_client, "test.counter") == 11
+
+    root_client.api.services.api.delete(endpoint_path="test.counter")
+    with stash.sessionmaker() as session:
+        assert session.execute(stash.state_table.select()).all() == []
+
+
+def test_endpoint_clients_reused(worker) -> None:
+    root_client = worker.root_client
+    endpoint = sy.TwinAPIEndpoint(
+        path="test.clients",
+        private_function=private_clients,
+        mock_function=mock_counter,
+    )
+    root_client.api.services.api.add(endpoint=endpoint)
+    client_cache = worker.services.api.client_cache
+
+    assert call_private(root_client, "test.clients")
+    misses = client_cache.stats()["misses"]
+    assert call_private(root_client, "test.clients")
+    assert client_cache.stats()["misses"] == misses
+
+    # changing the endpoints drops the clients, their API lists the endpoints
+    root_client.api.services.api.delete(endpoint_path="test.clients")
+    assert client_cache.stats()["size"] == 0
@@ -2,14 +2,19 @@
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from secrets import token_hex
+import threading
+import time
 
 # third party
 import pytest
 
 # syft absolute
 import syft as sy
+from syft.service.job.job_stash import JOB_WAIT_POLL_INTERVAL_SEC
 from syft.service.job.job_stash import Job
 from syft.service.job.job_stash import JobStatus
+from syft.service.job.job_stash import job_notifier
 from syft.types.errors import SyftException
 from syft.types.uid import UID
 
@@ -62,3 +67,55 @@ def test_job_no_consumer(worker):
         job.wait()
 
     assert "has no workers" in exc.value.public_message
+
+
+def test_job_wait_wakes_up_on_update(tmp_path):
+    # in-memory sqlite is not shared with the thread writing the job
+    worker = sy.Worker.named(
+        name=token_hex(8), db_url=f"sqlite:///{tmp_path / 'syft.db'}"
+    )
+    try:
+        client = worker.root_client
+        stash = worker.services.job.stash
+        job = stash.set(client.verify_key, Job(id=UID(), server_uid=worker.id)).unwrap()
+
+        def resolve() -> None:
+            time.sleep(0.2)
+            job.resolved = True
+            job.status = JobStatus.COMPLETED
+            stash.update(client.verify_key, job).unwrap()
+
+        thread = threading.Thread(target=resolve)
+        start = time.monotonic()
+        thread.start()
+        waited = client.api.services.job.wait(job.id, timeout=10)
+        elapsed = time.monotonic() - start
+        thread.join()
+
+        assert waited.resolved
+        assert waited.status == JobStatus.COMPLETED
+        # woken up by the update, well before the next poll of the job
+        assert elapsed < 0.2 + 0.7 * JOB_WAIT_POLL_INTERVAL_SEC
+    finally:
+        worker.cleanup()
+
+
+def test_job_wait_timeout(worker):
+    client = worker.root_client
+    stash = worker.services.job.stash
+    job = stash.set(client.verify_key, Job(id=UID(), server_uid=worker.id)).unwrap()
+
+    waited = client.api.services.job.wait(job.id, timeout=0.1)
+
+    assert not waited.resolved
+    assert waited.status == JobStatus.CREATED
+
+
+def test_job_upsert_many_notifies_waiters(worker):
+    client = worker.root_client
+    stash = worker.services.job.stash
+    job = stash.set(client.verify_key, Job(id=UID(), server_uid=worker.id)).unwrap()
+
+    with job_notifier.watch(job.id) as written:
+        stash.upsert_many(client.verify_key, [job]).unwrap()
+        assert written.is_set()
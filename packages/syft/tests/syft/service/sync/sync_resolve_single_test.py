@@ -1,3 +1,6 @@
+# stdlib
+from datetime import timedelta
+
 # third party
 import numpy as np
 import pytest
@@ -445,3 +448,41 @@ def test_deny_and_sync(low_worker, high_worker):
     assert diff_after.is_same
 
     assert low_client.requests[0].status == RequestStatus.REJECTED
+
+
+def test_sync_state_changes(low_worker, monkeypatch):
+    monkeypatch.setattr(
+        "syft.service.sync.sync_service.SYNC_CURSOR_OVERLAP", timedelta(0)
+    )
+    low_client: DatasiteClient = low_worker.root_client
+    client_low_ds = get_ds_client(low_client)
+
+    @sy.syft_function_single_use()
+    def compute() -> int:
+        return 42
+
+    _ = client_low_ds.code.request_code_execution(compute)
+
+    state, deleted_ids, cursor = low_client.api.services.sync._get_state_changes()
+    assert deleted_ids == []
+    request = low_client.requests[0]
+    assert request.id in state.objects
+
+    @sy.syft_function_single_use()
+    def compute_2() -> int:
+        return 43
+
+    _ = client_low_ds.code.request_code_execution(compute_2)
+    low_client.api.services.request.delete_by_uid(request.id)
+
+    changes, deleted_ids, _ = low_client.api.services.sync._get_state_changes(
+        since=cursor
+    )
+    assert deleted_ids == [request.id]
+    assert len(changes.objects) > 0
+    assert changes.all_ids.isdisjoint(state.all_ids)
+
+    merged_state = state.apply_changes(changes, deleted_ids).filter_dependencies()
+    full_state = low_client.api.services.sync._get_state()
+    assert merged_state.all_ids == full_state.all_ids
+    assert merged_state.dependencies == full_state.dependencies
@@ -421,3 +421,27 @@ def test_notifications_enabled_without_emails_credentials_not_allowed(
         root_datasite_client.api.services.settings.update(notifications_enabled=True)
 
     assert _NOTIFICATIONS_ENABLED_WIHOUT_CREDENTIALS_ERROR in exc.value.public_message
+
+
+def test_settings_cache_invalidated_on_update(worker) -> None:
+    settings = worker.get_settings()
+    assert worker.get_settings() is settings
+
+    context = AuthedServiceContext(
+        server=worker, credentials=worker.signing_key.verify_key
+    )
+    worker.services.settings.allow_guest_signup(
+        context, enable=not settings.signup_enabled
+    )
+    assert worker.get_settings().signup_enabled != settings.signup_enabled
+
+    worker.services.settings.allow_guest_signup(context, enable=settings.signup_enabled)
+
+
+def test_settings_cache_invalidated_on_upsert_many(worker) -> None:
+    settings = worker.get_settings()
+    assert worker.get_settings() is settings
+
+    stash = worker.services.settings.stash
+    stash.upsert_many(stash.root_verify_key, [settings]).unwrap()
+    assert worker.get_settings() is not settings
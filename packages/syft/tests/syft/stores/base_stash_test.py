@@ -1,6 +1,7 @@
 # stdlib
 from collections.abc import Callable
 from collections.abc import Container
+from datetime import timedelta
 import random
 import threading
 from typing import Any
@@ -9,14 +10,21 @@ from typing import TypeVar
 # third party
 from faker import Faker
 import pytest
+import sqlalchemy as sa
 from typing_extensions import ParamSpec
 
 # syft absolute
+from syft.serde.json_serde import serialize_json
 from syft.serde.serializable import serializable
 from syft.server.credentials import SyftSigningKey
 from syft.server.credentials import SyftVerifyKey
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.action.action_permissions import ActionPermission
 from syft.service.queue.queue_stash import Status
 from syft.service.request.request_service import RequestService
+from syft.store.db import schema
+from syft.store.db.schema import utcnow
 from syft.store.db.sqlite import SQLiteDBConfig
 from syft.store.db.sqlite import SQLiteDBManager
 from syft.store.db.stash import ObjectStash
@@ -216,6 +224,54 @@ def test_basestash_upsert(
     assert len(base_stash.get_all(root_verify_key).unwrap()) == 2
 
 
+def test_basestash_get_all_updated_since(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker: Faker
+) -> None:
+    for obj in mock_objects:
+        base_stash.set(root_verify_key, obj).unwrap()
+
+    cursor = utcnow()
+    assert base_stash.get_all(root_verify_key, updated_since=cursor).unwrap() == []
+
+    updated_obj = mock_objects[0].copy()
+    updated_obj.name = faker.name()
+    base_stash.update(root_verify_key, updated_obj).unwrap()
+    new_obj = MockObject(**object_kwargs(faker))
+    base_stash.set(root_verify_key, new_obj).unwrap()
+    base_stash.add_permission(
+        ActionObjectREAD(
+            uid=mock_objects[1].id, credentials=SyftSigningKey.generate().verify_key
+        )
+    ).unwrap()
+
+    changed = base_stash.get_all(root_verify_key, updated_since=cursor).unwrap()
+    assert {obj.id for obj in changed} == {
+        updated_obj.id,
+        new_obj.id,
+        mock_objects[1].id,
+    }
+
+
+def test_basestash_get_deleted_since(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    for obj in mock_objects:
+        base_stash.set(root_verify_key, obj).unwrap()
+
+    base_stash.delete_by_uid(root_verify_key, mock_objects[0].id).unwrap()
+    cursor = utcnow()
+    base_stash.delete_by_uid(root_verify_key, mock_objects[1].id).unwrap()
+    base_stash.delete_by_uid(root_verify_key, mock_objects[2].id).unwrap()
+    # created again after its deletion
+    base_stash.set(root_verify_key, mock_objects[2]).unwrap()
+
+    assert base_stash.get_deleted_since(cursor).unwrap() == [mock_objects[1].id]
+    assert set(base_stash.get_deleted_since().unwrap()) == {
+        mock_objects[0].id,
+        mock_objects[1].id,
+    }
+
+
 def test_basestash_cannot_update_non_existent(
     root_verify_key, base_stash: MockStash, mock_object: MockObject, faker: Faker
 ) -> None:
@@ -447,3 +503,227 @@ def test_stash_thread_support(
 
     result = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
     assert result == mock_object
+
+
+def test_basestash_permissions_table(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    base_stash.set(root_verify_key, mock_object).unwrap()
+    guest_key = SyftSigningKey.generate().verify_key
+
+    read_permission = ActionObjectREAD(uid=mock_object.id, credentials=guest_key)
+    assert not base_stash.has_permission(read_permission)
+    assert len(base_stash.get_all(guest_key).unwrap()) == 0
+
+    base_stash.add_permission(read_permission).unwrap()
+    assert base_stash.has_permission(read_permission)
+    permissions = base_stash.get_all_permissions().unwrap()
+    assert read_permission.permission_string in permissions[mock_object.id]
+    assert base_stash.get_all(guest_key).unwrap() == [mock_object]
+
+    base_stash.remove_permission(read_permission)
+    assert not base_stash.has_permission(read_permission)
+
+    base_stash.add_permission(
+        ActionObjectPermission(mock_object.id, ActionPermission.ALL_READ)
+    ).unwrap()
+    assert base_stash.has_permission(read_permission)
+
+    base_stash.delete_by_uid(root_verify_key, mock_object.id).unwrap()
+    with base_stash.sessionmaker() as session:
+        assert session.query(base_stash.permissions_table).count() == 0
+
+
+def test_basestash_permission_without_credentials(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    base_stash.set(root_verify_key, mock_object).unwrap()
+
+    # e.g. deserialized without credentials, the permission string is just "READ"
+    permission = ActionObjectPermission(
+        mock_object.id, ActionPermission.READ, credentials=root_verify_key
+    )
+    permission.credentials = None
+    base_stash.add_permission(permission).unwrap()
+    assert base_stash.has_permission(permission)
+    permissions = base_stash.get_all_permissions().unwrap()
+    assert "READ" in permissions[mock_object.id]
+
+    base_stash.remove_permission(permission)
+    assert not base_stash.has_permission(permission)
+
+
+def test_basestash_migrate_json_permissions(
+    root_verify_key,
+    base_stash: MockStash,
+    mock_objects: list[MockObject],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # rows are migrated in several batches
+    monkeypatch.setattr(schema, "MIGRATION_BATCH_SIZE", 2)
+    guest_key = SyftSigningKey.generate().verify_key
+    read_permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_key) for obj in mock_objects
+    ]
+
+    # objects stored before the permissions table existed
+    with base_stash.sessionmaker() as session, session.begin():
+        for obj, read_permission in zip(mock_objects, read_permissions):
+            session.execute(
+                base_stash.table.insert().values(
+                    id=obj.id,
+                    fields=serialize_json(obj),
+                    permissions=[read_permission.permission_string],
+                    storage_permissions=[],
+                )
+            )
+    assert not any(base_stash.has_permission(p) for p in read_permissions)
+    updated_at_query = sa.select(base_stash.table.c.id, base_stash.table.c._updated_at)
+    with base_stash.sessionmaker() as session:
+        updated_at = dict(session.execute(updated_at_query).all())
+
+    base_stash.db.init_tables()
+    assert all(base_stash.has_permission(p) for p in read_permissions)
+    assert len(base_stash.get_all(guest_key).unwrap()) == len(mock_objects)
+    # migrated rows are not reported as changed
+    with base_stash.sessionmaker() as session:
+        assert dict(session.execute(updated_at_query).all()) == updated_at
+
+
+def test_basestash_after_write(
+    root_verify_key,
+    base_stash: MockStash,
+    mock_objects: list[MockObject],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    written: list[list[UID]] = []
+    monkeypatch.setattr(base_stash, "_after_write", written.append)
+    obj, *others = mock_objects
+
+    base_stash.set(root_verify_key, obj).unwrap()
+    assert written == [[obj.id]]
+
+    # runs once the outer transaction commits
+    with base_stash.sessionmaker() as session, session.begin():
+        base_stash.set_many(root_verify_key, others, session=session).unwrap()
+        assert len(written) == 1
+    assert written[1] == [other.id for other in others]
+
+    # and not at all when it rolls back
+    with pytest.raises(ValueError):
+        with base_stash.sessionmaker() as session, session.begin():
+            base_stash.update(root_verify_key, obj, session=session).unwrap()
+            raise ValueError()
+    assert len(written) == 2
+
+    guest_key = SyftSigningKey.generate().verify_key
+    base_stash.add_permission(ActionObjectREAD(uid=obj.id, credentials=guest_key))
+    base_stash.delete_by_uid(root_verify_key, obj.id).unwrap()
+    assert written[2:] == [[obj.id], [obj.id]]
+
+
+def test_basestash_set_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker: Faker
+) -> None:
+    result = base_stash.set_many(root_verify_key, mock_objects).unwrap()
+    assert result == mock_objects
+    assert len(base_stash.get_all(root_verify_key).unwrap()) == len(mock_objects)
+
+    # existing ids and unique fields, both stored and within the batch
+    new_obj = MockObject(**object_kwargs(faker))
+    same_name = MockObject(**object_kwargs(faker, name=new_obj.name))
+    duplicates = [mock_objects[0], new_obj, same_name]
+    with pytest.raises(StashException):
+        base_stash.set_many(root_verify_key, duplicates).unwrap()
+    assert len(base_stash.get_all(root_verify_key).unwrap()) == len(mock_objects)
+
+    result = base_stash.set_many(
+        root_verify_key, duplicates, ignore_duplicates=True
+    ).unwrap()
+    assert result == [new_obj]
+
+
+def test_basestash_set_many_concurrent_duplicates(
+    root_verify_key,
+    base_stash: MockStash,
+    mock_objects: list[MockObject],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stored, new = mock_objects[:5], mock_objects[5:]
+    base_stash.set_many(root_verify_key, stored).unwrap()
+
+    # objects stored by another writer after the uniqueness check
+    monkeypatch.setattr(base_stash, "_get_existing_uids", lambda *_, **__: set())
+    monkeypatch.setattr(base_stash, "_get_unique_conflicts", lambda *_, **__: set())
+    guest_key = SyftSigningKey.generate().verify_key
+    read_permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_key) for obj in mock_objects
+    ]
+
+    result = base_stash.set_many(
+        root_verify_key,
+        mock_objects,
+        add_permissions=read_permissions,
+        ignore_duplicates=True,
+    ).unwrap()
+    assert result == new
+    assert not any(base_stash.has_permission(p) for p in read_permissions[:5])
+    assert all(base_stash.has_permission(p) for p in read_permissions[5:])
+
+
+def test_basestash_upsert_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker: Faker
+) -> None:
+    stored, new = mock_objects[:5], mock_objects[5:]
+    base_stash.set_many(root_verify_key, stored).unwrap()
+
+    updated = [obj.copy() for obj in stored]
+    for obj in updated:
+        obj.desc = random_sentence(faker)
+
+    result = base_stash.upsert_many(root_verify_key, updated + new).unwrap()
+    assert result == updated + new
+    assert len(base_stash.get_all(root_verify_key).unwrap()) == len(mock_objects)
+
+    conflicting = MockObject(**object_kwargs(faker, name=stored[0].name))
+    with pytest.raises(StashException):
+        base_stash.upsert_many(root_verify_key, [conflicting]).unwrap()
+
+    guest_key = SyftSigningKey.generate().verify_key
+    with pytest.raises(NotFoundException):
+        base_stash.upsert_many(guest_key, updated).unwrap()
+
+
+def test_basestash_migrate_updated_at(
+    root_verify_key,
+    base_stash: MockStash,
+    mock_objects: list[MockObject],
+) -> None:
+    table = base_stash.table
+    for obj in mock_objects:
+        base_stash.set(root_verify_key, obj).unwrap()
+
+    # a table created before `_updated_at` was indexed and maintained
+    with base_stash.sessionmaker() as session, session.begin():
+        for index in table.indexes:
+            if "_updated_at" in index.columns:
+                index.drop(session.connection())
+        session.execute(sa.text(f'ALTER TABLE "{table.name}" DROP COLUMN _updated_at'))
+
+    base_stash.db.init_tables()
+
+    inspector = sa.inspect(base_stash.db.engine)
+    assert any(
+        index["column_names"] == ["_updated_at"]
+        for index in inspector.get_indexes(table.name)
+    )
+    with base_stash.sessionmaker() as session:
+        rows = session.execute(
+            sa.select(table.c._created_at, table.c._updated_at)
+        ).all()
+    assert len(rows) == len(mock_objects)
+    assert all(row._updated_at == row._created_at for row in rows)
+
+    since = min(row._created_at for row in rows) - timedelta(seconds=1)
+    updated = base_stash.get_all(root_verify_key, updated_since=since).unwrap()
+    assert len(updated) == len(mock_objects)
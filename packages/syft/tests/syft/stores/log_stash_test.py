@@ -0,0 +1,135 @@
+# third party
+import pytest
+
+# syft absolute
+from syft.server.credentials import SyftSigningKey
+from syft.service.context import AuthedServiceContext
+from syft.service.log.log import LogBuffer
+from syft.service.log.log import SyftLog
+from syft.service.log.log_stash import LogStash
+from syft.store.document_store_errors import NotFoundException
+from syft.types.uid import UID
+
+
+@pytest.fixture
+def log_stash() -> LogStash:
+    return LogStash.random()
+
+
+def test_log_stash_append(log_stash: LogStash) -> None:
+    credentials = log_stash.root_verify_key
+    log = log_stash.set(credentials, SyftLog(job_id=UID(), stdout="a")).unwrap()
+
+    seqs = [
+        log_stash.append(credentials, log.id, stdout="b").unwrap(),
+        log_stash.append(credentials, log.id, stderr="err").unwrap(),
+        log_stash.append(credentials, log.id, stdout="c").unwrap(),
+    ]
+    assert seqs == sorted(seqs)
+
+    stored = log_stash.get_by_uid(credentials, log.id).unwrap()
+    assert stored.stdout == "abc"
+    assert stored.stderr == "err"
+    assert log_stash.get_all(credentials).unwrap()[0].stdout == "abc"
+
+    with pytest.raises(NotFoundException):
+        log_stash.append(credentials, UID(), stdout="b").unwrap()
+
+    other_user = SyftSigningKey.generate().verify_key
+    with pytest.raises(NotFoundException):
+        log_stash.append(other_user, log.id, stdout="b").unwrap()
+
+
+def test_log_stash_update_compacts_chunks(log_stash: LogStash) -> None:
+    credentials = log_stash.root_verify_key
+    log = log_stash.set(credentials, SyftLog(job_id=UID())).unwrap()
+    log_stash.append(credentials, log.id, stdout="a").unwrap()
+
+    stored = log_stash.get_by_uid(credentials, log.id).unwrap()
+    # appended after the log was read, kept by the update
+    log_stash.append(credentials, log.id, stdout="b").unwrap()
+    stored.stdout += "!"
+    log_stash.update(credentials, stored).unwrap()
+
+    assert log_stash.get_by_uid(credentials, log.id).unwrap().stdout == "a!b"
+    assert len(log_stash.get_chunks(credentials, log.id).unwrap()) == 1
+
+    stored = log_stash.get_by_uid(credentials, log.id).unwrap()
+    stored.restart()
+    log_stash.update(credentials, stored).unwrap()
+    assert log_stash.get_by_uid(credentials, log.id).unwrap().stdout == ""
+    assert log_stash.get_chunks(credentials, log.id).unwrap() == []
+
+    log_stash.append(credentials, log.id, stdout="c").unwrap()
+    log_stash.delete_by_uid(credentials, log.id).unwrap()
+    assert log_stash.get_chunks(credentials, log.id, has_permission=True).unwrap() == []
+
+
+def test_log_stash_tail(log_stash: LogStash) -> None:
+    credentials = log_stash.root_verify_key
+    log = log_stash.set(credentials, SyftLog(job_id=UID(), stdout="a")).unwrap()
+    log_stash.append(credentials, log.id, stdout="b").unwrap()
+
+    stdout, stderr, seq = log_stash.tail(credentials, log.id).unwrap()
+    assert (stdout, stderr) == ("ab", "")
+
+    assert log_stash.tail(credentials, log.id, after_seq=seq).unwrap() == ("", "", seq)
+
+    log_stash.append(credentials, log.id, stdout="c", stderr="d").unwrap()
+    log_stash.append(credentials, log.id, stdout="e").unwrap()
+    stdout, stderr, next_seq = log_stash.tail(
+        credentials, log.id, after_seq=seq
+    ).unwrap()
+    assert (stdout, stderr) == ("ce", "d")
+    assert next_seq > seq
+
+
+def test_log_stash_tail_cursor_is_per_log(log_stash: LogStash) -> None:
+    credentials = log_stash.root_verify_key
+    log = log_stash.set(credentials, SyftLog(job_id=UID())).unwrap()
+    other = log_stash.set(credentials, SyftLog(job_id=UID())).unwrap()
+    last_seq = log_stash.append(credentials, log.id, stdout="a").unwrap()
+    log_stash.append(credentials, other.id, stdout="x").unwrap()
+
+    # chunks of other logs do not move the cursor
+    assert log_stash.tail(credentials, log.id).unwrap() == ("a", "", last_seq)
+
+    # after compaction the cursor restarts at 0, without returning the log again
+    log_stash.update(credentials, log_stash.get_by_uid(credentials, log.id).unwrap())
+    stdout, _, seq = log_stash.tail(credentials, log.id).unwrap()
+    assert (stdout, seq) == ("a", 0)
+    assert log_stash.tail(credentials, log.id, after_seq=seq).unwrap() == ("", "", 0)
+
+    log_stash.append(credentials, log.id, stdout="b").unwrap()
+    assert log_stash.tail(credentials, log.id, after_seq=seq).unwrap()[0] == "b"
+
+
+def test_log_buffer(worker) -> None:
+    context = AuthedServiceContext(
+        server=worker, credentials=worker.signing_key.verify_key
+    )
+    log_id = UID()
+    worker.services.log.add(context, log_id, job_id=UID())
+
+    buffer = LogBuffer(context, log_id, flush_size=4, flush_interval=60)
+    buffer.write("a")
+    buffer.write(new_err="b")
+    assert worker.services.log.get(context, log_id).stdout == ""
+
+    # reaching flush_size appends everything buffered as a single chunk
+    buffer.write("cd")
+    log = worker.services.log.get(context, log_id)
+    assert (log.stdout, log.stderr) == ("acd", "b")
+    assert (
+        len(worker.services.log.stash.get_chunks(context.credentials, log_id).unwrap())
+        == 1
+    )
+
+    buffer.write("e")
+    buffer.flush()
+    stdout, seq = worker.services.log.read(context, log_id)
+    assert stdout == "acde"
+
+    buffer.write("f")
+    buffer.flush()
+    assert worker.services.log.read(context, log_id, after_seq=seq)[0] == "f"
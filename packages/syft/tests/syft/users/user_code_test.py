@@ -11,6 +11,7 @@ import syft as sy
 from syft.client.datasite_client import DatasiteClient
 from syft.server.worker import Worker
 from syft.service.action.action_object import ActionObject
+from syft.service.code.user_code import compile_user_code
 from syft.service.request.request import Request
 from syft.service.request.request import UserCodeStatusChange
 from syft.service.response import SyftError
@@ -417,6 +418,35 @@ def test_mock_no_arguments(worker) -> None:
     assert result == 1
 
 
+def test_user_code_compiled_once(worker) -> None:
+    root_datasite_client = worker.root_client
+    root_datasite_client.register(
+        name="data-scientist",
+        email="test_user@openmined.org",
+        password="0000",
+        password_verify="0000",
+    )
+    ds_client = root_datasite_client.login(
+        email="test_user@openmined.org",
+        password="0000",
+    )
+    root_datasite_client.users.get_all()[-1].allow_mock_execution()
+
+    @sy.syft_function_single_use()
+    def compute_sum():
+        return 1
+
+    ds_client.api.services.code.request_code_execution(compute_sum)
+
+    compile_user_code.cache_clear()
+    for _ in range(3):
+        assert ds_client.api.services.code.compute_sum() == 1
+
+    cache_info = compile_user_code.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
 def test_submit_invalid_name(worker) -> None:
     client = worker.root_client
 
@@ -177,6 +177,38 @@ def test_user_delete(do_client, guest_client, ds_client, worker, root_client):
         assert exc.type == SyftException
 
 
+def test_role_cache(root_client, worker):
+    client = get_mock_client(root_client, ServiceRole.DATA_SCIENTIST)
+    role_cache = worker.db.role_cache
+
+    assert worker.get_role_for_credentials(client.verify_key) == (
+        ServiceRole.DATA_SCIENTIST
+    )
+    hits = role_cache.stats()["hits"]
+    assert worker.get_role_for_credentials(client.verify_key) == (
+        ServiceRole.DATA_SCIENTIST
+    )
+    assert role_cache.stats()["hits"] == hits + 1
+
+    # updating a user invalidates the cache
+    worker.root_client.api.services.user.update(
+        uid=client.user_id, role=ServiceRole.DATA_OWNER
+    )
+    assert worker.get_role_for_credentials(client.verify_key) == ServiceRole.DATA_OWNER
+
+    # so do bulk writes, like the ones of migrations
+    stash = worker.services.user.stash
+    user = stash.get_by_uid(stash.root_verify_key, client.user_id).unwrap()
+    user.role = ServiceRole.DATA_SCIENTIST
+    stash.upsert_many(stash.root_verify_key, [user]).unwrap()
+    assert worker.get_role_for_credentials(client.verify_key) == (
+        ServiceRole.DATA_SCIENTIST
+    )
+
+    worker.root_client.api.services.user.delete(client.user_id)
+    assert worker.get_role_for_credentials(client.verify_key) == ServiceRole.GUEST
+
+
 def test_user_update_roles(do_client, guest_client, ds_client, root_client, worker):
     # admins can update the roles of lower roles
     clients = [get_mock_client(root_client, role) for role in DO_ROLES]
@@ -11,15 +11,26 @@ from zmq import Socket
 
 # syft absolute
 import syft
+from syft.server.worker_settings import WorkerSettings
+from syft.service.context import AuthedServiceContext
 from syft.service.queue.base_queue import AbstractMessageHandler
+from syft.service.queue.base_queue import QueueProducer
+from syft.service.queue.base_queue import notify_local_producers
+from syft.service.queue.base_queue import register_local_producer
+from syft.service.queue.base_queue import unregister_local_producer
 from syft.service.queue.queue import QueueManager
+from syft.service.queue.queue import get_consumer_server
+from syft.service.queue.queue_stash import QueueItem
+from syft.service.queue.queue_stash import Status
 from syft.service.queue.zmq_client import ZMQClient
 from syft.service.queue.zmq_client import ZMQClientConfig
 from syft.service.queue.zmq_client import ZMQQueueConfig
+from syft.service.queue.zmq_common import Service
 from syft.service.queue.zmq_consumer import ZMQConsumer
 from syft.service.queue.zmq_producer import ZMQProducer
 from syft.service.response import SyftSuccess
 from syft.types.errors import SyftException
+from syft.types.uid import UID
 from syft.util.util import get_queue_address
 from syft.util.util import get_random_available_port
 
@@ -276,3 +287,123 @@ def test_zmq_client_serde():
     deser = syft.deserialize(bytes_data, from_bytes=True)
 
     assert type(deser) == type(client)
+
+
+def test_consumer_server_is_reused(worker, monkeypatch):
+    monkeypatch.setattr("syft.service.queue.queue.time.sleep", lambda _: None)
+    worker_settings = WorkerSettings.from_server(worker)
+
+    consumer_server = get_consumer_server(worker_settings)
+    assert consumer_server.id == worker.id
+    assert get_consumer_server(worker_settings) is consumer_server
+
+    stopped = []
+    monkeypatch.setattr(consumer_server, "stop", lambda: stopped.append(True))
+
+    # a change in the worker settings stops and replaces the cached server
+    worker_settings.name = token_hex(8)
+    new_consumer_server = get_consumer_server(worker_settings)
+    assert new_consumer_server is not consumer_server
+    assert stopped == [True]
+    assert get_consumer_server(worker_settings) is new_consumer_server
+
+
+def test_notify_local_producers():
+    class RecordingProducer(QueueProducer):
+        def __init__(self):
+            self.items = []
+
+        def notify(self, queue_item):
+            self.items.append(queue_item)
+
+    server_uid = UID()
+    producer = RecordingProducer()
+    register_local_producer(server_uid, producer)
+
+    notify_local_producers(server_uid, "item")
+    notify_local_producers(UID(), "other server")
+    assert producer.items == ["item"]
+
+    unregister_local_producer(server_uid, producer)
+    notify_local_producers(server_uid, "item")
+    assert producer.items == ["item"]
+
+
+def test_queue_item_is_dispatched_with_its_log(worker):
+    class RecordingProducer(QueueProducer):
+        def __init__(self):
+            self.logs = []
+
+        def notify(self, queue_item):
+            # consumers can pick the item up right away, so its log must exist
+            log = worker.services.log.stash.get_by_uid(
+                worker.verify_key, log_id
+            ).unwrap()
+            self.logs.append((queue_item.id, log.job_id))
+
+    log_id = UID()
+    queue_item = QueueItem(
+        id=UID(),
+        server_uid=worker.id,
+        syft_client_verify_key=worker.verify_key,
+        syft_server_location=worker.id,
+        job_id=UID(),
+        method="dummy_method",
+        service="dummy_service",
+        args=[],
+        kwargs={},
+        worker_pool=worker.get_worker_pool_ref_by_name(worker.verify_key),
+    )
+    producer = RecordingProducer()
+    register_local_producer(worker.id, producer)
+    try:
+        job = worker.add_queueitem_to_queue(
+            queue_item=queue_item, credentials=worker.verify_key, log_id=log_id
+        ).unwrap()
+    finally:
+        unregister_local_producer(worker.id, producer)
+
+    # handed to the producer without waiting for its sweep of the queue stash
+    assert producer.logs == [(queue_item.id, job.id)]
+
+
+def test_queue_item_is_dispatched_once(worker):
+    worker_pool = worker.get_worker_pool_ref_by_name(worker.verify_key)
+    queue_item = QueueItem(
+        id=UID(),
+        server_uid=worker.id,
+        syft_client_verify_key=worker.verify_key,
+        syft_server_location=worker.id,
+        job_id=UID(),
+        method="dummy_method",
+        service="dummy_service",
+        args=[],
+        kwargs={},
+        worker_pool=worker_pool,
+    )
+    worker.queue_stash.set_placeholder(worker.verify_key, queue_item).unwrap()
+
+    producer = ZMQProducer(
+        port=get_random_available_port(),
+        queue_name=token_hex(8),
+        queue_stash=worker.queue_stash,
+        worker_stash=worker.worker_stash,
+        context=AuthedServiceContext(server=worker, credentials=worker.verify_key),
+    )
+    try:
+        service = Service(
+            worker_pool.resolve_with_context(producer.auth_context).unwrap().name
+        )
+        producer.services[service.name] = service
+
+        # the sweep dispatches the item first, then the notified copy comes in
+        (swept,) = producer.get_items_to_queue()
+        assert producer.queue_item(swept).unwrap()
+        assert queue_item.status == Status.CREATED
+        assert producer.queue_item(queue_item).unwrap()
+    finally:
+        producer.close()
+
+    assert len(service.requests) == 1
+    stored = worker.queue_stash.get_by_uid(worker.verify_key, queue_item.id).unwrap()
+    assert stored.status == Status.PROCESSING